@@ -0,0 +1,44 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+import yt
+from yt.config import ytcfg
+from yt.frontends.boxlib.testing import fake_boxlib_plotfile
+
+# Writing the plotfile takes a while, so it is only done once per process.
+_fn = None
+
+def _plotfile():
+    # Three levels of 64^3 cells each in 1536 boxes of 8^3 cells, spread
+    # over 16 files.
+    global _fn
+    if _fn is not None:
+        return _fn
+    tmpdir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, tmpdir)
+    _fn = fake_boxlib_plotfile(
+        os.path.join(tmpdir, "plt00000"),
+        fields=("density", "temperature", "pressure", "xmom", "ymom", "zmom"),
+        domain_dimensions=64, box_size=8, num_levels=3, num_files=16)
+    return _fn
+
+class BoxlibReadSuite:
+    params = [1, 4]
+    param_names = ["boxlib_io_threads"]
+    timeout = 600.0
+
+    def setup(self, nthreads):
+        ytcfg["yt", "boxlib_io_threads"] = str(nthreads)
+        self.ds = yt.load(_plotfile())
+        self.ds.index
+
+    def time_read_one_field(self, nthreads):
+        self.ds.all_data()["boxlib", "density"]
+
+    def time_read_all_fields(self, nthreads):
+        self.ds.all_data().get_data(self.ds.field_list)
+
+    def time_read_region(self, nthreads):
+        self.ds.r[0.3:0.6, 0.3:0.6, 0.3:0.6]["boxlib", "pressure"]
@@ -0,0 +1,66 @@
+import numpy as np
+from yt.frontends.stream.api import load_amr_grids
+
+# Building the hierarchy takes most of a minute, so it is only done once per
+# process.
+_ds = None
+
+def _nested_grids_ds(grid_dim=4, root_grids=16, num_levels=4):
+    # The root level and the first refined level cover the whole domain; each
+    # level after that covers the central half of the previous one.  With the
+    # defaults this gives 102400 grids of 4^3 cells.
+    global _ds
+    if _ds is not None:
+        return _ds
+    grid_data = []
+    domain_dims = grid_dim * root_grids
+    for level in range(num_levels):
+        if level <= 1:
+            le, re = 0.0, 1.0
+        else:
+            width = 0.5**(level - 1)
+            le, re = 0.5 - width / 2, 0.5 + width / 2
+        ngrids = int(round((re - le) * domain_dims * 2**level)) // grid_dim
+        dx = (re - le) / ngrids
+        for i in range(ngrids):
+            for j in range(ngrids):
+                for k in range(ngrids):
+                    left_edge = le + dx * np.array([i, j, k])
+                    grid_data.append(dict(
+                        left_edge=left_edge, right_edge=left_edge + dx,
+                        level=level, dimensions=[grid_dim]*3,
+                        density=np.ones((grid_dim,)*3)))
+    _ds = load_amr_grids(grid_data, [domain_dims]*3)
+    _ds.index
+    return _ds
+
+class GridFastIndexSuite:
+    params = [False, True]
+    param_names = ["use_fast_index"]
+    timeout = 600.0
+
+    def setup(self, use_fast_index):
+        self.ds = _nested_grids_ds()
+
+    def _select(self, dobj, use_fast_index):
+        dobj.use_fast_index = use_fast_index
+        dobj.fcoords
+
+    def time_sphere(self, use_fast_index):
+        self._select(self.ds.sphere("c", 0.25), use_fast_index)
+
+    def time_region(self, use_fast_index):
+        self._select(self.ds.region([0.5]*3, [0.2]*3, [0.7]*3),
+                     use_fast_index)
+
+    def time_ray(self, use_fast_index):
+        self._select(self.ds.ray([0.1, 0.2, 0.3], [0.9, 0.8, 0.7]),
+                     use_fast_index)
+
+    def time_slice(self, use_fast_index):
+        self._select(self.ds.slice(2, 0.51), use_fast_index)
+
+    def time_sphere_density(self, use_fast_index):
+        sp = self.ds.sphere("c", 0.25)
+        sp.use_fast_index = use_fast_index
+        sp["density"]
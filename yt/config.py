@@ -67,6 +67,22 @@ ytcfg_defaults = dict(
     thread_field_detection = 'False',
     ignore_invalid_unit_operation_errors = 'False',
     chunk_size = '1000',
+    cache_particle_index = 'True',
+    particle_index_nprocs = '1',
+    cache_enzo_hierarchy = 'True',
+    cache_ramses_index = 'True',
+    ramses_io_threads = '1',
+    fast_grid_index = 'False',
+    selector_mask_cache_size = '64',
+    io_prefetch_chunks = '0',
+    tipsy_memmap = 'True',
+    boxlib_io_threads = '1',
+    cache_art_index = 'True',
+    cache_halo_index = 'True',
+    fits_max_slab_size = '256',
+    exodus_ii_step_block = '1',
+    http_stream_threads = '4',
+    http_stream_cache_dir = '',
     xray_data_dir = '/does/not/exist',
     supp_data_dir = '/does/not/exist',
     default_colormap = 'arbre',
@@ -334,8 +334,12 @@ class YTQuadTreeProj(YTSelectionContainer2D):
                 self._initialize_chunk(chunk, tree)
         _units_initialized = False
         with self.data_source._field_parameter_state(self.field_parameters):
+            prefetch_fields = list(fields)
+            if self.weight_field is not None:
+                prefetch_fields.append(self.weight_field)
             for chunk in parallel_objects(self.data_source.chunks(
-                                          [], "io", local_only = True)):
+                                          [], "io", local_only = True,
+                                          prefetch_fields = prefetch_fields)):
                 mylog.debug("Adding chunk (%s) to tree (%0.3e GB RAM)",
                             chunk.ires.size, get_memory_usage()/1024.)
                 if _units_initialized is False:
@@ -518,7 +518,8 @@ class YTDataContainer(object):
         df = pd.DataFrame(data)
         return df
 
-    def save_as_dataset(self, filename=None, fields=None):
+    def save_as_dataset(self, filename=None, fields=None, chunk_size=65536,
+                        compression="gzip"):
         r"""Export a data object to a reloadable yt dataset.
 
         This function will take a data object and output a dataset
@@ -526,6 +527,11 @@ class YTDataContainer(object):
         given in the ``fields`` list.  The resulting dataset can be
         reloaded as a yt dataset.
 
+        The fields of geometric data objects are saved sorted by the
+        Morton index of their positions, in chunks whose bounding boxes
+        are stored alongside them, so that data objects on the reloaded
+        dataset only read the chunks they overlap.
+
         Parameters
         ----------
         filename : str, optional
@@ -536,6 +542,13 @@ class YTDataContainer(object):
             If this is supplied, it is the list of fields to be saved to
             disk.  If not supplied, all the fields that have been queried
             will be saved.
+        chunk_size : int, optional
+            The number of elements in each chunk of the saved fields.
+            If None, the fields are saved in their original order
+            without a spatial index.  Default: 65536.
+        compression : str, optional
+            The HDF5 compression filter applied to the chunks, or None
+            for no compression.  Default: "gzip".
 
         Returns
         -------
@@ -624,8 +637,13 @@ class YTDataContainer(object):
         extra_attrs["data_type"] = "yt_data_container"
         extra_attrs["container_type"] = self._type_name
         extra_attrs["dimensionality"] = self._dimensionality
+        # Rays keep the order of their elements along the ray, and slices
+        # and projections are indexed by their image coordinates.
+        if self._type_name in ["cutting", "proj", "slice", "ray"]:
+            chunk_size = None
         save_as_dataset(self.ds, filename, data, field_types=ftypes,
-                        extra_attrs=extra_attrs)
+                        extra_attrs=extra_attrs, chunk_size=chunk_size,
+                        compression=compression)
 
         return filename
 
@@ -884,7 +902,7 @@ class YTDataContainer(object):
                 extrema=None, logs=None, units=None,
                 weight_field="cell_mass",
                 accumulation=False, fractional=False,
-                deposition='ngp'):
+                deposition='ngp', num_threads=1):
         r"""
         Create a 1, 2, or 3D profile object from this data_source.
 
@@ -894,8 +912,9 @@ class YTDataContainer(object):
 
         Parameters
         ----------
-        bin_fields : list of strings
-            List of the binning fields for profiling.
+        bin_fields : list of strings or list of lists of strings
+            List of the binning fields for profiling, or a list of such
+            lists to create several profiles in a single pass over the data.
         fields : list of strings
             The fields to be profiled.
         n_bins : int or list of ints
@@ -930,6 +949,8 @@ class YTDataContainer(object):
         deposition : Controls the type of deposition used for ParticlePhasePlots.
             Valid choices are 'ngp' and 'cic'. Default is 'ngp'. This parameter is
             ignored the if the input fields are not of particle type.
+        num_threads : The number of threads used to bin the data.  If 0, all
+            available cores are used.  Default is 1.
 
 
         Examples
@@ -949,7 +970,7 @@ class YTDataContainer(object):
         """
         p = create_profile(self, bin_fields, fields, n_bins,
                    extrema, logs, units, weight_field, accumulation,
-                   fractional, deposition)
+                   fractional, deposition, num_threads=num_threads)
         return p
 
     def mean(self, field, axis=None, weight=None):
@@ -1225,6 +1246,7 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface):
     _dimensionality = None
     _max_level = None
     _min_level = None
+    _use_fast_index = None
 
     def __init__(self, ds, field_parameters, data_source=None):
         ParallelAnalysisInterface.__init__(self)
@@ -1268,6 +1290,10 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface):
         chunk_ind = kwargs.pop("chunk_ind", None)
         if chunk_ind is not None:
             chunk_ind = ensure_list(chunk_ind)
+        # The fields can be read ahead of time for IO chunks; see the
+        # io_prefetch_chunks configuration option.
+        if chunking_style == "io":
+            kwargs.setdefault("prefetch_fields", fields)
         for ci, chunk in enumerate(self.index._chunk(self, chunking_style,
                                    **kwargs)):
             if chunk_ind is not None and ci not in chunk_ind:
@@ -1618,6 +1644,22 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface):
         self._current_chunk = None
         self._min_level = value
 
+    @property
+    def use_fast_index(self):
+        """
+        Whether cells are counted and selected with the grid tree of a patch
+        AMR index rather than grid by grid.  If this is None, the
+        ``fast_grid_index`` configuration option is used.
+        """
+        return self._use_fast_index
+
+    @use_fast_index.setter
+    def use_fast_index(self, value):
+        self.size = None
+        self.shape = None
+        self._current_chunk = None
+        self._use_fast_index = value
+
 class YTSelectionContainer0D(YTSelectionContainer):
     _spatial = False
     _dimensionality = 0
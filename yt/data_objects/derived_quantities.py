@@ -26,7 +26,7 @@ from yt.utilities.parallel_tools.parallel_analysis_interface import \
 from yt.utilities.physical_constants import \
     gravitational_constant_cgs
 from yt.utilities.physical_ratios import HUGE
-from yt.extern.six import add_metaclass
+from yt.extern.six import add_metaclass, string_types
 from yt.utilities.exceptions import \
     YTParticleTypeNotFound
 
@@ -62,29 +62,61 @@ class DerivedQuantity(ParallelAnalysisInterface):
         """Calculate results for the derived quantity"""
         # create the index if it doesn't exist yet
         self.data_source.ds.index
+        args, kwargs = self._prepare_args(*args, **kwargs)
         self.count_values(*args, **kwargs)
-        chunks = self.data_source.chunks([], chunking_style="io")
-        storage = {}
-        for sto, ds in parallel_objects(chunks, -1, storage = storage):
-            sto.result = self.process_chunk(ds, *args, **kwargs)
-        # Now storage will have everything, and will be done via pickling, so
-        # the units will be preserved.  (Credit to Nathan for this
-        # idea/implementation.)
-        values = [ [] for i in range(self.num_vals) ]
-        for key in sorted(storage):
-            for i in range(self.num_vals):
-                values[i].append(storage[key][i])
-        # These will be YTArrays
-        values = [self.data_source.ds.arr(values[i]) for i in range(self.num_vals)]
-        values = self.reduce_intermediate(values)
+        rv = _evaluate_quantities(self.data_source, [(self, args, kwargs)])
+        return self._finalize(rv[0])
+
+    def _prepare_args(self, *args, **kwargs):
+        # Turn the arguments the quantity is called with into those that
+        # count_values and process_chunk are called with.
+        return args, kwargs
+
+    def _finalize(self, values):
+        # Turn the reduced values into what the quantity returns.
         return values
 
+    def _chunk_fields(self, *args, **kwargs):
+        # The fields process_chunk reads, which can be read ahead of each
+        # chunk; see the io_prefetch_chunks configuration option.
+        return []
+
     def process_chunk(self, data, *args, **kwargs):
         raise NotImplementedError
 
     def reduce_intermediate(self, values):
         raise NotImplementedError
 
+def _evaluate_quantities(data_source, calls):
+    # Evaluate several derived quantities in a single loop over the chunks of
+    # data_source.  calls is a list of (quantity, args, kwargs) for
+    # process_chunk.  Fields are cached on the data source for the duration
+    # of each chunk, so quantities needing the same fields share their reads.
+    fields = []
+    for dq, args, kwargs in calls:
+        for field in dq._chunk_fields(*args, **kwargs):
+            if field not in fields:
+                fields.append(field)
+    chunks = data_source.chunks([], chunking_style="io",
+                                prefetch_fields=fields)
+    storage = {}
+    for sto, ds in parallel_objects(chunks, -1, storage = storage):
+        sto.result = [dq.process_chunk(ds, *args, **kwargs)
+                      for dq, args, kwargs in calls]
+    # Now storage will have everything, and will be done via pickling, so
+    # the units will be preserved.  (Credit to Nathan for this
+    # idea/implementation.)
+    rvs = []
+    for i, (dq, args, kwargs) in enumerate(calls):
+        values = [ [] for j in range(dq.num_vals) ]
+        for key in sorted(storage):
+            for j in range(dq.num_vals):
+                values[j].append(storage[key][i][j])
+        # These will be YTArrays
+        values = [data_source.ds.arr(values[j]) for j in range(dq.num_vals)]
+        rvs.append(dq.reduce_intermediate(values))
+    return rvs
+
 class DerivedQuantityCollection(object):
     def __new__(cls, data_source, *args, **kwargs):
         inst = object.__new__(cls)
@@ -103,6 +135,55 @@ class DerivedQuantityCollection(object):
     def keys(self):
         return derived_quantity_registry.keys()
 
+    def evaluate(self, quantities):
+        r"""
+        Calculate several derived quantities in a single pass over the data.
+
+        Each chunk of the data source is read once and processed by all of
+        the quantities, rather than once per quantity.
+
+        Parameters
+        ----------
+        quantities : list
+            The quantities to calculate.  Each item is either the name of a
+            quantity, or a tuple of the name, a tuple of positional
+            arguments and optionally a dict of keyword arguments.  Names
+            may be given as class names, such as ``"BulkVelocity"``, or as
+            they appear on the collection, such as ``"bulk_velocity"``.
+
+        Returns
+        -------
+        A list of the values each quantity returns, in the order requested.
+
+        Examples
+        --------
+
+        >>> ds = load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sp = ds.sphere("max", (10, "kpc"))
+        >>> (rho_min, rho_max), v_bulk, T_avg = sp.quantities.evaluate(
+        ...     [("extrema", ("density",)),
+        ...      "bulk_velocity",
+        ...      ("weighted_average_quantity", ("temperature", "cell_mass"))])
+
+        """
+        names = dict((camelcase_to_underscore(k), k) for k in self.keys())
+        self.data_source.ds.index
+        quantities_to_call = []
+        calls = []
+        for request in quantities:
+            if isinstance(request, string_types):
+                request = (request,)
+            name = request[0]
+            args = tuple(request[1]) if len(request) > 1 else ()
+            kwargs = dict(request[2]) if len(request) > 2 else {}
+            dq = self[names.get(name, name)]
+            args, kwargs = dq._prepare_args(*args, **kwargs)
+            dq.count_values(*args, **kwargs)
+            quantities_to_call.append(dq)
+            calls.append((dq, args, kwargs))
+        rvs = _evaluate_quantities(self.data_source, calls)
+        return [dq._finalize(rv) for dq, rv in zip(quantities_to_call, rvs)]
+
 class WeightedAverageQuantity(DerivedQuantity):
     r"""
     Calculates the weight average of a field or fields.
@@ -136,9 +217,13 @@ class WeightedAverageQuantity(DerivedQuantity):
         # This is a list now
         self.num_vals = len(fields) + 1
 
-    def __call__(self, fields, weight):
-        fields = ensure_list(fields)
-        rv = super(WeightedAverageQuantity, self).__call__(fields, weight)
+    def _prepare_args(self, fields, weight):
+        return (ensure_list(fields), weight), {}
+
+    def _chunk_fields(self, fields, weight):
+        return fields + [weight]
+
+    def _finalize(self, rv):
         if len(rv) == 1: rv = rv[0]
         return rv
 
@@ -173,9 +258,13 @@ class TotalQuantity(DerivedQuantity):
         # This is a list now
         self.num_vals = len(fields)
 
-    def __call__(self, fields):
-        fields = ensure_list(fields)
-        rv = super(TotalQuantity, self).__call__(fields)
+    def _prepare_args(self, fields):
+        return (ensure_list(fields),), {}
+
+    def _chunk_fields(self, fields):
+        return fields
+
+    def _finalize(self, rv):
         if len(rv) == 1: rv = rv[0]
         return rv
 
@@ -201,18 +290,21 @@ class TotalMass(TotalQuantity):
     >>> print ad.quantities.total_mass()
 
     """
-    def __call__(self):
-        self.data_source.ds.index
+    def _prepare_args(self):
         fi = self.data_source.ds.field_info
-        if ("gas", "cell_mass") in fi:
-            gas = super(TotalMass, self).__call__([('gas', 'cell_mass')])
-        else:
-            gas = self.data_source.ds.arr([0], 'g')
-        if ("all", "particle_mass") in fi:
-            part = super(TotalMass, self).__call__([('all', 'particle_mass')])
-        else:
-            part = self.data_source.ds.arr([0], 'g')
-        return self.data_source.ds.arr([gas, part])
+        self._mass_fields = [f for f in [('gas', 'cell_mass'),
+                                         ('all', 'particle_mass')]
+                             if f in fi]
+        return (self._mass_fields,), {}
+
+    def _finalize(self, rv):
+        masses = []
+        for field in [('gas', 'cell_mass'), ('all', 'particle_mass')]:
+            if field in self._mass_fields:
+                masses.append(rv[self._mass_fields.index(field)])
+            else:
+                masses.append(self.data_source.ds.arr([0], 'g'))
+        return self.data_source.ds.arr(masses)
 
 class CenterOfMass(DerivedQuantity):
     r"""
@@ -395,9 +487,13 @@ class WeightedVariance(DerivedQuantity):
         # This is a list now
         self.num_vals = 2 * len(fields) + 1
 
-    def __call__(self, fields, weight):
-        fields = ensure_list(fields)
-        rv = super(WeightedVariance, self).__call__(fields, weight)
+    def _prepare_args(self, fields, weight):
+        return (ensure_list(fields), weight), {}
+
+    def _chunk_fields(self, fields, weight):
+        return fields + [weight]
+
+    def _finalize(self, rv):
         if len(rv) == 1: rv = rv[0]
         return rv
 
@@ -537,9 +633,13 @@ class Extrema(DerivedQuantity):
     def count_values(self, fields, non_zero):
         self.num_vals = len(fields) * 2
 
-    def __call__(self, fields, non_zero = False):
-        fields = ensure_list(fields)
-        rv = super(Extrema, self).__call__(fields, non_zero)
+    def _prepare_args(self, fields, non_zero = False):
+        return (ensure_list(fields), non_zero), {}
+
+    def _chunk_fields(self, fields, non_zero):
+        return fields
+
+    def _finalize(self, rv):
         if len(rv) == 1: rv = rv[0]
         return rv
 
@@ -587,8 +687,10 @@ class SampleAtMaxFieldValues(DerivedQuantity):
         # field itself, then index, then the number of sample fields
         self.num_vals = 1 + len(sample_fields)
 
-    def __call__(self, field, sample_fields):
-        rv = super(SampleAtMaxFieldValues, self).__call__(field, sample_fields)
+    def _chunk_fields(self, field, sample_fields):
+        return [field] + list(sample_fields)
+
+    def _finalize(self, rv):
         if len(rv) == 1: rv = rv[0]
         return rv
 
@@ -628,13 +730,11 @@ class MaxLocation(SampleAtMaxFieldValues):
     >>> print ad.quantities.max_location(("gas", "density"))
 
     """
-    def __call__(self, field):
+    def _prepare_args(self, field):
         # Make sure we have an index
         self.data_source.index
         sample_fields = get_position_fields(field, self.data_source)
-        rv = super(MaxLocation, self).__call__(field, sample_fields)
-        if len(rv) == 1: rv = rv[0]
-        return rv
+        return (field, sample_fields), {}
 
 class SampleAtMinFieldValues(SampleAtMaxFieldValues):
     _sign = 1
@@ -679,13 +779,11 @@ class MinLocation(SampleAtMinFieldValues):
     >>> print ad.quantities.min_location(("gas", "density"))
 
     """
-    def __call__(self, field):
+    def _prepare_args(self, field):
         # Make sure we have an index
         self.data_source.index
         sample_fields = get_position_fields(field, self.data_source)
-        rv = super(MinLocation, self).__call__(field, sample_fields)
-        if len(rv) == 1: rv = rv[0]
-        return rv
+        return (field, sample_fields), {}
 
 class SpinParameter(DerivedQuantity):
     r"""
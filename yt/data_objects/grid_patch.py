@@ -395,14 +395,27 @@ class AMRGridPatch(YTSelectionContainer):
         if self._cache_mask and hash(selector) == self._last_selector_id:
             mask = self._last_mask
         else:
-            mask = selector.fill_mask(self)
+            # Masks for other selectors may still be held by the index.
+            cache = None
+            if self._cache_mask:
+                cache = getattr(self._index, "selector_mask_cache", None)
+            cached = None
+            if cache is not None:
+                cached = cache.get(selector, self)
+            if cached is not None:
+                mask, count = cached
+            else:
+                mask = selector.fill_mask(self)
+                if mask is None:
+                    count = 0
+                else:
+                    count = mask.sum()
+                if cache is not None:
+                    cache.add(selector, self, mask, count)
             if self._cache_mask:
                 self._last_mask = mask
             self._last_selector_id = hash(selector)
-            if mask is None:
-                self._last_count = 0
-            else:
-                self._last_count = mask.sum()
+            self._last_count = count
         return mask
 
     def select(self, selector, source, dest, offset):
@@ -86,8 +86,41 @@ class ProfileFieldAccumulator(object):
         self.used = np.zeros(size, dtype='bool')
         self.weight_values = np.zeros(size, dtype="float64")
 
+def _fill_profiles(data_source, profiles, fields):
+    # Bin fields into several profiles of the same data source in a single
+    # loop over its chunks.  Fields read for one profile stay cached on the
+    # chunk for the others, and the masks of cells within the bounds of each
+    # bin field are shared between profiles binning over the same range.
+    storages = []
+    for prof in profiles:
+        for f in fields:
+            prof.field_info[f] = data_source.ds.field_info[f]
+        storages.append(ProfileFieldAccumulator(len(fields), prof.size))
+    prefetch_fields = list(fields)
+    for prof in profiles:
+        for f in list(prof.bin_fields) + [prof.weight_field]:
+            if f is not None and f not in prefetch_fields:
+                prefetch_fields.append(f)
+    citer = data_source.chunks([], "io", prefetch_fields=prefetch_fields)
+    try:
+        for chunk in parallel_objects(citer):
+            filter_masks = {}
+            for prof, storage in zip(profiles, storages):
+                prof._filter_masks = filter_masks
+                prof._bin_chunk(chunk, fields, storage)
+    finally:
+        for prof in profiles:
+            prof._filter_masks = None
+    for prof, storage in zip(profiles, storages):
+        prof._finalize_storage(fields, storage)
+
 class ProfileND(ParallelAnalysisInterface):
     """The profile object class"""
+    _filter_masks = None
+    # The number of threads used to bin each chunk of data; 0 uses all of
+    # the available cores.
+    num_threads = 1
+
     def __init__(self, data_source, weight_field = None):
         self.data_source = data_source
         self.ds = data_source.ds
@@ -121,13 +154,7 @@ been deprecated, use profile.standard_deviation instead."""
         
         """
         fields = self.data_source._determine_fields(fields)
-        for f in fields:
-            self.field_info[f] = self.data_source.ds.field_info[f]
-        temp_storage = ProfileFieldAccumulator(len(fields), self.size)
-        citer = self.data_source.chunks([], "io")
-        for chunk in parallel_objects(citer):
-            self._bin_chunk(chunk, fields, temp_storage)
-        self._finalize_storage(fields, temp_storage)
+        _fill_profiles(self.data_source, [self], fields)
 
     def set_field_unit(self, field, new_unit):
         """Sets a new unit for the requested field
@@ -238,9 +265,16 @@ been deprecated, use profile.standard_deviation instead."""
         # cut_points is set to be everything initially, but
         # we also want to apply a filtering based on min/max
         pfilter = np.ones(bin_fields[0].shape, dtype='bool')
-        for (mi, ma), data in zip(self.bounds, bin_fields):
-            pfilter &= (data > mi)
-            pfilter &= (data < ma)
+        for field, (mi, ma), data in zip(self.bin_fields, self.bounds,
+                                         bin_fields):
+            if self._filter_masks is None:
+                pfilter &= (data > mi)
+                pfilter &= (data < ma)
+                continue
+            key = (field, float(mi), float(ma))
+            if key not in self._filter_masks:
+                self._filter_masks[key] = (data > mi) & (data < ma)
+            pfilter &= self._filter_masks[key]
         return pfilter, [data[pfilter] for data in bin_fields]
 
     def _get_data(self, chunk, fields):
@@ -499,7 +533,7 @@ class Profile1D(ProfileND):
         new_bin_profile1d(bin_ind, wdata, fdata,
                       storage.weight_values, storage.values,
                       storage.mvalues, storage.qvalues,
-                      storage.used)
+                      storage.used, num_threads=self.num_threads)
 
         # We've binned it!
 
@@ -628,7 +662,7 @@ class Profile2D(ProfileND):
         new_bin_profile2d(bin_ind_x, bin_ind_y, wdata, fdata,
                       storage.weight_values, storage.values,
                       storage.mvalues, storage.qvalues,
-                      storage.used)
+                      storage.used, num_threads=self.num_threads)
         # We've binned it!
 
     def set_x_unit(self, new_unit):
@@ -905,7 +939,7 @@ class Profile3D(ProfileND):
         new_bin_profile3d(bin_ind_x, bin_ind_y, bin_ind_z, wdata, fdata,
                       storage.weight_values, storage.values,
                       storage.mvalues, storage.qvalues,
-                      storage.used)
+                      storage.used, num_threads=self.num_threads)
         # We've binned it!
 
     @property
@@ -965,80 +999,25 @@ def sanitize_field_tuple_keys(input_dict, data_source):
         return input_dict
 
 
-def create_profile(data_source, bin_fields, fields, n_bins=64,
-                   extrema=None, logs=None, units=None,
-                   weight_field="cell_mass",
-                   accumulation=False, fractional=False,
-                   deposition='ngp', override_bins=None):
-    r"""
-    Create a 1, 2, or 3D profile object.
-
-    The dimensionality of the profile object is chosen by the number of
-    fields given in the bin_fields argument.
-
-    Parameters
-    ----------
-    data_source : YTSelectionContainer Object
-        The data object to be profiled.
-    bin_fields : list of strings
-        List of the binning fields for profiling.
-    fields : list of strings
-        The fields to be profiled.
-    n_bins : int or list of ints
-        The number of bins in each dimension.  If None, 64 bins for
-        each bin are used for each bin field.
-        Default: 64.
-    extrema : dict of min, max tuples
-        Minimum and maximum values of the bin_fields for the profiles.
-        The keys correspond to the field names. Defaults to the extrema
-        of the bin_fields of the dataset. If a units dict is provided, extrema
-        are understood to be in the units specified in the dictionary.
-    logs : dict of boolean values
-        Whether or not to log the bin_fields for the profiles.
-        The keys correspond to the field names. Defaults to the take_log
-        attribute of the field.
-    units : dict of strings
-        The units of the fields in the profiles, including the bin_fields.
-    weight_field : str or tuple field identifier
-        The weight field for computing weighted average for the profile
-        values.  If None, the profile values are sums of the data in
-        each bin. Defaults to "cell_mass".
-    accumulation : bool or list of bools
-        If True, the profile values for a bin n are the cumulative sum of
-        all the values from bin 0 to n.  If -True, the sum is reversed so
-        that the value for bin n is the cumulative sum from bin N (total bins)
-        to n.  If the profile is 2D or 3D, a list of values can be given to
-        control the summation in each dimension independently.
-        Default: False.
-    fractional : bool
-        If True the profile values are divided by the sum of all
-        the profile data such that the profile represents a probability
-        distribution function.
-    deposition : strings
-        Controls the type of deposition used for ParticlePhasePlots.
-        Valid choices are 'ngp' and 'cic'. Default is 'ngp'. This parameter is
-        ignored the if the input fields are not of particle type.
-    override_bins : dict of bins to profile plot with
-        If set, ignores n_bins and extrema settings and uses the
-        supplied bins to profile the field. If a units dict is provided,
-        bins are understood to be in the units specified in the dictionary.
-
-
-    Examples
-    --------
-
-    Create a 1d profile.  Access bin field from profile.x and field
-    data from profile[<field_name>].
-
-    >>> ds = load("DD0046/DD0046")
-    >>> ad = ds.all_data()
-    >>> profile = create_profile(ad, [("gas", "density")],
-    ...                              [("gas", "temperature"),
-    ...                               ("gas", "velocity_x")])
-    >>> print (profile.x)
-    >>> print (profile["gas", "temperature"])
-
-    """
+def _get_extrema(data_source, fields_and_logs, extrema_cache):
+    # Compute the extrema of any (field, non_zero) pairs not yet in
+    # extrema_cache in a single pass over the data.
+    missing = []
+    for f, l in fields_and_logs:
+        if (f, l) not in extrema_cache and (f, l) not in missing:
+            missing.append((f, l))
+    if len(missing) == 0:
+        return
+    rvs = data_source.quantities.evaluate(
+        [("Extrema", (f,), {"non_zero": l}) for f, l in missing])
+    extrema_cache.update(zip(missing, rvs))
+
+def _setup_profile(data_source, bin_fields, fields, n_bins, extrema, logs,
+                   units, weight_field, accumulation, fractional, deposition,
+                   override_bins, num_threads, extrema_cache):
+    # Construct an empty profile as described by the arguments to
+    # create_profile.  Extrema of the bin fields are looked up in, and added
+    # to, extrema_cache.
     bin_fields = data_source._determine_fields(bin_fields)
     fields = ensure_list(fields)
     is_pfield = [data_source.ds._get_field_info(f).particle_type
@@ -1095,6 +1074,7 @@ def create_profile(data_source, bin_fields, fields, n_bins=64,
         n_bins = [n_bins] * len(bin_fields)
     if not iterable(accumulation):
         accumulation = [accumulation] * len(bin_fields)
+    accumulation = list(accumulation)[:len(bin_fields)]
     if logs is None:
         logs = {}
     logs_list = []
@@ -1105,8 +1085,8 @@ def create_profile(data_source, bin_fields, fields, n_bins=64,
             logs_list.append(data_source.ds.field_info[bin_field].take_log)
     logs = logs_list
     if extrema is None:
-        ex = [data_source.quantities["Extrema"](f, non_zero=l)
-              for f, l in zip(bin_fields, logs)]
+        _get_extrema(data_source, zip(bin_fields, logs), extrema_cache)
+        ex = [extrema_cache[f, l].copy() for f, l in zip(bin_fields, logs)]
         # pad extrema by epsilon so cells at bin edges are not excluded
         for i, (mi, ma) in enumerate(ex):
             mi = mi - np.spacing(mi)
@@ -1203,34 +1183,38 @@ def create_profile(data_source, bin_fields, fields, n_bins=64,
     obj = cls(*args, **kwargs)
     setattr(obj, "accumulation", accumulation)
     setattr(obj, "fractional", fractional)
-    if fields is not None:
-        obj.add_fields([field for field in fields])
+    setattr(obj, "num_threads", num_threads)
+    return obj
+
+def _finalize_profile(obj, data_source, fields, units):
+    # Apply the fractional, accumulation and units options of create_profile
+    # to a filled profile.
     for field in fields:
-        if fractional:
+        if obj.fractional:
             obj.field_data[field] /= obj.field_data[field].sum()
-        for axis, acc in enumerate(accumulation):
+        for axis, acc in enumerate(obj.accumulation):
             if not acc: continue
             temp = obj.field_data[field]
             temp = np.rollaxis(temp, axis)
-            if weight_field is not None:
+            if obj.weight_field is not None:
                 temp_weight = obj.weight
                 temp_weight = np.rollaxis(temp_weight, axis)
             if acc < 0:
                 temp = temp[::-1]
-                if weight_field is not None:
+                if obj.weight_field is not None:
                     temp_weight = temp_weight[::-1]
-            if weight_field is None:
+            if obj.weight_field is None:
                 temp = temp.cumsum(axis=0)
             else:
                 temp = (temp * temp_weight).cumsum(axis=0) / \
                   temp_weight.cumsum(axis=0)
             if acc < 0:
                 temp = temp[::-1]
-                if weight_field is not None:
+                if obj.weight_field is not None:
                     temp_weight = temp_weight[::-1]
             temp = np.rollaxis(temp, axis)
             obj.field_data[field] = temp
-            if weight_field is not None:
+            if obj.weight_field is not None:
                 temp_weight = np.rollaxis(temp_weight, axis)
                 obj.weight = temp_weight
     if units is not None:
@@ -1244,4 +1228,127 @@ def create_profile(data_source, bin_fields, fields, n_bins=64,
                 obj.set_z_unit(unit)
             else:
                 obj.set_field_unit(field, unit)
-    return obj
+
+
+def create_profile(data_source, bin_fields, fields, n_bins=64,
+                   extrema=None, logs=None, units=None,
+                   weight_field="cell_mass",
+                   accumulation=False, fractional=False,
+                   deposition='ngp', override_bins=None, num_threads=1):
+    r"""
+    Create a 1, 2, or 3D profile object.
+
+    The dimensionality of the profile object is chosen by the number of
+    fields given in the bin_fields argument.  Several profiles of the same
+    data source can be created at once by giving a list of lists of bin
+    fields, in which case the data is read in a single pass and a list of
+    profiles is returned.
+
+    Parameters
+    ----------
+    data_source : YTSelectionContainer Object
+        The data object to be profiled.
+    bin_fields : list of strings or list of lists of strings
+        List of the binning fields for profiling, or a list of such lists
+        to create one profile for each.
+    fields : list of strings
+        The fields to be profiled.
+    n_bins : int or list of ints
+        The number of bins in each dimension.  If None, 64 bins for
+        each bin are used for each bin field.  When creating several
+        profiles, a list applies to the leading dimensions of each.
+        Default: 64.
+    extrema : dict of min, max tuples
+        Minimum and maximum values of the bin_fields for the profiles.
+        The keys correspond to the field names. Defaults to the extrema
+        of the bin_fields of the dataset. If a units dict is provided, extrema
+        are understood to be in the units specified in the dictionary.
+    logs : dict of boolean values
+        Whether or not to log the bin_fields for the profiles.
+        The keys correspond to the field names. Defaults to the take_log
+        attribute of the field.
+    units : dict of strings
+        The units of the fields in the profiles, including the bin_fields.
+    weight_field : str or tuple field identifier
+        The weight field for computing weighted average for the profile
+        values.  If None, the profile values are sums of the data in
+        each bin. Defaults to "cell_mass".
+    accumulation : bool or list of bools
+        If True, the profile values for a bin n are the cumulative sum of
+        all the values from bin 0 to n.  If -True, the sum is reversed so
+        that the value for bin n is the cumulative sum from bin N (total bins)
+        to n.  If the profile is 2D or 3D, a list of values can be given to
+        control the summation in each dimension independently.
+        Default: False.
+    fractional : bool
+        If True the profile values are divided by the sum of all
+        the profile data such that the profile represents a probability
+        distribution function.
+    deposition : strings
+        Controls the type of deposition used for ParticlePhasePlots.
+        Valid choices are 'ngp' and 'cic'. Default is 'ngp'. This parameter is
+        ignored the if the input fields are not of particle type.
+    override_bins : dict of bins to profile plot with
+        If set, ignores n_bins and extrema settings and uses the
+        supplied bins to profile the field. If a units dict is provided,
+        bins are understood to be in the units specified in the dictionary.
+    num_threads : int
+        The number of threads used to bin the data.  If 0, all available
+        cores are used.  Profiles of particle fields are always binned with
+        a single thread.
+        Default: 1.
+
+
+    Examples
+    --------
+
+    Create a 1d profile.  Access bin field from profile.x and field
+    data from profile[<field_name>].
+
+    >>> ds = load("DD0046/DD0046")
+    >>> ad = ds.all_data()
+    >>> profile = create_profile(ad, [("gas", "density")],
+    ...                              [("gas", "temperature"),
+    ...                               ("gas", "velocity_x")])
+    >>> print (profile.x)
+    >>> print (profile["gas", "temperature"])
+
+    Create a 1d profile and a 2d phase profile in a single pass over the
+    data.
+
+    >>> prof1d, prof2d = create_profile(
+    ...     ad, [[("gas", "density")],
+    ...          [("gas", "density"), ("gas", "temperature")]],
+    ...     [("gas", "cell_mass")], weight_field=None)
+
+    """
+    if len(bin_fields) > 0 and isinstance(bin_fields[0], list):
+        bin_fields_list = bin_fields
+    else:
+        bin_fields_list = [bin_fields]
+    fields = ensure_list(fields)
+    extrema_cache = {}
+    if extrema is None and len(bin_fields_list) > 1:
+        # Find the extrema of all the bin fields at once.
+        fields_and_logs = []
+        bf_logs = sanitize_field_tuple_keys(logs, data_source)
+        for bfs in bin_fields_list:
+            for bf in data_source._determine_fields(bfs):
+                if bf_logs is not None and bf in bf_logs:
+                    l = bf_logs[bf]
+                else:
+                    l = data_source.ds.field_info[bf].take_log
+                fields_and_logs.append((bf, l))
+        _get_extrema(data_source, fields_and_logs, extrema_cache)
+    profiles = [_setup_profile(data_source, bfs, fields, n_bins, extrema,
+                               logs, units, weight_field, accumulation,
+                               fractional, deposition, override_bins,
+                               num_threads, extrema_cache)
+                for bfs in bin_fields_list]
+    fields = data_source._determine_fields(fields)
+    _fill_profiles(data_source, profiles, fields)
+    for obj in profiles:
+        _finalize_profile(obj, data_source, fields, units)
+    if bin_fields_list is bin_fields:
+        return profiles
+    return profiles[0]
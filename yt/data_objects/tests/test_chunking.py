@@ -1,7 +1,19 @@
+import numpy as np
+import os
+import shutil
+import tempfile
+import threading
+
+from yt.config import ytcfg
+import yt
+from yt.convenience import load
+from yt.frontends.ytdata.utilities import save_as_dataset
 from yt.testing import \
     fake_random_ds, \
     assert_equal, \
-    assert_true
+    assert_rel_equal, \
+    assert_true, \
+    requires_module
 from yt.units.yt_array import \
     uconcatenate
 
@@ -54,3 +66,89 @@ def test_ds_hold():
     assert_true(dd.ds.__hash__() == ds1.__hash__())
     assert_true(dd.index is ds1.index)
     assert_equal(dd["ones"].size, 64**3)
+
+def test_io_prefetch():
+    fields = ("density", "velocity_x", "velocity_y", "velocity_z")
+    units = ("g/cm**3", "cm/s", "cm/s", "cm/s")
+    ds = fake_random_ds(32, nprocs = 8, fields = fields, units = units)
+    sp = ds.sphere("c", 0.3)
+    request = ["density", "velocity_magnitude"]
+    ref = []
+    for chunk in sp.chunks(request, "io", chunk_sizing = "just_one",
+                           prefetch = 0):
+        ref.append([chunk[f].copy() for f in request])
+    assert_true(len(ref) > 1)
+    for depth in (1, 3):
+        values = []
+        for chunk in sp.chunks(request, "io", chunk_sizing = "just_one",
+                               prefetch = depth):
+            assert_true(chunk._current_chunk._prefetched is not None)
+            values.append([chunk[f].copy() for f in request])
+        assert_equal(len(values), len(ref))
+        for v1, v2 in zip(values, ref):
+            for a1, a2 in zip(v1, v2):
+                assert_equal(a1, a2)
+    # Stopping early shuts down the reading thread.
+    for chunk in sp.chunks(request, "io", chunk_sizing = "just_one",
+                           prefetch = 1):
+        break
+
+def test_io_prefetch_analysis():
+    # Derived quantities, profiles and projections read their fields ahead
+    # of each chunk when io_prefetch_chunks is set.
+    fields = ("density", "velocity_x")
+    units = ("g/cm**3", "cm/s")
+    ds = fake_random_ds(32, nprocs = 8, fields = fields, units = units)
+    sp = ds.sphere("c", 0.3)
+
+    def _analyze():
+        extrema = sp.quantities.extrema("density")
+        vx = sp.quantities.weighted_average_quantity("velocity_x",
+                                                     "cell_mass")
+        prof = yt.create_profile(sp, "density", "velocity_x",
+                                 weight_field = "cell_mass")
+        proj = ds.proj("density", 0, weight_field = "velocity_x",
+                       data_source = sp)
+        return [extrema, vx, prof["velocity_x"], proj["density"]]
+
+    io = ds.index.io
+    read_fluid_selection = io._read_fluid_selection
+    readers = []
+    def _read_fluid_selection(chunks, selector, fields, size):
+        readers.append(threading.current_thread().name)
+        return read_fluid_selection(chunks, selector, fields, size)
+    io._read_fluid_selection = _read_fluid_selection
+
+    old = ytcfg.get("yt", "io_prefetch_chunks")
+    try:
+        ytcfg["yt", "io_prefetch_chunks"] = "0"
+        ref = _analyze()
+        assert_true(len(readers) > 0)
+        assert_true("yt-io-prefetch" not in readers)
+        readers[:] = []
+        ytcfg["yt", "io_prefetch_chunks"] = "2"
+        values = _analyze()
+        assert_true(len(readers) > 0)
+        assert_equal(set(readers), set(["yt-io-prefetch"]))
+    finally:
+        ytcfg["yt", "io_prefetch_chunks"] = old
+    for v1, v2 in zip(values, ref):
+        assert_rel_equal(v1, v2, 12)
+
+@requires_module("h5py")
+def test_io_prefetch_nonspatial():
+    # Indexes that read fluid fields their own way, like that of
+    # non-spatial data, do not prefetch, but can still be asked to.
+    tmpdir = tempfile.mkdtemp()
+    try:
+        ds = fake_random_ds(16)
+        fn = os.path.join(tmpdir, "array_data.h5")
+        density = ds.arr(np.random.random(100), "g/cm**3")
+        save_as_dataset(ds, fn, {"density": density})
+        array_ds = load(fn)
+        assert_true(not array_ds.index._can_prefetch)
+        for chunk in array_ds.data.chunks(["density"], "io", prefetch = 2):
+            assert_true(chunk._current_chunk._prefetched is None)
+            assert_equal(chunk["density"], density)
+    finally:
+        shutil.rmtree(tmpdir)
@@ -148,3 +148,31 @@ def test_derived_quantities_with_particle_types():
     #Check spin parameter values
     assert_almost_equal(ad.quantities.spin_parameter(use_gas=False,use_particles=True),655.7311454765503)
     assert_almost_equal(ad.quantities.spin_parameter(use_gas=False,use_particles=True,particle_type='low_x'),1309.164886405665)
+
+def test_fused_evaluation():
+    for nprocs in [1, 2, 4, 8]:
+        ds = fake_random_ds(16, nprocs = nprocs,
+            fields = ("density", "temperature", "velocity_x", "velocity_y",
+                      "velocity_z"),
+            units = ("g/cm**3", "K", "cm/s", "cm/s", "cm/s"))
+        for ad in [ds.all_data(), ds.sphere("c", (0.25, 'unitary'))]:
+            q = ad.quantities
+            rvs = q.evaluate([
+                ("Extrema", ("density",)),
+                ("weighted_average_quantity", (["density", "temperature"],
+                                               "cell_mass")),
+                ("total_quantity", ("cell_mass",)),
+                "TotalMass",
+                ("max_location", ("density",)),
+                ("bulk_velocity", (), {"use_particles": False})])
+            expected = [
+                q.extrema("density"),
+                q.weighted_average_quantity(["density", "temperature"],
+                                            "cell_mass"),
+                q.total_quantity("cell_mass"),
+                q.total_mass(),
+                q.max_location("density"),
+                q.bulk_velocity(use_particles=False)]
+            assert_equal(len(rvs), len(expected))
+            for rv, ex in zip(rvs, expected):
+                assert_rel_equal(np.array(rv), np.array(ex), 12)
@@ -396,3 +396,47 @@ def test_index_field_units():
                       weight_field=None)
     assert str(prof['index', 'cell_volume'].units) == 'code_length**3'
     assert str(prof['gas', 'cell_volume'].units) == 'cm**3'
+
+def test_fused_profiles():
+    ds = fake_random_ds(32, nprocs = 8, fields = _fields, units = _units)
+    for dobj in [ds.all_data(), ds.sphere("c", 0.3)]:
+        bin_fields_list = [["density"],
+                           ["density", "temperature"],
+                           ["temperature", "dinosaurs", "density"]]
+        for weight_field in [None, "cell_mass"]:
+            kwargs = dict(n_bins=[8, 4, 2], weight_field=weight_field,
+                          accumulation=[True, False, False])
+            profiles = create_profile(dobj, bin_fields_list,
+                                      ["tribbles", "cell_mass"], **kwargs)
+            assert_equal(len(profiles), 3)
+            for bin_fields, prof in zip(bin_fields_list, profiles):
+                ref = create_profile(dobj, bin_fields,
+                                     ["tribbles", "cell_mass"], **kwargs)
+                assert_equal(prof.__class__, ref.__class__)
+                assert_equal(prof.x_bins, ref.x_bins)
+                assert_equal(prof.used, ref.used)
+                assert_equal(prof.weight, ref.weight)
+                for field in ["tribbles", "cell_mass"]:
+                    assert_equal(prof[field], ref[field])
+
+def test_threaded_profiles():
+    ds = fake_random_ds(32, nprocs = 4, fields = _fields, units = _units)
+    ad = ds.all_data()
+    for bin_fields in [["density"], ["density", "temperature"],
+                       ["density", "temperature", "dinosaurs"]]:
+        for weight_field in [None, "cell_mass"]:
+            ref = create_profile(ad, bin_fields, ["tribbles", "cell_mass"],
+                                 n_bins=4, weight_field=weight_field)
+            for num_threads in [0, 4]:
+                prof = create_profile(ad, bin_fields,
+                                      ["tribbles", "cell_mass"], n_bins=4,
+                                      weight_field=weight_field,
+                                      num_threads=num_threads)
+                assert_equal(prof.used, ref.used)
+                assert_rel_equal(prof.weight, ref.weight.copy(), 12)
+                for field in ["tribbles", "cell_mass"]:
+                    assert_rel_equal(prof[field], ref[field], 12)
+                if weight_field is not None:
+                    field = prof.field_map["tribbles"]
+                    assert_rel_equal(prof.standard_deviation[field],
+                                     ref.standard_deviation[field].copy(), 10)
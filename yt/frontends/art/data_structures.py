@@ -16,6 +16,7 @@ import stat
 import struct
 import weakref
 
+from yt.config import ytcfg
 from yt.geometry.oct_geometry_handler import \
     OctreeIndex
 from yt.geometry.geometry_handler import \
@@ -43,6 +44,8 @@ from yt.data_objects.particle_unions import \
     ParticleUnion
 from yt.geometry.particle_geometry_handler import \
     ParticleIndex
+from yt.utilities.index_cache import \
+    file_stats, load_index_cache, save_index_cache
 
 import yt.utilities.fortran_utils as fpu
 from yt.frontends.art.io import \
@@ -62,6 +65,11 @@ class ARTIndex(OctreeIndex):
         self.directory = os.path.dirname(self.index_filename)
         self.max_level = ds.max_level
         self.float_type = np.float64
+        # The oct layout of the AMR file is cached next to it, so that
+        # reloading the dataset does not have to walk the file again.
+        self.index_cache_filename = None
+        if ytcfg.getboolean("yt", "cache_art_index"):
+            self.index_cache_filename = "%s.npz" % self.dataset._file_amr
         super(ARTIndex, self).__init__(ds, dataset_type)
 
     def get_smallest_dx(self):
@@ -87,16 +95,37 @@ class ARTIndex(OctreeIndex):
         # The 1 here refers to domain_id == 1 always for ARTIO.
         self.domains = [ARTDomainFile(self.dataset, nv, 
                                       self.oct_handler, 1)]
+        domain = self.domains[0]
+        cache = load_index_cache(self.index_cache_filename,
+                                 self._index_cache_key())
+        if cache is not None:
+            mylog.info("Loading oct layout from %s",
+                       self.index_cache_filename)
+            domain._load_index_cache(cache)
         self.octs_per_domain = [dom.level_count.sum() for dom in
         self.domains]
         
         self.total_octs = sum(self.octs_per_domain)
         mylog.debug("Allocating %s octs", self.total_octs)
         self.oct_handler.allocate_domains(self.octs_per_domain)
-        domain = self.domains[0]
         domain._read_amr_root(self.oct_handler)
         domain._read_amr_level(self.oct_handler)
         self.oct_handler.finalize()
+        if cache is None and self.index_cache_filename is not None:
+            save_index_cache(self.index_cache_filename,
+                             self._index_cache_key(),
+                             domain._index_cache_entries())
+
+    _index_cache_version = 1
+
+    def _index_cache_key(self):
+        key = dict(version = np.array(self._index_cache_version),
+                   domain_dimensions = np.array(self.ds.domain_dimensions),
+                   min_level = np.array(self.ds.min_level),
+                   max_level = np.array(self.ds.max_level),
+                   root_level = np.array(self.ds.root_level))
+        key.update(file_stats([self.ds._file_amr]))
+        return key
 
     def _detect_output_fields(self):
         self.particle_field_list = [f for f in particle_fields]
@@ -702,18 +731,15 @@ class ARTDomainSubset(OctreeSubset):
             tr[field] = np.zeros(cell_count, 'float64')
         data = _read_root_level(content, self.domain.level_child_offsets,
                                 self.domain.level_count)
-        ns = (self.domain.ds.domain_dimensions.prod() // 8, 8)
+        nx, ny, nz = self.domain.ds.domain_dimensions
         for field, fi in zip(fields, field_idxs):
-            source[field] = np.empty(ns, dtype="float64", order="C")
-            dt = data[fi,:].reshape(self.domain.ds.domain_dimensions,
-                                    order="F")
-            for i in range(2):
-                for j in range(2):
-                    for k in range(2):
-                        ii = ((k*2)+j)*2+i
-                        # Note: C order because our index converts C to F.
-                        source[field][:,ii] = \
-                            dt[i::2,j::2,k::2].ravel(order="C")
+            dt = data[fi,:].reshape((nx, ny, nz), order="F")
+            # Split each axis into (oct, child) and order the octs in C order
+            # (our index converts C to F) with the children as k, j, i.
+            dt = dt.reshape((nx // 2, 2, ny // 2, 2, nz // 2, 2))
+            source[field] = np.ascontiguousarray(
+                dt.transpose((0, 2, 4, 5, 3, 1)).reshape((-1, 8)),
+                dtype="float64")
         oct_handler.fill_level(0, levels, cell_inds, file_inds, tr, source)
         del source
         # Now we continue with the additional levels.
@@ -748,6 +774,8 @@ class ARTDomainFile(object):
         self._level_count = None
         self._level_oct_offsets = None
         self._level_child_offsets = None
+        self._level_info = {}
+        self._from_index_cache = False
         self.oct_handler = oct_handler
 
     @property
@@ -824,6 +852,46 @@ class ARTDomainFile(object):
         return nhydrovars, iNOLL, level_oct_offsets, level_child_offsets
 
 
+    def level_info(self, level):
+        """
+        Return the unitary centers of the octs on *level* and their indices,
+        decoding them from the oct records of the AMR file the first time
+        they are asked for.
+        """
+        if level not in self._level_info:
+            with open(self.ds._file_amr, "rb") as f:
+                unitary_center, fl, iocts, nocts, root_level = \
+                    _read_art_level_info(f,
+                        self.level_offsets, level,
+                        coarse_grid=self.ds.domain_dimensions[0],
+                        root_level=self.ds.root_level)
+            self._level_info[level] = (unitary_center, iocts)
+        return self._level_info[level]
+
+    def _load_index_cache(self, cache):
+        self.nhydrovars = int(cache["nhydrovars"])
+        self.inoll = self._level_count = cache["level_count"]
+        self._level_oct_offsets = [int(o) for o in cache["oct_offsets"]]
+        self._level_child_offsets = [int(o) for o in cache["child_offsets"]]
+        for level in range(1, self.ds.max_level + 1):
+            self._level_info[level] = (cache["unitary_center_%02i" % level],
+                                       cache["iocts_%02i" % level])
+        self._from_index_cache = True
+
+    def _index_cache_entries(self):
+        self.level_offsets
+        data = dict(nhydrovars = np.array(self.nhydrovars),
+                    level_count = self._level_count,
+                    oct_offsets = np.array(self._level_oct_offsets,
+                                           dtype="int64"),
+                    child_offsets = np.array(self._level_child_offsets,
+                                             dtype="int64"))
+        for level in range(1, self.ds.max_level + 1):
+            unitary_center, iocts = self.level_info(level)
+            data["unitary_center_%02i" % level] = unitary_center
+            data["iocts_%02i" % level] = iocts
+        return data
+
     def _read_amr_level(self, oct_handler):
         """Open the oct file, read in octs level-by-level.
            For each oct, only the position, index, level and domain
@@ -831,14 +899,9 @@ class ARTDomainFile(object):
            The most important is finding all the information to feed
            oct_handler.add
         """
-        self.level_offsets
-        f = open(self.ds._file_amr, "rb")
         for level in range(1, self.ds.max_level + 1):
-            unitary_center, fl, iocts, nocts, root_level = \
-                _read_art_level_info( f,
-                    self._level_oct_offsets, level,
-                    coarse_grid=self.ds.domain_dimensions[0],
-                    root_level=self.ds.root_level)
+            unitary_center, iocts = self.level_info(level)
+            nocts = unitary_center.shape[0]
             nocts_check = oct_handler.add(self.domain_id, level,
                                           unitary_center)
             assert(nocts_check == nocts)
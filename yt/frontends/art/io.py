@@ -521,9 +521,9 @@ def _read_child_level(
     # contiguous 8-cell sections are for the same oct;
     # ie, we don't write out just the 0 cells, then the 1 cells
     # optionally, we only read noct_range to save memory
-    left_index, fl, octs, nocts, root_level = _read_art_level_info(f,
-                                                                   level_oct_offsets, level, coarse_grid=domain_dimensions[0])
     if noct_range is None:
+        left_index, fl, octs, nocts, root_level = _read_art_level_info(f,
+            level_oct_offsets, level, coarse_grid=domain_dimensions[0])
         nocts = level_info[level]
         ncells = nocts*8
         f.seek(level_child_offsets[level])
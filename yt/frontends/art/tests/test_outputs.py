@@ -14,6 +14,12 @@ ART frontend tests using D9p a=0.500
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
+from yt.config import ytcfg
+from yt.convenience import load
 from yt.testing import \
     requires_file, \
     assert_equal, \
@@ -117,3 +123,31 @@ def test_ARTDataset():
 @requires_file(d9p)
 def test_units_override():
     units_override_check(d9p)
+
+
+@requires_file(d9p)
+def test_index_cache():
+    # Work on a copy without any cache other tests have written into the
+    # test data, so the first load has to build it.
+    tmpdir = tempfile.mkdtemp()
+    try:
+        dirname = os.path.join(tmpdir, "D9p_500")
+        shutil.copytree(os.path.join(ytcfg.get("yt", "test_data_dir"),
+                                     os.path.dirname(d9p)), dirname,
+                        ignore=shutil.ignore_patterns("*.npz"))
+        fn = os.path.join(dirname, os.path.basename(d9p))
+        ds1 = load(fn)
+        index1 = ds1.index
+        assert os.path.isfile(index1.index_cache_filename)
+        assert not index1.domains[0]._from_index_cache
+        ds2 = load(fn)
+        index2 = ds2.index
+        assert index2.domains[0]._from_index_cache
+        dom1, dom2 = index1.domains[0], index2.domains[0]
+        assert_equal(dom1.level_count, dom2.level_count)
+        assert_equal(dom1.level_child_offsets, dom2.level_child_offsets)
+        ad1, ad2 = ds1.all_data(), ds2.all_data()
+        for field in [("gas", "density"), ("index", "x")]:
+            assert_equal(ad1[field], ad2[field])
+    finally:
+        shutil.rmtree(tmpdir)
@@ -152,6 +152,9 @@ class AthenaHierarchy(GridIndex):
         self.dataset_type = dataset_type
         # for now, the index file is the dataset!
         self.index_filename = os.path.join(os.getcwd(), self.dataset.filename)
+        # The offsets of the data tables of each grid file, filled in by the
+        # IO handler as the files are read.
+        self._read_table_offsets = {}
         self._fhandle = open(self.index_filename,'rb')
         GridIndex.__init__(self, ds, dataset_type)
 
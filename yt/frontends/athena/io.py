@@ -41,16 +41,24 @@ class IOHandlerAthena(BaseIOHandler):
     def _read_chunk_data(self,chunk,fields):
         data = {}
         if len(chunk.objs) == 0: return data
+        # Grids split from the same file share a single mapping of it.
+        mmaps = {}
         for grid in chunk.objs:
             if grid.filename is None:
                 continue
-            f = open(grid.filename, "rb")
+            if grid.filename not in mmaps:
+                mmaps[grid.filename] = np.memmap(grid.filename, dtype="u1",
+                                                 mode="r")
+            mm = mmaps[grid.filename]
             data[grid.id] = {}
             grid_dims = grid.ActiveDimensions
             read_dims = grid.read_dims.astype("int64")
             grid_ncells = np.prod(read_dims)
             grid0_ncells = np.prod(grid.index.grids[0].read_dims)
-            read_table_offset = get_read_table_offset(f)
+            read_table_offset = self._get_read_table_offset(grid)
+            # The interleaved components of each vector field, keyed by the
+            # offset of the field in the file.
+            vectors = {}
             for field in fields:
                 ftype, offsetr, dtype = grid.index._field_map[field]
                 if grid_ncells != grid0_ncells:
@@ -61,26 +69,37 @@ class IOHandlerAthena(BaseIOHandler):
                 file_offset = grid.file_offset[2]*read_dims[0]*read_dims[1]*float_size[dtype]
                 xread = slice(grid.file_offset[0],grid.file_offset[0]+grid_dims[0])
                 yread = slice(grid.file_offset[1],grid.file_offset[1]+grid_dims[1])
-                f.seek(read_table_offset+offset+file_offset)
                 if dtype == 'float':
                     dt = '>f4'
                 elif dtype == 'double':
                     dt = '>f8'
                 if ftype == 'scalar':
-                    f.seek(read_table_offset+offset+file_offset)
-                    v = np.fromfile(f, dtype=dt,
-                                    count=grid_ncells).reshape(read_dims,order='F')
+                    v = np.ndarray(grid_ncells, dtype=dt, buffer=mm,
+                                   offset=read_table_offset+offset+file_offset)
+                    v = v.reshape(read_dims,order='F')
                 if ftype == 'vector':
+                    # All components are taken from one view of the block, so
+                    # it is only read once however many of them are wanted.
+                    if offset not in vectors:
+                        vectors[offset] = np.ndarray(
+                            (grid_ncells, 3), dtype=dt, buffer=mm,
+                            offset=read_table_offset+offset+3*file_offset)
                     vec_offset = axis_list.index(field[-1][-2:])
-                    f.seek(read_table_offset+offset+3*file_offset)
-                    v = np.fromfile(f, dtype=dt, count=3*grid_ncells)
-                    v = v[vec_offset::3].reshape(read_dims,order='F')
+                    v = vectors[offset][:, vec_offset].reshape(read_dims,order='F')
                 if grid.ds.field_ordering == 1:
                     data[grid.id][field] = v[xread,yread,:].T.astype("float64")
                 else:
                     data[grid.id][field] = v[xread,yread,:].astype("float64")
-            f.close()
         return data
+
+    def _get_read_table_offset(self, grid):
+        # Scanning the ASCII header is only done once per file, as the index
+        # keeps the offsets for every subsequent read.
+        offsets = grid.index._read_table_offsets
+        if grid.filename not in offsets:
+            with open(grid.filename, "rb") as f:
+                offsets[grid.filename] = get_read_table_offset(f)
+        return offsets[grid.filename]
     
     def _read_data_slice(self, grid, field, axis, coord):
         sl = [slice(None), slice(None), slice(None)]
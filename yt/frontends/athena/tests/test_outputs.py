@@ -13,6 +13,12 @@ Athena frontend tests
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
 from yt.testing import \
     assert_equal, \
     requires_file, \
@@ -113,3 +119,43 @@ def test_nprocs():
 @requires_file(cloud)
 def test_AthenaDataset():
     assert isinstance(data_dir_load(cloud), AthenaDataset)
+
+
+def _write_fake_vtk(filename, density, momentum):
+    n = density.shape
+    with open(filename, "wb") as f:
+        f.write(b"# vtk DataFile Version 3.0\n")
+        f.write(b"CONSERVED vars at time= 0.0, level= 0, domain= 0\n")
+        f.write(b"BINARY\nDATASET STRUCTURED_POINTS\n")
+        f.write(("DIMENSIONS %d %d %d\n" % tuple(i + 1 for i in n)).encode())
+        f.write(("ORIGIN 0 0 0\nSPACING %f %f %f\n" %
+                 tuple(1.0 / i for i in n)).encode())
+        f.write(("CELL_DATA %d\n" % density.size).encode())
+        f.write(b"SCALARS density float\nLOOKUP_TABLE default\n")
+        f.write(density.T.astype(">f4").tobytes())
+        f.write(b"\nVECTORS momentum float\n")
+        f.write(momentum.transpose(2, 1, 0, 3).astype(">f4").tobytes())
+        f.write(b"\n")
+
+@disable_dataset_cache
+def test_read_vtk():
+    tmpdir = tempfile.mkdtemp()
+    fn = os.path.join(tmpdir, "fake.0000.vtk")
+    np.random.seed(0x4d3d3d3)
+    density = np.random.random((16, 16, 16)).astype("float32")
+    momentum = np.random.random((16, 16, 16, 3)).astype("float32")
+    _write_fake_vtk(fn, density, momentum)
+    try:
+        for nprocs in [1, 8]:
+            ds = load(fn, nprocs=nprocs)
+            ad = ds.all_data()
+            fields = [("athena", "momentum_%s" % ax) for ax in "xyz"]
+            ad.get_data([("athena", "density")] + fields)
+            icoords = ad.icoords
+            assert_equal(ad["athena", "density"].d, density[tuple(icoords.T)])
+            for i, field in enumerate(fields):
+                assert_equal(ad[field].d, momentum[..., i][tuple(icoords.T)])
+            # Each file's table offset was only scanned for once.
+            assert_equal(list(ds.index._read_table_offsets), [fn])
+    finally:
+        shutil.rmtree(tmpdir)
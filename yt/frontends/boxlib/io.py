@@ -16,7 +16,9 @@ AMReX/Boxlib data-file handling functions
 import os
 import numpy as np
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
+from yt.config import ytcfg
 from yt.utilities.io_handler import \
     BaseIOHandler
 from yt.funcs import mylog
@@ -29,9 +31,93 @@ def _remove_raw(all_fields, raw_fields):
         centered_fields.discard(raw)
     return list(centered_fields)
 
+def _read_fabs(filename, fabs, max_gap, max_size, header_size=1024):
+    """
+    Read components of several FABs from a single file in as few sequential
+    reads as possible.
+
+    Each FAB is given as a tuple ``(key, base_offset, data_offset, dtype,
+    shape, components)``, where ``base_offset`` is the position of its header
+    line, ``data_offset`` the position of its data (or -1 if the header has
+    not been read yet) and ``components`` the indices of the components to
+    return.  The FABs are sorted by offset and neighbours less than
+    ``max_gap`` bytes apart are read together, in pieces of at most
+    ``max_size`` bytes.  Returns a dict mapping each key to its data offset
+    and the list of arrays of its requested components.
+    """
+    ranges = []
+    for fab in sorted(fabs, key=lambda a: a[1]):
+        key, base_offset, data_offset, dtype, shape, components = fab
+        nbytes = dtype.itemsize * int(np.prod(shape))
+        if data_offset == -1:
+            # The header line has to be read too, and we only know an
+            # upper bound for its length.
+            start = base_offset
+            end = base_offset + header_size
+        else:
+            start = data_offset + min(components) * nbytes
+            end = data_offset
+        end += (max(components) + 1) * nbytes
+        ranges.append((start, end, fab))
+    runs = []
+    for start, end, fab in ranges:
+        if len(runs) > 0 and start - runs[-1][1] <= max_gap \
+           and end - runs[-1][0] <= max_size:
+            runs[-1][1] = max(runs[-1][1], end)
+            runs[-1][2].append(fab)
+        else:
+            runs.append([start, end, [fab]])
+    rv = {}
+    with open(filename, "rb") as f:
+        for run_start, run_end, run_fabs in runs:
+            f.seek(run_start)
+            buf = f.read(run_end - run_start)
+            for key, base_offset, data_offset, dtype, shape, components \
+                    in run_fabs:
+                if data_offset == -1:
+                    nl = buf.find(b"\n", base_offset - run_start)
+                    if nl == -1:
+                        f.seek(base_offset)
+                        f.readline()
+                        data_offset = f.tell()
+                    else:
+                        data_offset = run_start + nl + 1
+                count = int(np.prod(shape))
+                nbytes = dtype.itemsize * count
+                arrs = []
+                for c in components:
+                    pos = data_offset - run_start + c * nbytes
+                    if pos + nbytes <= len(buf):
+                        # Copying out of the buffer lets it be freed as
+                        # soon as the run is done.
+                        v = np.frombuffer(buf, dtype=dtype, count=count,
+                                          offset=pos).copy()
+                    else:
+                        f.seek(run_start + pos)
+                        v = np.fromfile(f, dtype=dtype, count=count)
+                    arrs.append(v.reshape(shape, order='F'))
+                rv[key] = (data_offset, arrs)
+    return rv
+
+def _map_files(func, filenames):
+    # Reads of separate files are spread over boxlib_io_threads threads.
+    nthreads = min(ytcfg.getint("yt", "boxlib_io_threads"), len(filenames))
+    if nthreads <= 1:
+        return [func(fn) for fn in filenames]
+    pool = ThreadPool(nthreads)
+    try:
+        return pool.map(func, filenames)
+    finally:
+        pool.close()
+        pool.join()
+
 class IOHandlerBoxlib(BaseIOHandler):
 
     _dataset_type = "boxlib_native"
+    # FABs less than _max_gap bytes apart in a file are read with a single
+    # read of at most _max_read_size bytes.
+    _max_gap = 1024**2
+    _max_read_size = 64 * 1024**2
 
     def __init__(self, ds, *args, **kwargs):
         super(IOHandlerBoxlib, self).__init__(ds)
@@ -57,39 +143,43 @@ class IOHandlerBoxlib(BaseIOHandler):
         ind = 0
         for chunk in chunks:
             data = self._read_chunk_data(chunk, centered_fields)
+            if len(raw_fields) > 0:
+                raw_data = self._read_raw_chunk_data(chunk, raw_fields)
             for g in chunk.objs:
                 for field in fields:
                     if field in centered_fields:
                         ds = data[g.id].pop(field)
                     else:
-                        ds = self._read_raw_field(g, field)
+                        ds = raw_data[g.id].pop(field)
                     nd = g.select(selector, ds, rv[field], ind)
                 ind += nd
                 data.pop(g.id)
         return rv
 
-    def _read_raw_field(self, grid, field):
-        field_name = field[1]
+    def _read_raw_chunk_data(self, chunk, fields):
+        # Each raw field of a grid is a single-component FAB in a file of
+        # its own directory, whose header line has to be skipped.
+        data = defaultdict(dict)
         base_dir = self.ds.index.raw_file
-
-        box_list = self.ds.index.raw_field_map[field_name][0]
-        fn_list = self.ds.index.raw_field_map[field_name][1]
-        offset_list = self.ds.index.raw_field_map[field_name][2]
-
-        lev = grid.Level        
-        filename = base_dir + "Level_%d/" % lev + fn_list[grid.id]
-        offset = offset_list[grid.id]
-        box = box_list[grid.id]
-        
-        lo = box[0]
-        hi = box[1]
-        shape = hi - lo + 1
-        with open(filename, "rb") as f:
-            f.seek(offset)
-            f.readline()  # always skip the first line
-            arr = np.fromfile(f, 'float64', np.product(shape))
-            arr = arr.reshape(shape, order='F')
-        return arr
+        fabs_by_file = defaultdict(list)
+        dtype = np.dtype('float64')
+        for field in fields:
+            box_list, fn_list, offset_list = \
+                self.ds.index.raw_field_map[field[1]]
+            for g in chunk.objs:
+                filename = base_dir + "Level_%d/" % g.Level + fn_list[g.id]
+                box = box_list[g.id]
+                fabs_by_file[filename].append(
+                    ((g.id, field), offset_list[g.id], -1, dtype,
+                     box[1] - box[0] + 1, [0]))
+        filenames = list(fabs_by_file)
+        def read_file(filename):
+            return _read_fabs(filename, fabs_by_file[filename],
+                              self._max_gap, self._max_read_size)
+        for fabs in _map_files(read_file, filenames):
+            for (grid_id, field), (data_offset, arrs) in fabs.items():
+                data[grid_id][field] = arrs[0]
+        return data
 
     def _read_chunk_data(self, chunk, fields):
         data = {}
@@ -100,26 +190,27 @@ class IOHandlerBoxlib(BaseIOHandler):
                 continue
             grids_by_file[g.filename].append(g)
         dtype = self.ds.index._dtype
-        bpr = dtype.itemsize
-        for filename in grids_by_file:
-            grids = grids_by_file[filename]
-            grids.sort(key = lambda a: a._offset)
-            f = open(filename, "rb")
-            for grid in grids:
-                data[grid.id] = {}
-                local_offset = grid._get_offset(f) - f.tell()
-                count = grid.ActiveDimensions.prod()
-                size = count * bpr
-                for field in self.ds.index.field_order:
-                    if field in fields:
-                        # We read it ...
-                        f.seek(local_offset, os.SEEK_CUR)
-                        v = np.fromfile(f, dtype=dtype, count=count)
-                        v = v.reshape(grid.ActiveDimensions, order='F')
-                        data[grid.id][field] = v
-                        local_offset = 0
-                    else:
-                        local_offset += size
+        field_order = self.ds.index.field_order
+        components = [i for i, field in enumerate(field_order)
+                      if field in fields]
+        if len(components) == 0:
+            for filename in grids_by_file:
+                for grid in grids_by_file[filename]:
+                    data[grid.id] = {}
+            return data
+        filenames = list(grids_by_file)
+        def read_file(filename):
+            fabs = [(grid.id, grid._base_offset, grid._offset, dtype,
+                     grid.ActiveDimensions, components)
+                    for grid in grids_by_file[filename]]
+            return _read_fabs(filename, fabs, self._max_gap,
+                              self._max_read_size)
+        for filename, fabs in zip(filenames, _map_files(read_file, filenames)):
+            for grid in grids_by_file[filename]:
+                data_offset, arrs = fabs[grid.id]
+                grid._offset = data_offset
+                data[grid.id] = dict((field_order[c], v)
+                                     for c, v in zip(components, arrs))
         return data
 
     def _read_particle_coords(self, chunks, ptf):
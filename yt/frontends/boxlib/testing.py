@@ -0,0 +1,96 @@
+import os
+
+import numpy as np
+
+
+def fake_boxlib_value(field_index, level, i, j, k, n):
+    """The value of a component at level-wide cell indices (i, j, k) of a
+    plotfile written by fake_boxlib_plotfile, with n cells per dimension
+    across the domain at that level."""
+    return field_index + 10.0 * level + 100.0 * (i + n * (j + n * k))
+
+
+def fake_boxlib_plotfile(
+        output_dir,
+        fields=('density', 'temperature'),
+        domain_dimensions=32,
+        box_size=8,
+        num_levels=2,
+        num_files=4
+    ):
+    """
+    Generate a fake 3D BoxLib plotfile.
+
+    The root level covers the unit cube and each finer level, refined by two,
+    covers the central half of the one below it, so that every level has
+    ``domain_dimensions**3`` cells.  Each level is split into boxes of
+    ``box_size**3`` cells, written round-robin to ``num_files`` files.  The
+    data are given by :func:`fake_boxlib_value`.
+    """
+    n0, nb = domain_dimensions, box_size
+    if n0 % nb != 0:
+        raise RuntimeError("box_size must divide domain_dimensions")
+    os.makedirs(output_dir)
+    starts = []
+    for level in range(num_levels):
+        n = n0 * 2**level
+        lo = 0 if level == 0 else n // 2 - n0 // 2
+        starts.append([np.array([i, j, k]) * nb + lo
+                       for k in range(n0 // nb)
+                       for j in range(n0 // nb)
+                       for i in range(n0 // nb)])
+    with open(os.path.join(output_dir, "Header"), "w") as f:
+        f.write("HyperCLaw-V1.1\n%d\n" % len(fields))
+        for field in fields:
+            f.write("%s\n" % field)
+        f.write("3\n0.0\n%d\n" % (num_levels - 1))
+        f.write("0.0 0.0 0.0\n1.0 1.0 1.0\n")
+        f.write(" ".join(["2"] * (num_levels - 1)) + "\n")
+        f.write(" ".join("((0,0,0) (%s) (0,0,0))" %
+                         ",".join([str(n0 * 2**level - 1)] * 3)
+                         for level in range(num_levels)) + "\n")
+        f.write(" ".join(["0"] * num_levels) + "\n")
+        for level in range(num_levels):
+            f.write(" ".join(["%0.16e" % (1.0 / (n0 * 2**level))] * 3) + "\n")
+        f.write("0\n0\n")
+        for level in range(num_levels):
+            n = n0 * 2**level
+            f.write("%d %d 0.0\n0\n" % (level, len(starts[level])))
+            for start in starts[level]:
+                for ax in range(3):
+                    f.write("%0.16e %0.16e\n" %
+                            (start[ax] / float(n), (start[ax] + nb) / float(n)))
+            f.write("Level_%d/Cell\n" % level)
+    for level in range(num_levels):
+        n = n0 * 2**level
+        level_dir = os.path.join(output_dir, "Level_%d" % level)
+        os.makedirs(level_dir)
+        handles = [open(os.path.join(level_dir, "Cell_D_%05d" % i), "wb")
+                   for i in range(num_files)]
+        fabs = []
+        for ibox, start in enumerate(starts[level]):
+            stop = start + nb - 1
+            box = "((%s) (%s) (0,0,0))" % (",".join(str(v) for v in start),
+                                           ",".join(str(v) for v in stop))
+            i, j, k = np.mgrid[start[0]:stop[0] + 1,
+                               start[1]:stop[1] + 1,
+                               start[2]:stop[2] + 1]
+            fh = handles[ibox % num_files]
+            fabs.append((box, ibox % num_files, fh.tell()))
+            fh.write(("FAB ((8, (64 11 52 0 1 12 0 1023)),"
+                      "(8, (8 7 6 5 4 3 2 1)))%s %d\n" %
+                      (box, len(fields))).encode("ascii"))
+            for c in range(len(fields)):
+                v = fake_boxlib_value(c, level, i, j, k, n)
+                fh.write(v.astype("<f8").tobytes(order="F"))
+        for fh in handles:
+            fh.close()
+        with open(os.path.join(level_dir, "Cell_H"), "w") as f:
+            f.write("1\n0\n%d\n0\n" % len(fields))
+            f.write("(%d 0\n" % len(fabs))
+            for box, ifile, offset in fabs:
+                f.write("%s\n" % box)
+            f.write(")\n%d\n" % len(fabs))
+            for box, ifile, offset in fabs:
+                f.write("FabOnDisk: Cell_D_%05d %d\n" % (ifile, offset))
+    return output_dir
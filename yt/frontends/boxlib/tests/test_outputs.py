@@ -13,8 +13,15 @@ Boxlib frontend tests
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
+from yt.config import ytcfg
+from yt.convenience import load
 from yt.testing import \
     assert_equal, \
+    disable_dataset_cache, \
     requires_file, \
     units_override_check
 from yt.utilities.answer_testing.framework import \
@@ -28,6 +35,9 @@ from yt.frontends.boxlib.api import \
     WarpXDataset, \
     CastroDataset, \
     MaestroDataset
+from yt.frontends.boxlib.testing import \
+    fake_boxlib_plotfile, \
+    fake_boxlib_value
 import numpy as np    
 
 # We don't do anything needing ghost zone generation right now, because these
@@ -298,3 +308,32 @@ def test_maestro_parameters():
     # Check an int parameter
     assert(ds.parameters['s0_interp_type']==3)
     assert(type(ds.parameters['s0_interp_type']) is int)
+
+
+@disable_dataset_cache
+def test_coalesced_reads():
+    tmpdir = tempfile.mkdtemp()
+    fn = fake_boxlib_plotfile(os.path.join(tmpdir, "plt00000"),
+                              domain_dimensions=16, box_size=4,
+                              num_levels=3, num_files=3)
+    old = ytcfg.get("yt", "boxlib_io_threads")
+    try:
+        # Reads of whole files at once, of every FAB on its own and of
+        # pieces of files, serially and in threads.
+        for nthreads, max_gap, max_read_size in [("1", 1024**2, 1024**3),
+                                                 ("1", 0, 1),
+                                                 ("3", 1024, 8192)]:
+            ytcfg["yt", "boxlib_io_threads"] = nthreads
+            ds = load(fn)
+            ds.index.io._max_gap = max_gap
+            ds.index.io._max_read_size = max_read_size
+            ad = ds.all_data()
+            ad.get_data([("boxlib", "density"), ("boxlib", "temperature")])
+            n = ds.domain_dimensions[0] * 2**ad.ires
+            i, j, k = ad.icoords.T
+            for c, field in enumerate(["density", "temperature"]):
+                assert_equal(ad["boxlib", field].d,
+                             fake_boxlib_value(c, ad.ires, i, j, k, n))
+    finally:
+        ytcfg["yt", "boxlib_io_threads"] = old
+        shutil.rmtree(tmpdir)
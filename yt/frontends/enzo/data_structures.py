@@ -45,8 +45,11 @@ from yt.geometry.geometry_handler import \
     YTDataChunk
 from yt.data_objects.static_output import \
     Dataset
+from yt.config import ytcfg
 from yt.fields.field_info_container import \
     NullFunc
+from yt.utilities.index_cache import \
+    file_stats, load_index_cache, save_index_cache
 from yt.utilities.logger import ytLogger as mylog
 
 from .fields import \
@@ -181,6 +184,9 @@ class EnzoHierarchy(GridIndex):
             self._bn = "%s.cpu%%04i"
         self.index_filename = os.path.abspath(
             "%s.hierarchy" % (ds.parameter_filename))
+        self.index_cache_filename = None
+        if ytcfg.getboolean("yt", "cache_enzo_hierarchy"):
+            self.index_cache_filename = "%s.npz" % self.index_filename
         if os.path.getsize(self.index_filename) == 0:
             raise IOError(-1,"File empty", self.index_filename)
         self.directory = os.path.dirname(self.index_filename)
@@ -240,8 +246,21 @@ class EnzoHierarchy(GridIndex):
         else:
             raise NotImplementedError
 
-    # Sets are sorted, so that won't work!
+    # Bump this whenever the layout of the hierarchy cache changes.
+    _index_cache_version = 1
+
     def _parse_index(self):
+        cache = load_index_cache(self.index_cache_filename,
+                                 self._index_cache_key())
+        if cache is not None:
+            mylog.info("Loading hierarchy from %s", self.index_cache_filename)
+            self._parse_index_cache(cache)
+        else:
+            self._parse_index_text()
+            self._save_index_cache()
+
+    # Sets are sorted, so that won't work!
+    def _parse_index_text(self):
         def _next_token_line(token, f):
             for line in f:
                 if line.startswith(token):
@@ -298,12 +317,69 @@ class EnzoHierarchy(GridIndex):
                     vv = patt.findall(line)[0]
                     self.__pointer_handler(vv)
         pbar.finish()
-        self._fill_arrays(ei, si, LE, RE, npart, nap)
+        self._parsed = dict(
+            si = np.array(si, dtype="int64"), ei = np.array(ei, dtype="int64"),
+            LE = np.array(LE, dtype="float64"),
+            RE = np.array(RE, dtype="float64"),
+            npart = np.array(npart, dtype="int64"))
+        self._parsed["has_nap"] = np.array(nap is not None)
+        if nap is not None:
+            for ptype in nap:
+                self._parsed["nap_%s" % ptype] = np.array(nap[ptype],
+                                                          dtype="int64")
+        p = self._parsed
+        self._fill_arrays(p["ei"], p["si"], p["LE"], p["RE"], p["npart"], nap)
         temp_grids = np.empty(self.num_grids, dtype='object')
         temp_grids[:] = self.grids
         self.grids = temp_grids
         self.filenames = fn
 
+    def _index_cache_key(self):
+        key = dict(version = np.array(self._index_cache_version),
+                   num_grids = np.array(self.num_grids),
+                   dimensionality = np.array(self.ds.dimensionality))
+        key.update(file_stats([self.index_filename]))
+        return key
+
+    def _save_index_cache(self):
+        # We store what was parsed out of the text file, along with the grid
+        # relationships, so that reloading only has to rebuild the grid
+        # objects.
+        data = self._parsed
+        del self._parsed
+        if self.index_cache_filename is None:
+            return
+        data["levels"] = self.grid_levels[:, 0]
+        data["parent_ids"] = np.array([g._parent_id for g in self.grids],
+                                      dtype="int64")
+        # Grids without a file get an empty name.
+        data["filenames"] = np.array([f[0] or "" for f in self.filenames])
+        nap_types = [k[4:] for k in data if k.startswith("nap_")]
+        data["nap_types"] = np.array(nap_types, dtype="U")
+        save_index_cache(self.index_cache_filename, self._index_cache_key(),
+                         data)
+
+    def _parse_index_cache(self, cache):
+        nap = None
+        if cache["has_nap"]:
+            nap = dict((str(ptype), cache["nap_%s" % ptype])
+                       for ptype in cache["nap_types"])
+        self._fill_arrays(cache["ei"], cache["si"], cache["LE"], cache["RE"],
+                          cache["npart"], nap)
+        levels = cache["levels"]
+        parent_ids = cache["parent_ids"]
+        self.grid_levels[:, 0] = levels
+        self.grids = np.empty(self.num_grids, dtype='object')
+        for i in range(self.num_grids):
+            g = self.grid(i + 1, self)
+            g.Level = int(levels[i])
+            g._parent_id = int(parent_ids[i])
+            # Children are always listed in the order they were created.
+            if g._parent_id != -1:
+                self.grids[g._parent_id - 1]._children_ids.append(g.id)
+            self.grids[i] = g
+        self.filenames = [[str(f) or None] for f in cache["filenames"]]
+
     def _initialize_grid_arrays(self):
         super(EnzoHierarchy, self)._initialize_grid_arrays()
         if "AppendActiveParticleType" in self.parameters.keys() and \
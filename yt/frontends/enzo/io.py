@@ -13,6 +13,8 @@ Enzo-specific IO functions
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+from yt.utilities.file_handler import \
+    HDF5FileHandlePool
 from yt.utilities.io_handler import \
     BaseIOHandler
 from yt.utilities.logger import ytLogger as mylog
@@ -31,6 +33,12 @@ class IOHandlerPackedHDF5(BaseIOHandler):
     _dataset_type = "enzo_packed_3d"
     _base = slice(None)
     _field_dtype = "float64"
+    # The number of grid files we keep open between reads.
+    _max_open_files = 64
+
+    def __init__(self, *args, **kwargs):
+        super(IOHandlerPackedHDF5, self).__init__(*args, **kwargs)
+        self._handle_pool = HDF5FileHandlePool(self._max_open_files)
 
     def _read_field_names(self, grid):
         if grid.filename is None: return []
@@ -80,11 +88,14 @@ class IOHandlerPackedHDF5(BaseIOHandler):
         chunks = list(chunks)
         for chunk in chunks: # These should be organized by grid filename
             f = None
+            filename = -1
             for g in chunk.objs:
                 if g.filename is None: continue
-                if f is None:
-                    #print "Opening (read) %s" % g.filename
-                    f = h5py.File(g.filename, "r")
+                if g.filename != filename:
+                    # We do not close this file; the file id belongs to the
+                    # handle pool, which will close it once it is evicted.
+                    f = h5py.File(self._handle_pool.get(g.filename))
+                    filename = g.filename
                 nap = sum(g.NumberOfActiveParticles.values())
                 if g.NumberOfParticles == 0 and nap == 0:
                     continue
@@ -111,7 +122,6 @@ class IOHandlerPackedHDF5(BaseIOHandler):
                         if field in _convert_mass:
                             data *= g.dds.prod(dtype="f8")
                         yield (ptype, field), data[mask]
-            if f: f.close()
 
     def io_iter(self, chunks, fields):
         h5_dtype = self._field_dtype
@@ -121,13 +131,10 @@ class IOHandlerPackedHDF5(BaseIOHandler):
             for obj in chunk.objs:
                 if obj.filename is None: continue
                 if obj.filename != filename:
-                    # Note one really important thing here: even if we do
-                    # implement LRU caching in the _read_obj_field function,
-                    # we'll still be doing file opening and whatnot.  This is a
-                    # problem, but one we can return to.
-                    if fid is not None:
-                        fid.close()
-                    fid = h5py.h5f.open(b(obj.filename), h5py.h5f.ACC_RDONLY)
+                    # File ids come from the handle pool, so reading the same
+                    # files again (for instance in the next slice or
+                    # projection) does not reopen them.
+                    fid = self._handle_pool.get(obj.filename)
                     filename = obj.filename
                 for field in fields:
                     nodal_flag = self.ds.field_info[field].nodal_flag
@@ -135,17 +142,12 @@ class IOHandlerPackedHDF5(BaseIOHandler):
                     data = np.empty(dims, dtype=h5_dtype)
                     yield field, obj, self._read_obj_field(
                         obj, field, (fid, data))
-        if fid is not None:
-            fid.close()
-        
+
     def _read_obj_field(self, obj, field, fid_data):
         if fid_data is None: fid_data = (None, None)
         fid, data = fid_data
         if fid is None:
-            close = True
-            fid = h5py.h5f.open(b(obj.filename), h5py.h5f.ACC_RDONLY)
-        else:
-            close = False
+            fid = self._handle_pool.get(obj.filename)
         if data is None:
             data = np.empty(obj.ActiveDimensions[::-1],
                             dtype=self._field_dtype)
@@ -162,8 +164,6 @@ class IOHandlerPackedHDF5(BaseIOHandler):
         # I don't know why, but on some installations of h5py this works, but
         # on others, nope.  Doesn't seem to be a version thing.
         #dg.close()
-        if close:
-            fid.close()
         return data.T
 
 class IOHandlerPackedHDF5GhostZones(IOHandlerPackedHDF5):
@@ -14,7 +14,11 @@ Enzo frontend tests
 #-----------------------------------------------------------------------------
 
 import numpy as np
+import os
+import shutil
+import tempfile
 
+from yt.convenience import load
 from yt.testing import \
     assert_almost_equal, \
     assert_equal, \
@@ -83,6 +87,33 @@ def test_moving7():
         test_moving7.__name__ = test.description
         yield test
 
+@requires_file(m7)
+def test_hierarchy_cache():
+    # Work on a copy, so the cache is not written into the test data.
+    tmpdir = tempfile.mkdtemp()
+    try:
+        ds = data_dir_load(m7)
+        dirname = os.path.join(tmpdir, "DD0010")
+        shutil.copytree(os.path.dirname(ds.parameter_filename), dirname)
+        fn = os.path.join(dirname, "moving7_0010")
+        ds1 = load(fn)
+        index1 = ds1.index
+        assert os.path.isfile(index1.index_cache_filename)
+        ds2 = load(fn)
+        index2 = ds2.index
+        for attr in ("grid_left_edge", "grid_right_edge", "grid_dimensions",
+                     "grid_levels", "grid_particle_count"):
+            assert_equal(getattr(index1, attr), getattr(index2, attr))
+        for g1, g2 in zip(index1.grids, index2.grids):
+            assert_equal(g1.id, g2.id)
+            assert_equal(g1.Level, g2.Level)
+            assert_equal(g1.filename, g2.filename)
+            assert_equal(g1._parent_id, g2._parent_id)
+            assert_equal(g1._children_ids, g2._children_ids)
+        assert_equal(ds1.r[:]["density"], ds2.r[:]["density"])
+    finally:
+        shutil.rmtree(tmpdir)
+
 @requires_ds(g30, big_data=True)
 def test_galaxy0030():
     ds = data_dir_load(g30)
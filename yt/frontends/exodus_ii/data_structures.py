@@ -13,7 +13,9 @@ Exodus II data structures
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 import numpy as np
+from collections import OrderedDict
 
+from yt.config import ytcfg
 from yt.funcs import \
     setdefaultattr
 from yt.geometry.unstructured_mesh_handler import \
@@ -26,6 +28,8 @@ from yt.data_objects.unions import MeshUnion
 from yt.utilities.file_handler import \
     NetCDF4FileHandler, \
     warn_netcdf
+from yt.utilities.index_cache import \
+    file_stats
 from yt.utilities.logger import ytLogger as mylog
 from .fields import \
     ExodusIIFieldInfo
@@ -35,6 +39,70 @@ from .util import \
     get_num_pseudo_dims
 
 
+class ExodusIIFileCache(object):
+    """
+    The parts of an Exodus II file that are the same for each of its time
+    steps, shared by the datasets loaded from the file, along with the most
+    recently read block of consecutive steps of each of its variables.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.stats = file_stats([filename])
+        self._values = {}
+        self._blocks = {}
+
+    def is_current(self):
+        stats = file_stats([self.filename])
+        return all(np.array_equal(stats[k], v) for k, v in self.stats.items())
+
+    def get(self, key, func):
+        """Return the value stored under key, calling func to get it the
+        first time it is asked for."""
+        if key not in self._values:
+            self._values[key] = func()
+        return self._values[key]
+
+    def read_step(self, handle, name, step):
+        """
+        Read one time step of the variable called name from handle, the
+        open netCDF file.
+
+        When the ``exodus_ii_step_block`` configuration option is larger
+        than one, the block of that many steps containing step is read at
+        once and later steps of the block are served from it.
+        """
+        block = ytcfg.getint("yt", "exodus_ii_step_block")
+        var = handle.variables[name]
+        if block <= 1:
+            return var[step]
+        if step < 0:
+            step += var.shape[0]
+        start = step - step % block
+        buf = self._blocks.get(name)
+        if buf is None or buf[0] != start:
+            buf = (start, var[start:start + block])
+            self._blocks[name] = buf
+        return buf[1][step - start]
+
+
+_file_caches = OrderedDict()
+_max_cached_files = 4
+
+def get_file_cache(filename):
+    """
+    Return the :class:`ExodusIIFileCache` for filename, starting a new one
+    if the file has changed since it was cached.  Only the most recently
+    used few files are kept.
+    """
+    fc = _file_caches.pop(filename, None)
+    if fc is None or not fc.is_current():
+        fc = ExodusIIFileCache(filename)
+    _file_caches[filename] = fc
+    while len(_file_caches) > _max_cached_files:
+        _file_caches.popitem(last=False)
+    return fc
+
+
 class ExodusIIUnstructuredMesh(UnstructuredMesh):
     _index_offset = 1
 
@@ -152,6 +220,7 @@ class ExodusIIDataset(Dataset):
 
         """
         self.parameter_filename = filename
+        self._file_cache = get_file_cache(filename)
         self.fluid_types += self._get_fluid_types()
         self.step = step
         if displacements is None:
@@ -181,18 +250,17 @@ class ExodusIIDataset(Dataset):
 
     def _parse_parameter_file(self):
         self._handle = NetCDF4FileHandler(self.parameter_filename)
-        with self._handle.open_ds() as ds:
-            self._read_glo_var()
-            self.dimensionality = ds.variables['coor_names'].shape[0]
-            self.parameters['info_records'] = self._load_info_records()
-            self.unique_identifier = self._get_unique_identifier()
-            self.num_steps = len(ds.variables['time_whole'])
-            self.current_time = self._get_current_time()
-            self.parameters['num_meshes'] = ds.variables['eb_status'].shape[0]
-            self.parameters['elem_names'] = self._get_elem_names()
-            self.parameters['nod_names'] = self._get_nod_names()
-            self.domain_left_edge, self.domain_right_edge = self._load_domain_edge()
-            self.periodicity = (False, False, False)
+        self._read_glo_var()
+        self.dimensionality, self.parameters['num_meshes'] = \
+            self._file_cache.get("shape", self._read_shape)
+        self.parameters['info_records'] = self._load_info_records()
+        self.unique_identifier = self._get_unique_identifier()
+        self.num_steps = len(self._get_times())
+        self.current_time = self._get_current_time()
+        self.parameters['elem_names'] = self._get_elem_names()
+        self.parameters['nod_names'] = self._get_nod_names()
+        self.domain_left_edge, self.domain_right_edge = self._load_domain_edge()
+        self.periodicity = (False, False, False)
 
         # These attributes don't really make sense for unstructured
         # mesh data, but yt warns if they are not present, so we set
@@ -205,7 +273,15 @@ class ExodusIIDataset(Dataset):
         self.hubble_constant = 0
         self.refine_by = 0
 
+    def _read_shape(self):
+        with self._handle.open_ds() as ds:
+            return (ds.variables['coor_names'].shape[0],
+                    ds.variables['eb_status'].shape[0])
+
     def _get_fluid_types(self):
+        return self._file_cache.get("fluid_types", self._read_fluid_types)
+
+    def _read_fluid_types(self):
         with NetCDF4FileHandler(self.parameter_filename).open_ds() as ds:
             fluid_types = ()
             i = 1
@@ -227,15 +303,21 @@ class ExodusIIDataset(Dataset):
         names = self._get_glo_names()
         if not names:
             return
+        values = self._file_cache.get("glo_vals", self._read_glo_vals)
+        for name, value in zip(names, values):
+            self.parameters[name] = value
+
+    def _read_glo_vals(self):
         with self._handle.open_ds() as ds:
-            values = ds.variables['vals_glo_var'][:].transpose()
-            for name, value in zip(names, values):
-                self.parameters[name] = value
+            return ds.variables['vals_glo_var'][:].transpose()
 
     def _load_info_records(self):
         """
         Returns parsed version of the info_records.
         """
+        return self._file_cache.get("info_records", self._read_info_records)
+
+    def _read_info_records(self):
         with self._handle.open_ds() as ds:
             try:
                 return load_info_records(ds.variables['info_records'])
@@ -246,15 +328,21 @@ class ExodusIIDataset(Dataset):
     def _get_unique_identifier(self):
         return self.parameter_filename
 
-    def _get_current_time(self):
+    def _get_times(self):
+        return self._file_cache.get("time_whole", self._read_times)
+
+    def _read_times(self):
         with self._handle.open_ds() as ds:
-            try:
-                return ds.variables['time_whole'][self.step]
-            except IndexError:
-                raise RuntimeError("Invalid step number, max is %d" \
-                                   % (self.num_steps - 1))
-            except (KeyError, TypeError):
-                return 0.0
+            return ds.variables['time_whole'][:]
+
+    def _get_current_time(self):
+        try:
+            return self._get_times()[self.step]
+        except IndexError:
+            raise RuntimeError("Invalid step number, max is %d" \
+                               % (self.num_steps - 1))
+        except (KeyError, TypeError):
+            return 0.0
 
     def _get_glo_names(self):
         """
@@ -263,6 +351,9 @@ class ExodusIIDataset(Dataset):
 
         """
 
+        return self._file_cache.get("glo_names", self._read_glo_names)
+
+    def _read_glo_names(self):
         with self._handle.open_ds() as ds:
             if "name_glo_var" not in ds.variables:
                 mylog.warning("name_glo_var not found")
@@ -278,6 +369,9 @@ class ExodusIIDataset(Dataset):
 
         """
 
+        return self._file_cache.get("elem_names", self._read_elem_names)
+
+    def _read_elem_names(self):
         with self._handle.open_ds() as ds:
             if "name_elem_var" not in ds.variables:
                 mylog.warning("name_elem_var not found")
@@ -293,6 +387,9 @@ class ExodusIIDataset(Dataset):
 
         """
 
+        return self._file_cache.get("nod_names", self._read_nod_names)
+
+    def _read_nod_names(self):
         with self._handle.open_ds() as ds:
             if "name_nod_var" not in ds.variables:
                 mylog.warning("name_nod_var not found")
@@ -308,6 +405,12 @@ class ExodusIIDataset(Dataset):
 
         """
 
+        # The coordinates along pseudo-dimensions are dropped once they have
+        # been found, so they are cached for each dimensionality.
+        return self._file_cache.get(("coords", self.dimensionality),
+                                    self._read_coords)
+
+    def _read_coords(self):
         coord_axes = 'xyz'[:self.dimensionality]
 
         mylog.info("Loading coordinates")
@@ -336,7 +439,8 @@ class ExodusIIDataset(Dataset):
             for i, ax in enumerate(coord_axes):
                 if "disp_%s" % ax in self.parameters['nod_names']:
                     ind = self.parameters['nod_names'].index("disp_%s" % ax)
-                    disp = ds.variables['vals_nod_var%d' % (ind + 1)][self.step]
+                    disp = self._file_cache.read_step(
+                        ds, 'vals_nod_var%d' % (ind + 1), self.step)
                     new_coords[:, i] = coords[:, i] + fac*disp + offset[i]
 
             return new_coords
@@ -345,6 +449,9 @@ class ExodusIIDataset(Dataset):
         """
         Loads the connectivity data for the mesh
         """
+        return self._file_cache.get("connectivity", self._read_conn)
+
+    def _read_conn(self):
         mylog.info("Loading connectivity")
         connectivity = []
         with self._handle.open_ds() as ds:
@@ -46,46 +46,41 @@ class IOHandlerExodusII(BaseIOHandler):
         # dict gets returned at the end and it should be flat, with selected
         # data.  Note that if you're reading grid data, you might need to
         # special-case a grid selector object.
+        meshes = self.ds.index.meshes
+        file_cache = self.ds._file_cache
         with self.handler.open_ds() as ds:
             chunks = list(chunks)
             rv = {}
             for field in fields:
                 ftype, fname = field
                 if ftype == "all":
-                    ci = np.concatenate([mesh.connectivity_indices - self._INDEX_OFFSET \
-                                         for mesh in self.ds.index.mesh_union])
+                    objs = list(self.ds.index.mesh_union)
+                    mesh_ids = [mesh.mesh_id + 1 for mesh in objs]
                 else:
-                    ci = ds.variables[ftype][:] - self._INDEX_OFFSET
-                num_elem = ci.shape[0]
-                if fname in self.node_fields:
-                    nodes_per_element = ci.shape[1]
-                    rv[field] = np.zeros((num_elem, nodes_per_element), dtype="float64")
-                elif fname in self.elem_fields:
-                    rv[field] = np.zeros(num_elem, dtype="float64")
-            for field in fields:
+                    mesh_ids = [int(ftype[len("connect"):])]
+                    objs = chunks[mesh_ids[0] - 1].objs
+                num_elem = sum(meshes[mesh_id - 1].connectivity_indices.shape[0]
+                               for mesh_id in mesh_ids)
                 ind = 0
-                ftype, fname = field
-                if ftype == "all":
-                    mesh_ids = [mesh.mesh_id + 1 for mesh in self.ds.index.mesh_union]
-                    objs = [mesh for mesh in self.ds.index.mesh_union]
-                else:
-                    mesh_ids = [int(ftype[-1])]
-                    chunk = chunks[mesh_ids[0] - 1]
-                    objs = chunk.objs
                 if fname in self.node_fields:
+                    nodes_per_element = meshes[mesh_ids[0] - 1] \
+                        .connectivity_indices.shape[1]
+                    rv[field] = np.zeros((num_elem, nodes_per_element),
+                                         dtype="float64")
                     field_ind = self.node_fields.index(fname)
-                    fdata = ds.variables['vals_nod_var%d' % (field_ind + 1)]
+                    fdata = file_cache.read_step(
+                        ds, 'vals_nod_var%d' % (field_ind + 1), self.ds.step)
                     for g in objs:
                         ci = g.connectivity_indices - self._INDEX_OFFSET
-                        data = fdata[self.ds.step][ci]
-                        ind += g.select(selector, data, rv[field], ind)  # caches
-                if fname in self.elem_fields:
+                        ind += g.select(selector, fdata[ci], rv[field], ind)
+                elif fname in self.elem_fields:
+                    rv[field] = np.zeros(num_elem, dtype="float64")
                     field_ind = self.elem_fields.index(fname)
                     for g, mesh_id in zip(objs, mesh_ids):
-                        fdata = ds.variables['vals_elem_var%deb%s' %
-                                                       (field_ind + 1, mesh_id)][:]
-                        data = fdata[self.ds.step, :]
-                        ind += g.select(selector, data, rv[field], ind)  # caches
+                        data = file_cache.read_step(
+                            ds, 'vals_elem_var%deb%s' % (field_ind + 1, mesh_id),
+                            self.ds.step)
+                        ind += g.select(selector, data, rv[field], ind)
                 rv[field] = rv[field][:ind]
             return rv
 
@@ -13,10 +13,19 @@ Exodus II frontend tests
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from yt.config import ytcfg
+from yt.convenience import load
 from yt.testing import \
     assert_equal, \
     assert_array_equal, \
-    requires_file
+    requires_file, \
+    requires_module
 from yt.utilities.answer_testing.framework import \
     data_dir_load, \
     requires_ds, \
@@ -95,3 +104,74 @@ def test_displacement_fields():
             def array_func():
                 return mesh.connectivity_coords
             yield GenericArrayTest(ds, array_func, 12)
+
+
+def _write_fake_exodus(fn, num_steps):
+    # One block of two hexes side by side along x.  The nodal variable is the
+    # node number plus 100 times the step, and the element variable is the
+    # element number minus the step.
+    from netCDF4 import Dataset
+    x, y, z = np.mgrid[0:3, 0:2, 0:2]
+    node = lambda i, j, k: 4 * i + 2 * j + k + 1
+    conn = [[node(i, 0, 0), node(i + 1, 0, 0), node(i + 1, 1, 0),
+             node(i, 1, 0), node(i, 0, 1), node(i + 1, 0, 1),
+             node(i + 1, 1, 1), node(i, 1, 1)] for i in range(2)]
+    with Dataset(fn, "w", format="NETCDF3_64BIT_OFFSET") as f:
+        f.createDimension("len_name", 33)
+        f.createDimension("num_dim", 3)
+        f.createDimension("num_nodes", 12)
+        f.createDimension("num_el_blk", 1)
+        f.createDimension("num_el_in_blk1", 2)
+        f.createDimension("num_nod_per_el1", 8)
+        f.createDimension("num_nod_var", 1)
+        f.createDimension("num_elem_var", 1)
+        f.createDimension("time_step", None)
+        names = f.createVariable("coor_names", "S1", ("num_dim", "len_name"))
+        names[:] = np.zeros((3, 33), dtype="S1")
+        f.createVariable("eb_status", "i4", ("num_el_blk",))[:] = [1]
+        for ax, c in zip("xyz", (x, y, z)):
+            f.createVariable("coord" + ax, "f8", ("num_nodes",))[:] = c.ravel()
+        f.createVariable("connect1", "i4",
+                         ("num_el_in_blk1", "num_nod_per_el1"))[:] = conn
+        for kind, name in (("nod", "diffused"), ("elem", "indicator")):
+            v = f.createVariable("name_%s_var" % kind, "S1",
+                                 ("num_%s_var" % kind, "len_name"))
+            v[0] = np.array(list(name.ljust(33, "\0")), dtype="S1")
+        f.createVariable("time_whole", "f8", ("time_step",))
+        f.createVariable("vals_nod_var1", "f8", ("time_step", "num_nodes"))
+        f.createVariable("vals_elem_var1eb1", "f8",
+                         ("time_step", "num_el_in_blk1"))
+        for step in range(num_steps):
+            f.variables["time_whole"][step] = 0.5 * step
+            f.variables["vals_nod_var1"][step] = np.arange(12) + 100.0 * step
+            f.variables["vals_elem_var1eb1"][step] = np.arange(2) - step
+    return np.array(conn)
+
+
+@requires_module("netCDF4")
+def test_step_blocks():
+    tmpdir = tempfile.mkdtemp()
+    fn = os.path.join(tmpdir, "fake.e")
+    conn = _write_fake_exodus(fn, 10)
+    old = ytcfg.get("yt", "exodus_ii_step_block")
+    try:
+        for block in ["1", "4"]:
+            ytcfg["yt", "exodus_ii_step_block"] = block
+            for step in list(range(10)) + [-1]:
+                ds = load(fn, step=step)
+                assert_equal(ds.num_steps, 10)
+                assert_equal(ds.current_time, 0.5 * (step % 10))
+                ad = ds.all_data()
+                assert_equal(ad["connect1", "diffused"],
+                             conn - 1 + 100.0 * (step % 10))
+                assert_equal(ad["connect1", "indicator"],
+                             np.arange(2) - step % 10)
+                assert_equal(ad["all", "diffused"].shape, (2, 8))
+        # The mesh is only read once for all of the steps.
+        ds1 = load(fn, step=1)
+        ds2 = load(fn, step=2)
+        assert ds1._file_cache is ds2._file_cache
+        assert ds1._read_connectivity()[0] is ds2._read_connectivity()[0]
+    finally:
+        ytcfg["yt", "exodus_ii_step_block"] = old
+        shutil.rmtree(tmpdir)
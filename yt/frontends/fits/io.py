@@ -12,6 +12,7 @@ FITS-specific IO functions
 
 import numpy as np
 
+from yt.config import ytcfg
 from yt.utilities.io_handler import \
     BaseIOHandler
 from yt.utilities.logger import ytLogger as mylog
@@ -67,35 +68,107 @@ class IOHandlerFITS(BaseIOHandler):
         dt = "float64"
         for field in fields:
             rv[field] = np.empty(size, dtype=dt)
-        ng = sum(len(c.objs) for c in chunks)
+        grids = [g for chunk in chunks for g in chunk.objs]
         mylog.debug("Reading %s cells of %s fields in %s grids",
-                    size, [f2 for f1, f2 in fields], ng)
-        dx = self.ds.domain_width/self.ds.domain_dimensions
+                    size, [f2 for f1, f2 in fields], len(grids))
+        max_size = ytcfg.getfloat("yt", "fits_max_slab_size") * 1024**2
+        boxes = [self._grid_box(g) for g in grids]
         for field in fields:
             ftype, fname = field
             f = self.ds.index._file_map[fname]
-            ds = f[self.ds.index._ext_map[fname]]
+            hdu = f[self.ds.index._ext_map[fname]]
+            image = _get_image(hdu)
+            itemsize = abs(hdu.header["bitpix"]) // 8
+            if self.ds.naxis == 4:
+                prefix = (self.ds.index._axis_map[fname],)
+            else:
+                prefix = ()
             bzero, bscale = self.ds.index._scale_map[fname]
             ind = 0
-            for chunk in chunks:
-                for g in chunk.objs:
-                    start = ((g.LeftEdge-self.ds.domain_left_edge)/dx).to_ndarray().astype("int")
-                    end = start + g.ActiveDimensions
-                    slices = [slice(start[i],end[i]) for i in range(3)]
+            for lo, hi, group in image_slabs(boxes, itemsize, max_size):
+                slab, owned = _read_slab(image, prefix, lo, hi, itemsize,
+                                         max_size)
+                for i in group:
+                    start, end = boxes[i]
+                    data = slab[tuple(slice(s, e) for s, e in
+                                      zip(start - lo, end - lo))]
+                    # The image is stored in (z, y, x) order.
+                    data = data.astype(dt, copy=not owned).transpose()
                     if self.ds.dimensionality == 2:
-                        nx, ny = g.ActiveDimensions[:2]
-                        nz = 1
-                        data = np.zeros((nx,ny,nz))
-                        data[:,:,0] = ds.data[slices[1],slices[0]].transpose()
-                    elif self.ds.naxis == 4:
-                        idx = self.ds.index._axis_map[fname]
-                        data = ds.data[idx,slices[2],slices[1],slices[0]].transpose()
-                    else:
-                        data = ds.data[slices[2],slices[1],slices[0]].transpose()
+                        data = data.reshape(data.shape + (1,))
                     if fname in self.ds.nan_mask:
                         data[np.isnan(data)] = self.ds.nan_mask[fname]
                     elif "all" in self.ds.nan_mask:
                         data[np.isnan(data)] = self.ds.nan_mask["all"]
-                    data = bzero + bscale*data
-                    ind += g.select(selector, data.astype("float64"), rv[field], ind)
+                    data *= bscale
+                    data += bzero
+                    ind += grids[i].select(selector, data, rv[field], ind)
         return rv
+
+    def _grid_box(self, grid):
+        # The index range the grid covers in the image, in (z, y, x) order.
+        dx = self.ds.domain_width/self.ds.domain_dimensions
+        start = np.rint(((grid.LeftEdge - self.ds.domain_left_edge)/dx).d)
+        start = start.astype("int64")
+        end = start + grid.ActiveDimensions
+        ndim = self.ds.dimensionality
+        return start[ndim-1::-1], end[ndim-1::-1]
+
+
+def _get_image(hdu):
+    # Sections read only the part of the image that is asked for from the
+    # file.  The data of a memory-mapped HDU, once accessed, stays mapped
+    # until the file is closed, so the pages of every slab that has been read
+    # would build up in memory.
+    if hdu._data_loaded or hdu.fileinfo() is None:
+        return hdu.data
+    return hdu.section
+
+
+def _read_slab(image, prefix, lo, hi, itemsize, max_size):
+    """Read the part of the image between lo and hi.  A slab larger than
+    max_size bytes is read in pieces along its slowest axis into a float64
+    buffer, which is returned along with True to mark it as a copy."""
+    shape = hi - lo
+    plane_size = itemsize * np.prod(shape[1:])
+    step = max(int(max_size // plane_size), 1)
+    rest = tuple(slice(l, h) for l, h in zip(lo[1:], hi[1:]))
+    if step >= shape[0]:
+        return image[prefix + (slice(lo[0], hi[0]),) + rest], False
+    slab = np.empty(shape, dtype="float64")
+    for i in range(0, shape[0], step):
+        j = min(i + step, shape[0])
+        slab[i:j] = image[prefix + (slice(lo[0] + i, lo[0] + j),) + rest]
+    return slab, True
+
+
+def image_slabs(boxes, itemsize, max_size):
+    """
+    Group consecutive index boxes of an image into slabs that can be read at
+    once.
+
+    Each box is a pair of (start, end) index arrays.  A box joins the slab of
+    the boxes before it as long as the bounding box of the slab stays within
+    max_size bytes and covers no more than twice as many cells as its boxes.
+    Yields the start and end of each slab along with the indices of its
+    boxes.
+    """
+    lo = hi = None
+    ncells = 0
+    group = []
+    for i, (start, end) in enumerate(boxes):
+        size = np.prod(end - start)
+        if group:
+            new_lo = np.minimum(lo, start)
+            new_hi = np.maximum(hi, end)
+            slab_size = np.prod(new_hi - new_lo)
+            if slab_size * itemsize <= max_size and \
+               slab_size <= 2 * (ncells + size):
+                lo, hi = new_lo, new_hi
+                ncells += size
+                group.append(i)
+                continue
+            yield lo, hi, group
+        lo, hi, ncells, group = start, end, size, [i]
+    if group:
+        yield lo, hi, group
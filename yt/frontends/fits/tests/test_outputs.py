@@ -13,9 +13,18 @@ FITS frontend tests
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from yt.config import ytcfg
+from yt.convenience import load
 from yt.testing import \
     assert_equal, \
     requires_file, \
+    requires_module, \
     units_override_check
 from yt.utilities.answer_testing.framework import \
     requires_ds, \
@@ -25,6 +34,8 @@ from ..data_structures import FITSDataset, \
     SpectralCubeFITSDataset, \
     SkyDataFITSDataset, \
     EventsFITSDataset
+from ..io import \
+    image_slabs
 
 _fields_grs = ("temperature",)
 
@@ -95,3 +106,51 @@ def test_EventsFITSDataset():
 def test_SkyDataFITSDataset():
     assert isinstance(data_dir_load(A2052), SkyDataFITSDataset)
 
+
+def test_image_slabs():
+    def box(start, end):
+        return np.array(start), np.array(end)
+    # Four 2x4x4 boxes stacked along the slowest axis, then one far away.
+    boxes = [box([2*i, 0, 0], [2*i + 2, 4, 4]) for i in range(4)]
+    boxes.append(box([0, 12, 12], [2, 16, 16]))
+    slabs = list(image_slabs(boxes, 4, 1024))
+    assert_equal(len(slabs), 2)
+    assert_equal(slabs[0][0], [0, 0, 0])
+    assert_equal(slabs[0][1], [8, 4, 4])
+    assert_equal(slabs[0][2], [0, 1, 2, 3])
+    assert_equal(slabs[1][2], [4])
+    # Each box holds 128 bytes, so at most two fit in 256.
+    slabs = list(image_slabs(boxes, 4, 256))
+    assert_equal([group for lo, hi, group in slabs], [[0, 1], [2, 3], [4]])
+
+@requires_module("astropy")
+def test_slab_reads():
+    from yt.utilities.on_demand_imports import _astropy
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+    old = ytcfg.get("yt", "fits_max_slab_size")
+    try:
+        data = np.arange(32*24*16, dtype=">f4").reshape(32, 24, 16)
+        data[3, 4, 5] = np.nan
+        hdu = _astropy.pyfits.PrimaryHDU(data)
+        hdu.header["bzero"] = 1.0
+        hdu.header["bscale"] = 2.0
+        hdu.header["btype"] = "density"
+        hdu.writeto("cube.fits")
+        expected = (1.0 + 2.0*np.nan_to_num(data)).transpose()
+        # 1 KB is less than one plane of the cube, so grids are read a few
+        # planes at a time.
+        for size in ["256", "0.001"]:
+            ytcfg["yt", "fits_max_slab_size"] = size
+            ds = load("cube.fits", nprocs=8, nan_mask=0.0)
+            for dobj in [ds.all_data(), ds.r[:, :, 10.2]]:
+                i, j, k = [((dobj["index", ax] - le) /
+                            dobj["index", "d" + ax]).d.astype("int")
+                           for ax, le in zip("xyz", ds.domain_left_edge)]
+                assert_equal(dobj["fits", "density"].d, expected[i, j, k])
+            ds.close()
+    finally:
+        ytcfg["yt", "fits_max_slab_size"] = old
+        os.chdir(curdir)
+        shutil.rmtree(tmpdir)
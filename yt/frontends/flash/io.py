@@ -29,11 +29,17 @@ def particle_sequences(grids):
         seq = list(v[1] for v in g)
         yield seq[0], seq[-1]
 
-def grid_sequences(grids):
+def grid_sequences(grids, max_length=None):
     g_iter = sorted(grids, key = lambda g: g.id)
     for k, g in groupby(enumerate(g_iter), lambda i_x1:i_x1[0]-i_x1[1].id):
         seq = list(v[1] for v in g)
-        yield seq
+        if max_length is None:
+            yield seq
+            continue
+        # Long runs are split so that no single read exceeds max_length
+        # blocks.
+        for i in range(0, len(seq), max_length):
+            yield seq[i:i + max_length]
 
 def determine_particle_fields(handle):
     try:
@@ -48,6 +54,9 @@ def determine_particle_fields(handle):
 class IOHandlerFLASH(BaseIOHandler):
     _particle_reader = False
     _dataset_type = "flash_hdf5"
+    # The largest hyperslab, in bytes, read from a field at once.  Contiguous
+    # runs of blocks bigger than this are read in several pieces.
+    _max_read_size = 256 * 1024**2
 
     def __init__(self, ds):
         super(IOHandlerFLASH, self).__init__(ds)
@@ -60,6 +69,13 @@ class IOHandlerFLASH(BaseIOHandler):
             count_list, conv_factors):
         pass
 
+    def _block_sequences(self, grids, ds):
+        # The runs of contiguous blocks in the dataset ds that hold grids,
+        # capped at _max_read_size bytes each.
+        block_size = ds.dtype.itemsize * int(np.prod(ds.shape[1:]))
+        max_length = max(self._max_read_size // block_size, 1)
+        return list(grid_sequences(grids, max_length))
+
     def io_iter(self, chunks, fields):
         f = self._handle
         for chunk in chunks:
@@ -69,10 +85,18 @@ class IOHandlerFLASH(BaseIOHandler):
                 # inside because we may exhaust our chunks.
                 ftype, fname = field
                 ds = f["/%s" % fname]
-                for gs in grid_sequences(chunk.objs):
+                sequences = self._block_sequences(chunk.objs, ds)
+                if len(sequences) == 0:
+                    continue
+                # Every run is read with a single hyperslab into the same
+                # buffer, from which _read_obj_field copies out each block.
+                nmax = max(len(gs) for gs in sequences)
+                buf = np.empty((nmax,) + ds.shape[1:], dtype=ds.dtype)
+                for gs in sequences:
                     start = gs[0].id - gs[0]._id_offset
                     end = gs[-1].id - gs[-1]._id_offset + 1
-                    data = ds[start:end,:,:,:]
+                    data = buf[:end - start]
+                    ds.read_direct(data, np.s_[start:end])
                     for i, g in enumerate(gs):
                         yield field, g, self._read_obj_field(g, field, (data, i))
 
@@ -152,7 +176,7 @@ class IOHandlerFLASH(BaseIOHandler):
         for field in fluid_fields:
             ftype, fname = field
             ds = f["/%s" % fname]
-            for gs in grid_sequences(chunk.objs):
+            for gs in self._block_sequences(chunk.objs, ds):
                 start = gs[0].id - gs[0]._id_offset
                 end = gs[-1].id - gs[-1]._id_offset + 1
                 data = ds[start:end,:,:,:].transpose()
@@ -25,6 +25,7 @@ from yt.utilities.answer_testing.framework import \
     sph_answer
 from yt.frontends.flash.api import FLASHDataset, \
     FLASHParticleDataset
+from yt.frontends.flash.io import grid_sequences
 from collections import OrderedDict
 
 _fields = ("temperature", "density", "velocity_magnitude")
@@ -96,3 +97,14 @@ def test_fid_1to3_b1():
     for test in sph_answer(ds, 'fiducial_1to3_b1_hdf5_part_0080', 6684119, fid_1to3_b1_fields):
         test_fid_1to3_b1.__name__ = test.description
         yield test
+
+
+def test_grid_sequences():
+    class FakeGrid(object):
+        def __init__(self, id):
+            self.id = id
+    grids = [FakeGrid(i) for i in [7, 1, 2, 3, 4, 5, 6, 20, 21, 40]]
+    runs = [[g.id for g in seq] for seq in grid_sequences(grids)]
+    assert_equal(runs, [[1, 2, 3, 4, 5, 6, 7], [20, 21], [40]])
+    runs = [[g.id for g in seq] for seq in grid_sequences(grids, 3)]
+    assert_equal(runs, [[1, 2, 3], [4, 5, 6], [7], [20, 21], [40]])
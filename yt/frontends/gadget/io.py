@@ -16,7 +16,6 @@ from __future__ import print_function
 #-----------------------------------------------------------------------------
 
 import numpy as np
-import os
 
 from yt.extern.six import string_types
 from yt.utilities.io_handler import \
@@ -243,6 +242,7 @@ class IOHandlerGadgetBinary(BaseIOHandler):
         # gadget format 1 original, 2 with block name
         self._format = gformat
         self._endian = endianswap
+        self._float_type = ds._header.float_type
         super(IOHandlerGadgetBinary, self).__init__(ds, *args, **kwargs)
 
     @property
@@ -258,6 +258,11 @@ class IOHandlerGadgetBinary(BaseIOHandler):
     def _read_fluid_selection(self, chunks, selector, fields, size):
         raise NotImplementedError
 
+    def _get_memmap(self, data_file):
+        # Mapping the whole file costs nothing until pages are touched, and
+        # lets each block be viewed in place instead of copied out of it.
+        return np.memmap(data_file.filename, dtype="u1", mode="r")
+
     def _read_particle_coords(self, chunks, ptf):
         data_files = set([])
         for chunk in chunks:
@@ -266,14 +271,13 @@ class IOHandlerGadgetBinary(BaseIOHandler):
         for data_file in sorted(data_files):
             poff = data_file.field_offsets
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            mm = self._get_memmap(data_file)
             for ptype in ptf:
                 # This is where we could implement sub-chunking
-                f.seek(poff[ptype, "Coordinates"], os.SEEK_SET)
                 pos = self._read_field_from_file(
-                    f, tp[ptype], "Coordinates")
+                    mm, poff[ptype, "Coordinates"], tp[ptype], "Coordinates")
                 yield ptype, (pos[:, 0], pos[:, 1], pos[:, 2])
-            f.close()
+            del mm
 
     def _read_particle_fields(self, chunks, ptf, selector):
         data_files = set([])
@@ -283,11 +287,10 @@ class IOHandlerGadgetBinary(BaseIOHandler):
         for data_file in sorted(data_files):
             poff = data_file.field_offsets
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            mm = self._get_memmap(data_file)
             for ptype, field_list in sorted(ptf.items()):
-                f.seek(poff[ptype, "Coordinates"], os.SEEK_SET)
                 pos = self._read_field_from_file(
-                    f, tp[ptype], "Coordinates")
+                    mm, poff[ptype, "Coordinates"], tp[ptype], "Coordinates")
                 mask = selector.select_points(
                     pos[:, 0], pos[:, 1], pos[:, 2], 0.0)
                 del pos
@@ -301,13 +304,19 @@ class IOHandlerGadgetBinary(BaseIOHandler):
                         data[:] = m
                         yield (ptype, field), data
                         continue
-                    f.seek(poff[ptype, field], os.SEEK_SET)
-                    data = self._read_field_from_file(f, tp[ptype], field)
-                    data = data[mask, ...]
+                    data = self._read_field_from_file(
+                        mm, poff[ptype, field], tp[ptype], field, mask)
                     yield (ptype, field), data
-            f.close()
-
-    def _read_field_from_file(self, f, count, name):
+            del mm
+
+    def _read_field_from_file(self, mm, offset, count, name, mask=None):
+        """
+        Read a block of *count* particles starting at byte *offset* of the
+        memory-mapped file *mm*.  Without a *mask*, the block is returned as
+        a read-only view of the file whenever it is already in native byte
+        order.  With a boolean *mask*, only the selected particles are copied
+        out and byte-swapped.
+        """
         if count == 0:
             return
         if name == "ParticleIDs":
@@ -316,27 +325,29 @@ class IOHandlerGadgetBinary(BaseIOHandler):
             dt = self._endian + self._float_type
         dt = np.dtype(dt)
         if name in self._vector_fields:
-            count *= self._vector_fields[name]
-        arr = np.fromfile(f, dtype=dt, count=count)
+            shape = (count, self._vector_fields[name])
+        else:
+            shape = (count,)
+        arr = np.ndarray(shape, dtype=dt, buffer=mm, offset=offset)
         # ensure data are in native endianness to avoid errors
         # when field data are passed to cython
-        dt = dt.newbyteorder('N')
-        arr = arr.astype(dt)
-        if name in self._vector_fields:
-            factor = self._vector_fields[name]
-            arr = arr.reshape((count // factor, factor), order="C")
+        native = dt.newbyteorder('N')
+        if mask is None:
+            return arr.astype(native, copy=False)
+        arr = arr[mask, ...]
+        if dt != native:
+            # arr is already a private copy, so it can be swapped in place.
+            arr = arr.byteswap(True).view(native)
         return arr
 
     def _get_morton_from_position(self, data_file, count, offset_count,
                                   regions, DLE, DRE):
-        with open(data_file.filename, "rb") as f:
-            # We add on an additionally 4 for the first record.
-            f.seek(data_file._position_offset + 4 + offset_count * 12)
-            # The first total_particles * 3 values are positions
-            pp = np.fromfile(f, dtype=self._endian + self._float_type,
-                             count=count * 3)
-            pp.shape = (count, 3)
-            pp = pp.astype(self._float_type)
+        mm = self._get_memmap(data_file)
+        # We add on an additionally 4 for the first record.  Only the
+        # positions of the requested particles are ever paged in.
+        offset = data_file._position_offset + 4 + \
+            offset_count * 3 * np.dtype(self._float_type).itemsize
+        pp = self._read_field_from_file(mm, offset, count, "Coordinates")
         regions.add_data_file(pp, data_file.file_id,
                                   data_file.ds.filter_bbox)
         morton = compute_morton(pp[:, 0], pp[:, 1], pp[:, 2], DLE, DRE,
@@ -358,7 +369,7 @@ class IOHandlerGadgetBinary(BaseIOHandler):
                              for ptype in self._ptypes]
             account = np.cumsum(account)
             return self._get_morton_from_position(
-                data_file, account, account[idpos], regions, DLE, DRE)
+                data_file, count, account[idpos], regions, DLE, DRE)
 
     def _count_particles(self, data_file):
         npart = dict((self._ptypes[i], v)
@@ -52,7 +52,7 @@ def fake_gadget_binary(
         header_spec='default',
         field_spec='default',
         ptype_spec='default',
-        endian='', fmt=2
+        endian='', fmt=2, num_files=1
     ):
     """Generate a fake Gadget binary snapshot."""
     header = GadgetBinaryHeader(filename, header_spec)
@@ -71,8 +71,8 @@ def fake_gadget_binary(
             header = np.zeros(1, dtype=header_dtype)
             if i_header == 0:
                 header['Npart'] = npart
-                header['Nall'] = npart
-                header['NumFiles'] = 1
+                header['Nall'] = np.array(npart) * num_files
+                header['NumFiles'] = num_files
                 header['BoxSize'] = 1
                 header['HubbleParam'] = 1
             write_block(fp, header, endian, fmt, 'HEAD')
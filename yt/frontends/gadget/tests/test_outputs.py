@@ -20,8 +20,12 @@ import os
 import shutil
 import tempfile
 
+import numpy as np
+
 import yt
-from yt.testing import requires_file
+from yt.testing import \
+    assert_equal, \
+    requires_file
 from yt.utilities.answer_testing.framework import \
     data_dir_load, \
     requires_ds, \
@@ -61,6 +65,7 @@ def test_gadget_binary():
     header_specs = ['default', 'default+pad32', ['default', 'pad32']]
     curdir = os.getcwd()
     tmpdir = tempfile.mkdtemp()
+    os.chdir(tmpdir)
     for header_spec, endian, fmt in product(header_specs, '<>', [1, 2]):
         fake_snap = fake_gadget_binary(
             header_spec=header_spec,
@@ -120,3 +125,31 @@ def test_bigendian_field_access():
     ds = data_dir_load(BE_Gadget)
     data = ds.all_data()
     data['Halo', 'Velocities']
+
+
+def test_gadget_binary_selection():
+    curdir = os.getcwd()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        os.chdir(tmpdir)
+        center, radius = np.array([0.4, 0.5, 0.6]), 0.3
+        results = []
+        for endian in '<>':
+            np.random.seed(0x4d3d3d3)
+            fake_snap = fake_gadget_binary(endian=endian)
+            ds = yt.load(fake_snap)
+            ad = ds.all_data()
+            pos = ad["Gas", "Coordinates"].d
+            dens = ad["Gas", "Density"].d
+            sp = ds.sphere(center, radius)
+            mask = ((pos - center)**2).sum(axis=1) <= radius**2
+            assert_equal(sp["Gas", "Coordinates"].d, pos[mask])
+            assert_equal(sp["Gas", "Density"].d, dens[mask])
+            results.append((pos, dens, ad["Halo", "ParticleIDs"].d))
+            os.remove(fake_snap)
+        # Both byte orders read back the same values.
+        for little, big in zip(*results):
+            assert_equal(little, big)
+    finally:
+        os.chdir(curdir)
+        shutil.rmtree(tmpdir)
@@ -22,6 +22,7 @@ import stat
 import os
 import weakref
 
+from yt.config import ytcfg
 from yt.data_objects.data_containers import \
     YTSelectionContainer
 from yt.data_objects.static_output import \
@@ -40,6 +41,8 @@ from yt.geometry.particle_geometry_handler import \
     ParticleIndex
 from yt.utilities.cosmology import \
     Cosmology
+from yt.utilities.index_cache import \
+    file_stats, load_index_cache, save_index_cache
 from yt.utilities.logger import ytLogger as \
     mylog
 
@@ -122,10 +125,6 @@ class GadgetFOFHDF5File(HaloCatalogFile):
             self.header = \
               dict((str(field), val)
                    for field, val in f["Header"].attrs.items())
-            self.group_length_sum = f["Group/GroupLen"][()].sum() \
-              if "Group/GroupLen" in f else 0
-            self.group_subs_sum = f["Group/GroupNsubs"][()].sum() \
-              if "Group/GroupNsubs" in f else 0
         self.total_ids = self.header["Nids_ThisFile"]
         self.total_particles = \
           {"Group": self.header["Ngroups_ThisFile"],
@@ -186,6 +185,68 @@ class GadgetFOFDataset(Dataset):
     def halos_derived_field_list(self):
         return self._halos_ds.derived_field_list
 
+    def halo_member_data(self, ptype, identifiers, fields=None):
+        """
+        Read the member particles of many halos or subhalos at once.
+
+        This gives the same values as the member fields of halo
+        containers made with `ds.halo`, but the members of all the halos
+        are read in a single pass over the files of the catalog.
+
+        Parameters
+        ----------
+        ptype : string
+            The type of halo, either "Group" or "Subhalo".
+        identifiers : array of ints
+            The halo or subhalo ids.
+        fields : list of strings, optional
+            The member fields to read, such as "ID".  Defaults to all
+            member fields.
+
+        Returns
+        -------
+        data : dict
+            The values of each field for the members of all halos, one
+            halo after another in the order given.
+        offsets : array of ints
+            The members of halo identifiers[i] are
+            data[field][offsets[i]:offsets[i+1]].
+
+        Examples
+        --------
+
+        >>> import yt
+        >>> ds = yt.load("gadget_halos/data/groups_298/fof_subhalo_tab_298.0.hdf5")
+        >>> data, offsets = ds.halo_member_data("Group", [3, 1, 4], ["ID"])
+        >>> print(data["ID"][offsets[1]:offsets[2]])  # members of group 1
+
+        """
+        halos_ds = self._halos_ds
+        index = halos_ds.index
+        if ptype not in halos_ds.particle_types_raw:
+            raise RuntimeError("Possible halo types are %s, supplied \"%s\"." %
+                               (halos_ds.particle_types_raw, ptype))
+        identifiers = np.asarray(identifiers, dtype=np.int64)
+        if identifiers.size and \
+          (identifiers.min() < 0 or
+           identifiers.max() >= index.particle_count[ptype]):
+            raise RuntimeError("%s ids must be between 0 and %d." %
+                               (ptype, index.particle_count[ptype] - 1))
+        if fields is None:
+            fields = [field for my_ptype, field in halos_ds.field_list
+                      if my_ptype == ptype and
+                      (my_ptype, field) not in halos_ds.scalar_field_list]
+
+        halo_index = index._get_halo_member_index()
+        counts = halo_index["%s_count" % ptype][identifiers]
+        data = index.io._read_member_ranges(
+            halo_index["%s_start" % ptype][identifiers], counts, fields)
+        for field in fields:
+            data[field] = halos_ds.arr(
+                data[field], halos_ds.field_info[ptype, field].units)
+        offsets = np.append(0, counts.cumsum())
+        return data, offsets
+
     _instantiated_halo_ds = None
     @property
     def _halos_ds(self):
@@ -314,6 +375,13 @@ class GadgetFOFDataset(Dataset):
 class GadgetFOFHaloParticleIndex(GadgetFOFParticleIndex):
     def __init__(self, ds, dataset_type):
         self.real_ds = weakref.proxy(ds.real_ds)
+        # The member index of the halos is cached next to the first file
+        # of the catalog, so it only has to be built once.
+        self.halo_index_filename = None
+        if ytcfg.getboolean("yt", "cache_halo_index"):
+            self.halo_index_filename = os.path.join(
+                os.path.dirname(ds.real_ds.parameter_filename),
+                "%s.halo_index.npz" % ds.real_ds.basename.split(".", 1)[0])
         super(GadgetFOFHaloParticleIndex, self).__init__(ds, dataset_type)
 
     def _setup_geometry(self):
@@ -347,9 +415,74 @@ class GadgetFOFHaloParticleIndex(GadgetFOFParticleIndex):
         self._halo_id_end = self._halo_id_number.cumsum()
         self._halo_id_start = self._halo_id_end - self._halo_id_number
 
-        self._group_length_sum = \
-          np.array([data_file.group_length_sum
-                    for data_file in self.data_files])
+    _halo_member_index = None
+
+    def _get_halo_member_index(self):
+        """
+        Return a dict of arrays locating the member particles of every
+        halo and subhalo within the member arrays of the catalog, taken
+        together over all files.  For each halo type, "<ptype>_start"
+        and "<ptype>_count" give the first member and the number of
+        members.  "Group_first_subhalo" and "Subhalo_group" link groups
+        and their subhalos.
+
+        The index is read from the halo index cache if it is current,
+        and built from the halo lengths in all files otherwise.
+        """
+        if self._halo_member_index is not None:
+            return self._halo_member_index
+
+        key = self._halo_index_key()
+        index = load_index_cache(self.halo_index_filename, key)
+        if index is None:
+            index = self._create_halo_member_index()
+            save_index_cache(self.halo_index_filename, key, index)
+        self._halo_member_index = index
+        return index
+
+    _halo_index_version = 1
+
+    def _halo_index_key(self):
+        key = dict(version = np.array(self._halo_index_version))
+        key.update(file_stats([data_file.filename
+                               for data_file in self.data_files]))
+        return key
+
+    def _create_halo_member_index(self):
+        mylog.info("Building the member index of %d groups and %d subhalos.",
+                   self.particle_count["Group"],
+                   self.particle_count["Subhalo"])
+        columns = (("Group", "GroupLen"), ("Group", "GroupFirstSub"),
+                   ("Subhalo", "SubhaloLen"), ("Subhalo", "SubhaloGrNr"))
+        values = defaultdict(list)
+        for data_file in self.data_files:
+            with h5py.File(data_file.filename, "r") as f:
+                for ptype, field in columns:
+                    if data_file.total_particles[ptype] == 0: continue
+                    values[field].append(
+                        f[ptype][field][()].astype(np.int64))
+        for ptype, field in columns:
+            values[field] = np.concatenate(
+                [np.empty(0, dtype=np.int64)] + values[field])
+
+        group_count = values["GroupLen"]
+        group_start = group_count.cumsum() - group_count
+
+        # The members of the subhalos of a group follow one another from
+        # the start of the members of the group.
+        sub_count = values["SubhaloLen"]
+        sub_group = values["SubhaloGrNr"]
+        sub_offset = sub_count.cumsum() - sub_count
+        first_sub = values["GroupFirstSub"]
+        sub_start = group_start[sub_group] + sub_offset - \
+          sub_offset[first_sub[sub_group]]
+
+        return {"Group_start": group_start,
+                "Group_count": group_count,
+                "Group_first_subhalo": first_sub,
+                "Subhalo_start": sub_start,
+                "Subhalo_count": sub_count,
+                "Subhalo_group": sub_group}
 
     def _detect_output_fields(self):
         field_list = []
@@ -402,41 +535,6 @@ class GadgetFOFHaloParticleIndex(GadgetFOFParticleIndex):
         scalar_index = identifier - self._halo_index_start[ptype][i_scalar]
         return scalar_index
 
-    def _get_halo_values(self, ptype, identifiers, fields,
-                         f=None):
-        """
-        Get field values for halos.  IDs are likely to be
-        sequential (or at least monotonic), but not necessarily
-        all within the same file.
-
-        This does not do much to minimize file i/o, but with
-        halos randomly distributed across files, there's not
-        much more we can do.
-        """
-
-        # if a file is already open, don't open it again
-        filename = None if f is None \
-          else f.filename
-
-        data = defaultdict(lambda: np.empty(identifiers.size))
-        i_scalars = self._get_halo_file_indices(ptype, identifiers)
-        for i_scalar in np.unique(i_scalars):
-            target = i_scalars == i_scalar
-            scalar_indices = identifiers - \
-              self._halo_index_start[ptype][i_scalar]
-
-            # only open file if it's not already open
-            my_f = f if self.data_files[i_scalar].filename == filename \
-              else h5py.File(self.data_files[i_scalar].filename, "r")
-
-            for field in fields:
-                data[field][target] = \
-                  my_f[os.path.join(ptype, field)][()][scalar_indices[target]]
-
-            if self.data_files[i_scalar].filename != filename: my_f.close()
-
-        return data
-
 class GadgetFOFHaloDataset(Dataset):
     _index_class = GadgetFOFHaloParticleIndex
     _file_class = GadgetFOFHDF5File
@@ -564,14 +662,15 @@ class GagdetFOFHaloContainer(YTSelectionContainer):
         self._current_particle_type = ptype
         super(GagdetFOFHaloContainer, self).__init__(ds, {})
 
+        # offsets of the member particles of all halos
+        halo_index = self.index._get_halo_member_index()
+
         if ptype == "Subhalo" and isinstance(particle_identifier, tuple):
             self.group_identifier, self.subgroup_identifier = \
               particle_identifier
-            my_data = self.index._get_halo_values(
-                "Group", np.array([self.group_identifier]),
-                ["GroupFirstSub"])
-            self.particle_identifier = \
-              np.int64(my_data["GroupFirstSub"][0] + self.subgroup_identifier)
+            self.particle_identifier = np.int64(
+                halo_index["Group_first_subhalo"][self.group_identifier] +
+                self.subgroup_identifier)
         else:
             self.particle_identifier = particle_identifier
 
@@ -589,84 +688,27 @@ class GagdetFOFHaloContainer(YTSelectionContainer):
         self.scalar_index = self.index._get_halo_scalar_index(
             ptype, self.particle_identifier)
 
-        halo_fields = ["%sLen" % ptype]
-        if ptype == "Subhalo": halo_fields.append("SubhaloGrNr")
-        my_data = self.index._get_halo_values(
-            ptype, np.array([self.particle_identifier]),
-            halo_fields)
-        self.particle_number = np.int64(my_data["%sLen" % ptype][0])
+        self.particle_number = \
+          np.int64(halo_index["%s_count" % ptype][self.particle_identifier])
 
         if ptype == "Group":
             self.group_identifier = self.particle_identifier
-            id_offset = 0
-            # index of file that has scalar values for the group
-            g_scalar = i_scalar
-            group_index = self.scalar_index
 
         # If a subhalo, find the index of the parent.
         elif ptype == "Subhalo":
-            self.group_identifier = np.int64(my_data["SubhaloGrNr"][0])
-
-            # Find the file that has the scalar values for the parent group.
-            g_scalar = self.index._get_halo_file_indices(
-                "Group", [self.group_identifier])[0]
-
-            # index within halo arrays that corresponds to the paent group
-            group_index = self.index._get_halo_scalar_index(
-                "Group", self.group_identifier)
-
-            my_data = self.index._get_halo_values(
-                "Group", np.array([self.group_identifier]),
-                ["GroupNsubs", "GroupFirstSub"])
+            self.group_identifier = \
+              np.int64(halo_index["Subhalo_group"][self.particle_identifier])
             self.subgroup_identifier = self.particle_identifier - \
-              np.int64(my_data["GroupFirstSub"][0])
-            parent_subhalos = my_data["GroupNsubs"][0]
+              halo_index["Group_first_subhalo"][self.group_identifier]
 
-            mylog.debug("Subhalo %d is subgroup %s of %d in group %d." % \
+            mylog.debug("Subhalo %d is subgroup %s in group %d." % \
                         (self.particle_identifier, self.subgroup_identifier,
-                        parent_subhalos, self.group_identifier))
-
-            # ids of the sibling subhalos that come before this one
-            if self.subgroup_identifier > 0:
-                sub_ids = np.arange(
-                    self.particle_identifier - self.subgroup_identifier,
-                    self.particle_identifier)
-                my_data = self.index._get_halo_values(
-                    "Subhalo", sub_ids, ["SubhaloLen"])
-                id_offset = my_data["SubhaloLen"].sum(dtype=np.int64)
-            else:
-                id_offset = 0
-
-        # Calculate the starting index for the member particles.
-        # First, add up all the particles in the earlier files.
-        all_id_start = self.index._group_length_sum[:g_scalar].sum(dtype=np.int64)
-
-        # Now add the halos in this file that come before.
-        with h5py.File(self.index.data_files[g_scalar].filename, "r") as f:
-            all_id_start += f["Group"]["GroupLen"][:group_index].sum(dtype=np.int64)
-
-        # Add the subhalo offset.
-        all_id_start += id_offset
-
-        # indices of first and last files containing member particles
-        i_start = np.digitize([all_id_start],
-                              self.index._halo_id_start,
-                              right=False)[0] - 1
-        i_end = np.digitize([all_id_start+self.particle_number],
-                            self.index._halo_id_end,
-                            right=True)[0]
-        self.field_data_files = self.index.data_files[i_start:i_end+1]
-
-        # starting and ending indices for each file containing particles
-        self.field_data_start = \
-          (all_id_start -
-           self.index._halo_id_start[i_start:i_end+1]).clip(min=0)
-        self.field_data_start = self.field_data_start.astype(np.int64)
-        self.field_data_end = \
-          (all_id_start + self.particle_number -
-           self.index._halo_id_start[i_start:i_end+1]).clip(
-               max=self.index._halo_id_number[i_start:i_end+1])
-        self.field_data_end = self.field_data_end.astype(np.int64)
+                         self.group_identifier))
+
+        # starting index of the member particles within the member
+        # arrays of all files
+        self.member_start = \
+          np.int64(halo_index["%s_start" % ptype][self.particle_identifier])
 
         for attr in ["mass", "position", "velocity"]:
             setattr(self, attr, self[self.ptype, "particle_%s" % attr][0])
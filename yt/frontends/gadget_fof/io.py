@@ -251,33 +251,89 @@ class IOHandlerGadgetFOFHaloHDF5(IOHandlerGadgetFOFHDF5):
         return all_data
 
     def _read_member_fields(self, dobj, member_fields):
-        all_data = defaultdict(lambda: np.empty(dobj.particle_number,
-                                                dtype=np.float64))
-        if not member_fields: return all_data
-        field_start = 0
-        for i, data_file in enumerate(dobj.field_data_files):
-            start_index = dobj.field_data_start[i]
-            end_index = dobj.field_data_end[i]
-            pcount = end_index - start_index
-            if pcount == 0: continue
-            field_end = field_start + end_index - start_index
+        all_data = {}
+        for ptype, field_list in sorted(member_fields.items()):
+            data = self._read_member_ranges(
+                [dobj.member_start], [dobj.particle_number], field_list)
+            for field in field_list:
+                all_data[(ptype, field)] = data[field]
+        return all_data
+
+    # Ranges of members in a file separated by fewer than this many
+    # members are read together.
+    _member_read_gap = 4096
+
+    def _read_member_ranges(self, starts, counts, fields):
+        """
+        Read member particle fields for many halos at once.
+
+        Each halo is given by the index of its first member within the
+        member arrays of all files, taken together, and its number of
+        members.  The files are visited in order and each is opened only
+        once, with the members of all halos in it read in order of their
+        position in the file.
+
+        Returns a dict mapping each field to the members of all halos,
+        one after another in the order given.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        ends = starts + counts
+        # where the members of each halo go in the returned arrays
+        offsets = counts.cumsum() - counts
+        all_data = dict((field, np.empty(counts.sum(), dtype=np.float64))
+                        for field in fields)
+        if not fields: return all_data
+
+        index = self.ds.index
+        for i, data_file in enumerate(index.data_files):
+            file_start = index._halo_id_start[i]
+            file_end = index._halo_id_end[i]
+            if file_end == file_start: continue
+            in_file = (starts < file_end) & (ends > file_start) & (counts > 0)
+            if not in_file.any(): continue
+
+            # the part of each range in this file
+            lo = starts[in_file].clip(min=file_start) - file_start
+            hi = ends[in_file].clip(max=file_end) - file_start
+            dest = offsets[in_file] + \
+              (starts[in_file].clip(min=file_start) - starts[in_file])
+            order = np.argsort(lo, kind="mergesort")
+            lo, hi, dest = lo[order], hi[order], dest[order]
+
+            # Merge ranges that overlap or nearly touch into runs.
+            run_end = np.maximum.accumulate(hi)
+            new_run = np.ones(lo.size, dtype=bool)
+            new_run[1:] = lo[1:] > run_end[:-1] + self._member_read_gap
+            run_id = new_run.cumsum() - 1
+            run_lo = lo[new_run]
+            run_hi = run_end[np.append(np.flatnonzero(new_run[1:]),
+                                       lo.size - 1)]
+
+            # positions of the ranges in the runs read, taken together
+            run_length = run_hi - run_lo
+            run_buffer = run_length.cumsum() - run_length
+            length = hi - lo
+            piece = np.repeat(np.arange(lo.size), length)
+            within = np.arange(length.sum()) - \
+              np.repeat(length.cumsum() - length, length)
+            source = run_buffer[run_id][piece] + \
+              (lo - run_lo[run_id])[piece] + within
+            target = dest[piece] + within
+
             with h5py.File(data_file.filename, "r") as f:
-                for ptype, field_list in sorted(member_fields.items()):
-                    for field in field_list:
-                        field_data = all_data[(ptype, field)]
-                        if field in f["IDs"]:
-                            my_data = \
-                              f["IDs"][field][start_index:end_index].astype("float64")
-                        else:
-                            fname = field[:field.rfind("_")]
-                            my_data = \
-                              f["IDs"][fname][start_index:end_index].astype("float64")
-                            my_div = my_data.size / pcount
-                            if my_div > 1:
-                                findex = int(field[field.rfind("_") + 1:])
-                                my_data = my_data[:, findex]
-                        field_data[field_start:field_end] = my_data
-            field_start = field_end
+                for field in fields:
+                    if field in f["IDs"]:
+                        dset = f["IDs"][field]
+                        findex = None
+                    else:
+                        dset = f["IDs"][field[:field.rfind("_")]]
+                        findex = int(field[field.rfind("_") + 1:])
+                    buf = np.concatenate(
+                        [dset[r_lo:r_hi] for r_lo, r_hi in zip(run_lo, run_hi)])
+                    if findex is not None and buf.ndim > 1:
+                        buf = buf[:, findex]
+                    all_data[field][target] = buf[source]
         return all_data
 
     def _read_particle_fields(self, dobj, ptf):
@@ -13,14 +13,21 @@ GadgetFOF frontend tests using gadget_fof datasets
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
 import numpy as np
 
+from yt.config import ytcfg
+from yt.convenience import load
 from yt.frontends.gadget_fof.api import \
     GadgetFOFDataset
 from yt.testing import \
     requires_file, \
     assert_equal, \
     assert_array_equal
+from yt.utilities.on_demand_imports import _h5py as h5py
 from yt.utilities.answer_testing.framework import \
     FieldValuesTest, \
     requires_ds, \
@@ -112,3 +119,97 @@ def test_3file_halo():
     halo = ds.halo("Group", 6)
     halo["member_ids"]
     assert True
+
+def _write_fake_catalog(prefix, group_files, sub_files, id_splits):
+    """
+    Write a catalog with the given numbers of groups and subhalos in each
+    file, with the member ids split between the files at *id_splits*.
+    Returns the member ids of each group and subhalo.
+    """
+    rs = np.random.RandomState(4)
+    ngroups = sum(group_files)
+    group_len = rs.randint(10, 20, size=ngroups)
+    # up to three subhalos in each group
+    group_nsubs = np.zeros(ngroups, dtype=np.int64)
+    for i in rs.randint(0, ngroups, size=sum(sub_files)):
+        group_nsubs[i if group_nsubs[i] < 3 else group_nsubs.argmin()] += 1
+    group_first_sub = np.where(group_nsubs > 0,
+                               group_nsubs.cumsum() - group_nsubs, -1)
+    sub_group = np.repeat(np.arange(ngroups), group_nsubs)
+    sub_len = rs.randint(1, 4, size=sub_group.size)
+    sub_offset = np.concatenate([np.arange(n) for n in group_nsubs]).astype(int)
+    ids = rs.permutation(group_len.sum()) + 1000
+
+    group_start = group_len.cumsum() - group_len
+    members = {"Group": [ids[s:s + n] for s, n in zip(group_start, group_len)],
+               "Subhalo": []}
+    for grnr, i, n in zip(sub_group, sub_offset, sub_len):
+        start = group_start[grnr] + sub_len[group_first_sub[grnr]:][:i].sum()
+        members["Subhalo"].append(ids[start:start + n])
+
+    columns = {"Group": {"GroupLen": group_len,
+                         "GroupNsubs": group_nsubs,
+                         "GroupFirstSub": group_first_sub,
+                         "GroupMass": group_len * 1.,
+                         "GroupPos": rs.random_sample((ngroups, 3)),
+                         "GroupVel": rs.random_sample((ngroups, 3))},
+               "Subhalo": {"SubhaloLen": sub_len,
+                           "SubhaloGrNr": sub_group,
+                           "SubhaloMass": sub_len * 1.,
+                           "SubhaloPos": rs.random_sample((sub_len.size, 3)),
+                           "SubhaloVel": rs.random_sample((sub_len.size, 3))}}
+    starts = {"Group": np.cumsum([0] + group_files),
+              "Subhalo": np.cumsum([0] + sub_files),
+              "IDs": [0] + id_splits + [ids.size]}
+    for i in range(len(group_files)):
+        with h5py.File("%s.%d.hdf5" % (prefix, i), "w") as f:
+            f.create_group("Header").attrs.update(
+                {"Ngroups_ThisFile": group_files[i],
+                 "Nsubgroups_ThisFile": sub_files[i],
+                 "Nids_ThisFile": starts["IDs"][i + 1] - starts["IDs"][i],
+                 "NumFiles": len(group_files), "BoxSize": 1.,
+                 "Redshift": 0., "OmegaLambda": 0.7, "Omega0": 0.3,
+                 "HubbleParam": 0.7})
+            for ptype, fields in columns.items():
+                g = f.create_group(ptype)
+                lo, hi = starts[ptype][i:i + 2]
+                if lo == hi: continue
+                for field, vals in fields.items():
+                    g.create_dataset(field, data=vals[lo:hi])
+            lo, hi = starts["IDs"][i:i + 2]
+            if lo < hi:
+                f.create_group("IDs").create_dataset("ID", data=ids[lo:hi])
+    return members
+
+def test_halo_member_index():
+    tmpdir = tempfile.mkdtemp()
+    prefix = os.path.join(tmpdir, "fof_subhalo_tab_000")
+    # ids of one group may span all files, including an empty one
+    members = _write_fake_catalog(prefix, [5, 0, 7, 0], [2, 3, 1, 0],
+                                  [20, 20, 30])
+    cache_fn = "%s.halo_index.npz" % prefix
+    old = ytcfg.get("yt", "cache_halo_index")
+    try:
+        for cache in ["False", "True", "True"]:
+            ytcfg["yt", "cache_halo_index"] = cache
+            ds = load("%s.0.hdf5" % prefix)
+            for ptype in ["Group", "Subhalo"]:
+                for hid, my_ids in enumerate(members[ptype]):
+                    halo = ds.halo(ptype, hid)
+                    assert_equal(halo.particle_number, my_ids.size)
+                    assert_array_equal(halo["member_ids"], my_ids)
+
+                hids = np.array([3, 0, 3, len(members[ptype]) - 1, 1])
+                data, offsets = ds.halo_member_data(ptype, hids)
+                for i, hid in enumerate(hids):
+                    assert_array_equal(
+                        data["ID"][offsets[i]:offsets[i + 1]],
+                        members[ptype][hid])
+
+            subhalo = ds.halo("Subhalo", (int(halo.group_identifier), 0))
+            assert_equal(subhalo.particle_identifier,
+                         len(members["Subhalo"]) - 1)
+            assert_equal(os.path.exists(cache_fn), cache == "True")
+    finally:
+        ytcfg["yt", "cache_halo_index"] = old
+        shutil.rmtree(tmpdir)
@@ -86,19 +86,12 @@ class HTTPStreamDataset(ParticleDataset):
 
         self.file_count = header['num_files']
 
-    def _set_units(self):
-        length_unit = float(self.parameters['units']['length'])
-        time_unit = float(self.parameters['units']['time'])
-        mass_unit = float(self.parameters['units']['mass'])
-        density_unit = mass_unit / length_unit ** 3
-        velocity_unit = length_unit / time_unit
-        self._unit_base = {}
-        self._unit_base['cm'] = 1.0/length_unit
-        self._unit_base['s'] = 1.0/time_unit
-        super(HTTPStreamDataset, self)._set_units()
-        self.conversion_factors["velocity"] = velocity_unit
-        self.conversion_factors["mass"] = mass_unit
-        self.conversion_factors["density"] = density_unit
+    def _set_code_unit_attributes(self):
+        units = self.parameters['units']
+        self.length_unit = self.quan(float(units['length']), "cm")
+        self.time_unit = self.quan(float(units['time']), "s")
+        self.mass_unit = self.quan(float(units['mass']), "g")
+        self.velocity_unit = self.length_unit / self.time_unit
 
     @classmethod
     def _is_valid(self, *args, **kwargs):
@@ -15,8 +15,14 @@ from __future__ import print_function
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+import hashlib
 import numpy as np
+import os
+import tempfile
+import threading
+from multiprocessing.pool import ThreadPool
 
+from yt.config import ytcfg
 from yt.funcs import \
     get_requests, \
     mylog
@@ -25,31 +31,133 @@ from yt.utilities.io_handler import \
 from yt.utilities.lib.geometry_utils import \
     compute_morton
 
+class HTTPStreamCache(object):
+    """
+    An on-disk cache of the content fetched from a particle stream, keyed
+    by URL and byte range and stored along with the ETag the server sent
+    with it.
+    """
+    def __init__(self, path):
+        self.path = path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def _filename(self, url, byte_range):
+        key = url
+        if byte_range is not None:
+            key += "#%d-%d" % byte_range
+        return os.path.join(self.path,
+                            hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+    def get(self, url, byte_range=None):
+        """Return the ETag and content cached for url, or None."""
+        try:
+            with open(self._filename(url, byte_range), "rb") as f:
+                etag = f.readline().rstrip(b"\n").decode("utf-8")
+                return etag, f.read()
+        except (IOError, OSError):
+            return None
+
+    def put(self, url, byte_range, etag, content):
+        # Entries are written to a temporary file and then moved into place,
+        # so that a reader never sees a partially written entry.  Failing to
+        # write the cache is not an error.
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.path)
+            with os.fdopen(fd, "wb") as f:
+                f.write(etag.encode("utf-8") + b"\n")
+                f.write(content)
+            os.rename(tmp, self._filename(url, byte_range))
+        except (IOError, OSError) as e:
+            mylog.warning("Could not write to HTTP stream cache %s: %s",
+                          self.path, e)
+
 class IOHandlerHTTPStream(BaseIOHandler):
     _dataset_type = "http_particle_stream"
     _vector_fields = ("Coordinates", "Velocity", "Velocities")
 
     def __init__(self, ds):
-        if get_requests() is None:
+        requests = get_requests()
+        if requests is None:
             raise ImportError(
                 "This functionality depends on the requests package")
         self._url = ds.base_url
-        # This should eventually manage the IO and cache it
         self.total_bytes = 0
+        # Data files are fetched concurrently by http_stream_threads threads,
+        # which share a pool of connections to the server.
+        nthreads = max(ytcfg.getint("yt", "http_stream_threads"), 1)
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=nthreads)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        cache_dir = ytcfg.get("yt", "http_stream_cache_dir")
+        self._cache = HTTPStreamCache(cache_dir) if cache_dir else None
+        # Cached entries are only revalidated with the server the first time
+        # they are used.
+        self._validated = set()
+        self._lock = threading.Lock()
         super(IOHandlerHTTPStream, self).__init__(ds)
 
-    def _open_stream(self, data_file, field):
-        # This does not actually stream yet!
+    def _open_stream(self, data_file, field, byte_range=None):
+        """
+        Fetch the content of field for data_file, or only the bytes in the
+        inclusive range byte_range if it is given.
+        """
         ftype, fname = field
-        s = "%s/%s/%s/%s" % (self._url,
-            data_file.file_id, ftype, fname)
-        mylog.info("Loading URL %s", s)
-        requests = get_requests()
-        resp = requests.get(s)
-        if resp.status_code != 200:
-            raise RuntimeError
-        self.total_bytes += len(resp.content)
-        return resp.content
+        url = "%s/%s/%s/%s" % (self._url, data_file.file_id, ftype, fname)
+        key = (url, byte_range)
+        headers = {}
+        if byte_range is not None:
+            headers["Range"] = "bytes=%d-%d" % byte_range
+        cached = None
+        if self._cache is not None:
+            cached = self._cache.get(url, byte_range)
+            if cached is not None:
+                if key in self._validated:
+                    return cached[1]
+                headers["If-None-Match"] = cached[0]
+        mylog.debug("Loading URL %s %s", url, headers.get("Range", ""))
+        resp = self._session.get(url, headers=headers)
+        if resp.status_code == 304:
+            self._validated.add(key)
+            return cached[1]
+        if resp.status_code not in (200, 206):
+            raise RuntimeError("Could not fetch %s (HTTP status %s)" %
+                               (url, resp.status_code))
+        content = resp.content
+        with self._lock:
+            self.total_bytes += len(content)
+        if byte_range is not None and resp.status_code == 200:
+            # The server does not support ranges and sent everything.
+            content = content[byte_range[0]:byte_range[1] + 1]
+        etag = resp.headers.get("ETag")
+        if self._cache is not None and etag is not None:
+            self._cache.put(url, byte_range, etag, content)
+            self._validated.add(key)
+        return content
+
+    def _map_data_files(self, func, data_files):
+        # Yields func(data_file) for each data file in order, fetching up to
+        # http_stream_threads data files at once.
+        nthreads = min(ytcfg.getint("yt", "http_stream_threads"),
+                       len(data_files))
+        if nthreads <= 1:
+            for data_file in data_files:
+                yield func(data_file)
+            return
+        pool = ThreadPool(nthreads)
+        try:
+            for rv in pool.imap(func, data_files):
+                yield rv
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _read_coordinates(self, data_file, ptype):
+        s = self._open_stream(data_file, (ptype, "Coordinates"))
+        c = np.frombuffer(s, dtype="float64")
+        c.shape = (c.shape[0] // 3, 3)
+        return c
 
     def _identify_fields(self, data_file):
         f = []
@@ -63,11 +171,11 @@ class IOHandlerHTTPStream(BaseIOHandler):
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files):
-            for ptype in ptf:
-                s = self._open_stream(data_file, (ptype, "Coordinates"))
-                c = np.frombuffer(s, dtype="float64")
-                c.shape = (c.shape[0]/3.0, 3)
+        def _coords(data_file):
+            return [(ptype, self._read_coordinates(data_file, ptype))
+                    for ptype in ptf]
+        for coords in self._map_data_files(_coords, sorted(data_files)):
+            for ptype, c in coords:
                 yield ptype, (c[:,0], c[:,1], c[:,2])
 
     def _read_particle_fields(self, chunks, ptf, selector):
@@ -76,22 +184,38 @@ class IOHandlerHTTPStream(BaseIOHandler):
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files):
+        def _fields(data_file):
+            rv = []
             for ptype, field_list in sorted(ptf.items()):
-                s = self._open_stream(data_file, (ptype, "Coordinates"))
-                c = np.frombuffer(s, dtype="float64")
-                c.shape = (c.shape[0]/3.0, 3)
+                c = self._read_coordinates(data_file, ptype)
                 mask = selector.select_points(
                             c[:,0], c[:,1], c[:,2], 0.0)
+                if mask is None or not mask.any(): continue
+                # Only the span of particles from the first to the last
+                # selected one is fetched.
+                ind = np.where(mask)[0]
+                first, last = ind[0], ind[-1]
+                if first > 0 or last < c.shape[0] - 1:
+                    mask = mask[first:last + 1]
+                else:
+                    first = None
                 del c
-                if mask is None: continue
                 for field in field_list:
-                    s = self._open_stream(data_file, (ptype, field))
+                    ncomp = 3 if field in self._vector_fields else 1
+                    byte_range = None
+                    if first is not None:
+                        byte_range = (first * ncomp * 8,
+                                      (last + 1) * ncomp * 8 - 1)
+                    s = self._open_stream(data_file, (ptype, field),
+                                          byte_range)
                     c = np.frombuffer(s, dtype="float64")
-                    if field in self._vector_fields:
-                        c.shape = (c.shape[0]/3.0, 3)
-                    data = c[mask, ...]
-                    yield (ptype, field), data
+                    if ncomp > 1:
+                        c.shape = (c.shape[0] // ncomp, ncomp)
+                    rv.append(((ptype, field), c[mask, ...]))
+            return rv
+        for fields in self._map_data_files(_fields, sorted(data_files)):
+            for field, data in fields:
+                yield field, data
 
     def _initialize_index(self, data_file, regions):
         header = self.ds.parameters
@@ -100,9 +224,7 @@ class IOHandlerHTTPStream(BaseIOHandler):
         morton = np.empty(pcount, dtype='uint64')
         ind = 0
         for ptype in ptypes:
-            s = self._open_stream(data_file, (ptype, "Coordinates"))
-            c = np.frombuffer(s, dtype="float64")
-            c.shape = (c.shape[0]/3.0, 3)
+            c = self._read_coordinates(data_file, ptype)
             regions.add_data_file(c, data_file.file_id,
                                   data_file.ds.filter_bbox)
             morton[ind:ind+c.shape[0]] = compute_morton(
@@ -0,0 +1,154 @@
+"""
+HTTP particle stream frontend tests
+
+
+
+"""
+
+#-----------------------------------------------------------------------------
+# Copyright (c) 2019, yt Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+import hashlib
+import json
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+from yt.config import ytcfg
+from yt.extern.six.moves import \
+    BaseHTTPServer, \
+    socketserver
+from yt.frontends.http_stream.data_structures import \
+    HTTPStreamDataset
+from yt.frontends.http_stream.io import \
+    IOHandlerHTTPStream
+from yt.testing import \
+    assert_equal, \
+    requires_module
+
+
+class _StreamServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class _StreamHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    # Serves the server's content dict, honouring Range and If-None-Match
+    # headers, and records each request it answers.
+    def do_GET(self):
+        content = self.server.content.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        etag = '"%s"' % hashlib.sha1(content).hexdigest()
+        byte_range = self.headers.get("Range")
+        self.server.requests.append((self.path, byte_range))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        if byte_range is not None:
+            first, last = [int(v) for v in
+                           byte_range.split("=")[1].split("-")]
+            content = content[first:last + 1]
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def _fake_stream_content(num_files=4, num_particles=1000):
+    # The first quarter of the particles in each file have x < 0.25.
+    np.random.seed(0x4d3d3d3)
+    content = {}
+    particles = []
+    for i in range(num_files):
+        p = dict(Coordinates=np.random.random((num_particles, 3)),
+                 Velocities=np.random.random((num_particles, 3)),
+                 Mass=np.random.random(num_particles))
+        p["Coordinates"][:, 0].sort()
+        for field, data in p.items():
+            content["/%d/io/%s" % (i, field)] = data.tobytes()
+        particles.append(p)
+    header = dict(
+        particle_count=dict((i, {"io": num_particles})
+                            for i in range(num_files)),
+        field_list=[("io", f) for f in ("Coordinates", "Velocities", "Mass")],
+        domain_left_edge=[0.0, 0.0, 0.0], domain_right_edge=[1.0, 1.0, 1.0],
+        current_time=0.0, cosmological_simulation=0, current_redshift=0.0,
+        omega_lambda=0.0, omega_matter=0.0, hubble_constant=0.0,
+        num_files=num_files, units=dict(length=1.0, time=1.0, mass=1.0))
+    content["/yt_index.json"] = json.dumps(header).encode("utf-8")
+    return content, particles
+
+
+@requires_module("requests")
+def test_http_stream():
+    server = _StreamServer(("127.0.0.1", 0), _StreamHandler)
+    server.content, particles = _fake_stream_content()
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    cache_dir = tempfile.mkdtemp()
+    old = dict((opt, ytcfg.get("yt", opt)) for opt in
+               ("http_stream_threads", "http_stream_cache_dir"))
+    try:
+        ds = HTTPStreamDataset("http://127.0.0.1:%d" % server.server_port)
+        pos = np.concatenate([p["Coordinates"] for p in particles])
+        mass = np.concatenate([p["Mass"] for p in particles])
+        vel = np.concatenate([p["Velocities"] for p in particles])
+        sel = pos[:, 0] < 0.25
+        for nthreads in ["1", "4"]:
+            ytcfg["yt", "http_stream_threads"] = nthreads
+            del server.requests[:]
+            reg = ds.r[0.0:0.25, :, :]
+            order = np.argsort(reg["io", "Mass"].d)
+            assert_equal(reg["io", "Mass"].d[order], np.sort(mass[sel]))
+            assert_equal(reg["io", "particle_velocity_x"].d[order],
+                         vel[sel][np.argsort(mass[sel]), 0])
+            # Only the selected span of each file is fetched.
+            ranges = [r for path, r in server.requests
+                      if path.endswith("Mass")]
+            assert_equal(len(ranges), len(particles))
+            assert all(r is not None for r in ranges)
+
+        # Content fetched through the cache is revalidated with the server
+        # by new handlers, and only sent again if it has changed.
+        ytcfg["yt", "http_stream_cache_dir"] = cache_dir
+        data_file = ds.index.data_files[0]
+        io = IOHandlerHTTPStream(ds)
+        io._open_stream(data_file, ("io", "Mass"))
+        io._open_stream(data_file, ("io", "Mass"))
+        assert_equal(io.total_bytes, particles[0]["Mass"].nbytes)
+        io = IOHandlerHTTPStream(ds)
+        del server.requests[:]
+        s = io._open_stream(data_file, ("io", "Mass"))
+        assert_equal(np.frombuffer(s, dtype="float64"), particles[0]["Mass"])
+        assert_equal(io.total_bytes, 0)
+        assert_equal(len(server.requests), 1)
+        server.content["/0/io/Mass"] = (2 * particles[0]["Mass"]).tobytes()
+        io = IOHandlerHTTPStream(ds)
+        s = io._open_stream(data_file, ("io", "Mass"))
+        assert_equal(np.frombuffer(s, dtype="float64"),
+                     2 * particles[0]["Mass"])
+        assert_equal(io.total_bytes, particles[0]["Mass"].nbytes)
+    finally:
+        for opt, value in old.items():
+            ytcfg["yt", opt] = value
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(cache_dir)
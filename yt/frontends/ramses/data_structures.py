@@ -22,6 +22,7 @@ import weakref
 from collections import defaultdict
 from glob import glob
 
+from yt.config import ytcfg
 from yt.extern.six import string_types
 from yt.funcs import \
     mylog, \
@@ -36,11 +37,13 @@ from yt.data_objects.octree_subset import \
     OctreeSubset
 from yt.data_objects.particle_filters import add_particle_filter
 
+from yt.utilities.index_cache import \
+    file_stats, load_index_cache, save_index_cache
 from yt.utilities.physical_constants import mp, kb
 from .definitions import ramses_header, field_aliases, particle_families
 from .fields import \
     RAMSESFieldInfo, _X
-from .hilbert import get_cpu_list
+from .hilbert import get_cpu_list, get_selector_cpu_list
 from .particle_handlers import get_particle_handlers
 from .field_handlers import get_field_handlers
 from yt.utilities.cython_fortran_utils import FortranFile as fpu
@@ -51,13 +54,13 @@ from yt.arraytypes import blankRecordArray
 from yt.utilities.lib.cosmology_time import \
     friedman
 
-from .io_utils import read_amr, fill_hydro
+from .io_utils import read_amr, add_amr_octs, fill_hydro
 
 class RAMSESDomainFile(object):
     _last_mask = None
     _last_selector_id = None
 
-    def __init__(self, ds, domain_id):
+    def __init__(self, ds, domain_id, cache_amr=False):
         self.ds = ds
         self.domain_id = domain_id
 
@@ -101,11 +104,48 @@ class RAMSESDomainFile(object):
             ph.read_header()
             # self._add_ptype(ph.ptype)
 
-        # Load the AMR structure
-        self._read_amr()
+        # The AMR structure is loaded when it is first needed, from the AMR
+        # structure cache next to the AMR file if it is still valid.
+        self.amr_cache_filename = None
+        if cache_amr:
+            self.amr_cache_filename = "%s.npz" % self.amr_fn
+        self._amr_records = None
+        self._from_amr_cache = False
 
     _hydro_offset = None
     _level_count = None
+    _oct_handler = None
+    _max_level = None
+
+    @property
+    def oct_handler(self):
+        if self._oct_handler is None:
+            self._load_amr()
+        return self._oct_handler
+
+    @property
+    def max_level(self):
+        if self._oct_handler is None:
+            self._load_amr()
+        return self._max_level
+
+    @property
+    def amr_loaded(self):
+        return self._oct_handler is not None
+
+    def _load_amr(self):
+        cache = load_index_cache(self.amr_cache_filename,
+                                 self._amr_cache_key())
+        self._from_amr_cache = cache is not None
+        if self._from_amr_cache:
+            self._load_amr_cache(cache)
+            return
+        if self.amr_cache_filename is not None:
+            self._amr_records = []
+        self._read_amr()
+        if self.amr_cache_filename is not None:
+            save_index_cache(self.amr_cache_filename, self._amr_cache_key(),
+                             self._amr_cache_entries())
 
     def __repr__(self):
         return "RAMSESDomainFile: %i" % self.domain_id
@@ -161,6 +201,15 @@ class RAMSESDomainFile(object):
         self.amr_offset = f.tell()
         self.local_oct_count = hvals['numbl'][self.ds.min_level:, self.domain_id - 1].sum()
         self.total_oct_count = hvals['numbl'][self.ds.min_level:,:].sum(axis=0)
+        # Don't keep the file open until the octs are read
+        f.close()
+        del self._amr_file
+
+    def _allocate_oct_handler(self):
+        self._oct_handler = RAMSESOctreeContainer(self.ds.domain_dimensions/2,
+                self.ds.domain_left_edge, self.ds.domain_right_edge)
+        root_nodes = self.amr_header['numbl'][self.ds.min_level,:].sum()
+        self._oct_handler.allocate_domains(self.total_oct_count, root_nodes)
 
     def _read_amr(self):
         """Open the oct file, read in octs level-by-level.
@@ -169,10 +218,7 @@ class RAMSESDomainFile(object):
            The most important is finding all the information to feed
            oct_handler.add
         """
-        self.oct_handler = RAMSESOctreeContainer(self.ds.domain_dimensions/2,
-                self.ds.domain_left_edge, self.ds.domain_right_edge)
-        root_nodes = self.amr_header['numbl'][self.ds.min_level,:].sum()
-        self.oct_handler.allocate_domains(self.total_oct_count, root_nodes)
+        self._allocate_oct_handler()
         mylog.debug("Reading domain AMR % 4i (%0.3e, %0.3e)",
             self.domain_id, self.total_oct_count.sum(), self.ngridbound.sum())
 
@@ -180,14 +226,69 @@ class RAMSESDomainFile(object):
         f.seek(self.amr_offset)
 
         min_level = self.ds.min_level
-        max_level = read_amr(f, self.amr_header, self.ngridbound, min_level, self.oct_handler)
+        max_level = read_amr(f, self.amr_header, self.ngridbound, min_level,
+                             self._oct_handler, self._amr_records)
 
-        self.max_level = max_level
-        self.oct_handler.finalize()
+        self._max_level = max_level
+        self._oct_handler.finalize()
 
         # Close AMR file
         f.close()
 
+    # Bump this whenever the layout of the AMR structure cache changes.
+    _amr_cache_version = 2
+
+    def _amr_cache_key(self):
+        # The cache is only valid for the files of this domain as they were
+        # when it was written.
+        key = dict(version = np.array(self._amr_cache_version),
+                   ncpu = np.array(self.ds['ncpu']),
+                   min_level = np.array(self.ds.min_level),
+                   dimensionality = np.array(self.ds.dimensionality),
+                   ftypes = np.array([fh.ftype for fh in self.field_handlers],
+                                     dtype="U"))
+        key.update(file_stats([self.amr_fn] +
+                              [fh.fname for fh in self.field_handlers]))
+        return key
+
+    def _load_amr_cache(self, cache):
+        """Rebuild the oct handler of this domain and the offsets of its
+           fluid files from the AMR structure cache.
+        """
+        self._allocate_oct_handler()
+        self._max_level = add_amr_octs(self._oct_handler,
+                                       cache["oct_domains"],
+                                       cache["oct_levels"],
+                                       cache["oct_counts"],
+                                       cache["positions"])
+        self._oct_handler.finalize()
+        for fh in self.field_handlers:
+            fh._offset = cache["offset_" + fh.ftype]
+            fh._level_count = cache["level_count_" + fh.ftype]
+
+    def _amr_cache_entries(self):
+        """The entries of the AMR structure cache for this domain: the octs
+           read from its AMR file, and the level offsets of its fluid files.
+        """
+        records = self._amr_records
+        self._amr_records = None
+        data = {}
+        data["oct_domains"] = np.array(
+            [r[0] for r in records], dtype="int64")
+        data["oct_levels"] = np.array(
+            [r[1] for r in records], dtype="int64")
+        data["oct_counts"] = np.array(
+            [r[2].shape[0] for r in records], dtype="int64")
+        if len(records) > 0:
+            data["positions"] = np.concatenate(
+                [r[2] for r in records])
+        else:
+            data["positions"] = np.empty((0, 3), dtype="float64")
+        for fh in self.field_handlers:
+            data["offset_" + fh.ftype] = fh.offset
+            data["level_count_" + fh.ftype] = fh.level_count
+        return data
+
     def included(self, selector):
         if getattr(selector, "domain_id", None) is not None:
             return selector.domain_id == self.domain_id
@@ -199,23 +300,33 @@ class RAMSESDomainSubset(OctreeSubset):
     _domain_offset = 1
     _block_reorder = "F"
 
-    def fill(self, fd, fields, selector, file_handler):
+    def count_selected(self, selector):
+        """Return the number of cells of this domain selected by selector."""
+        return selector.count_oct_cells(self.oct_handler, self.domain_id)
+
+    def fill(self, fd, fields, selector, file_handler, tr=None):
+        """Read fields from fd for the cells selected by selector.  If tr is
+           given, it maps the field names to arrays with one element per
+           selected cell that the data is read into; otherwise new arrays
+           are allocated.
+        """
         ndim = self.ds.dimensionality
         # Here we get a copy of the file, which we skip through and read the
         # bits we want.
         oct_handler = self.oct_handler
         all_fields = [f for ft, f in file_handler.field_list]
         fields = [f for ft, f in fields]
-        tr = {}
-        cell_count = selector.count_oct_cells(self.oct_handler, self.domain_id)
+        if tr is None:
+            cell_count = self.count_selected(selector)
+            # Initializing data container
+            tr = dict((field, np.zeros(cell_count, 'float64'))
+                      for field in fields)
+        else:
+            cell_count = tr[fields[0]].size
 
         levels, cell_inds, file_inds = self.oct_handler.file_index_octs(
             selector, self.domain_id, cell_count)
 
-        # Initializing data container
-        for field in fields:
-            tr[field] = np.zeros(cell_count, 'float64')
-
         fill_hydro(fd, file_handler.offset,
                    file_handler.level_count, levels, cell_inds,
                    file_inds, ndim, all_fields, fields, tr,
@@ -241,11 +352,18 @@ class RAMSESIndex(OctreeIndex):
         else:
             cpu_list = range(self.dataset['ncpu'])
 
-        self.domains = [RAMSESDomainFile(self.dataset, i + 1)
+        # The octs of each domain are only read, or loaded from its AMR
+        # structure cache, once a selection needs them.
+        cache_amr = ytcfg.getboolean("yt", "cache_ramses_index")
+        self.domains = [RAMSESDomainFile(self.dataset, i + 1,
+                                         cache_amr=cache_amr)
                         for i in cpu_list]
         total_octs = sum(dom.local_oct_count #+ dom.ngridbound.sum()
                          for dom in self.domains)
-        self.max_level = max(dom.max_level for dom in self.domains)
+        # The number of octs of every domain at each level is in the header
+        # of each AMR file.
+        numbl = self.domains[0].amr_header['numbl'][self.dataset.min_level:]
+        self.max_level = int(np.nonzero(numbl.sum(axis=1))[0].max())
         self.num_grids = total_octs
 
     def _detect_output_fields(self):
@@ -271,10 +389,28 @@ class RAMSESIndex(OctreeIndex):
 
         self.field_list = self.particle_field_list + self.fluid_field_list
 
+    def _candidate_domains(self, selector):
+        """Return the domains that may hold cells selected by selector.
+
+        With Hilbert ordering, the domains whose Hilbert keys cover the
+        regions of a coarse mesh intersecting the selector are returned, so
+        that the octs of the others are never read.  Otherwise all domains
+        are returned.
+        """
+        if getattr(selector, "domain_id", None) is not None or \
+          len(self.dataset.hilbert_indices) == 0 or \
+          self.dataset.dimensionality != 3:
+            return self.domains
+        cpus = set(get_selector_cpu_list(self.dataset, selector))
+        domains = [dom for dom in self.domains if dom.domain_id - 1 in cpus]
+        mylog.debug("Hilbert keys restrict the selection to %s of %s domains",
+                    len(domains), len(self.domains))
+        return domains
+
     def _identify_base_chunk(self, dobj):
         if getattr(dobj, "_chunk_info", None) is None:
-            domains = [dom for dom in self.domains if
-                       dom.included(dobj.selector)]
+            domains = [dom for dom in self._candidate_domains(dobj.selector)
+                       if dom.included(dobj.selector)]
             base_region = getattr(dobj, "base_region", dobj)
             if len(domains) > 1:
                 mylog.debug("Identified %s intersecting domains", len(domains))
@@ -56,44 +56,25 @@ def hilbert3d(X, bit_length):
         10, 3, 2, 6,10, 3, 4, 4,
         6, 1, 7, 0, 5, 2, 4, 3]).reshape(12, 2, 8).T
 
-    x_bit_mask, y_bit_mask, z_bit_mask = [np.zeros(bit_length, dtype=bool) for _ in range(3)]
-    i_bit_mask = np.zeros(3*bit_length, dtype=bool)
-
+    X = np.asarray(X, dtype=np.int64)
     npoint = X.shape[0]
     order = np.zeros(npoint)
-
-    # Convert positions to binary
-    for ip in range(npoint):
-        for i in range(bit_length):
-            mask = 0b01 << i
-            x_bit_mask[i] = X[ip, 0] & mask
-            y_bit_mask[i] = X[ip, 1] & mask
-            z_bit_mask[i] = X[ip, 2] & mask
-
-        for i in range(bit_length):
-            # Interleave bits
-            i_bit_mask[3*i+2] = x_bit_mask[i]
-            i_bit_mask[3*i+1] = y_bit_mask[i]
-            i_bit_mask[3*i  ] = z_bit_mask[i]
-
-        # Build Hilbert ordering using state diagram
-        cstate = 0
-        for i in range(bit_length-1, -1, -1):
-            sdigit = (4 * i_bit_mask[3*i+2] +
-                      2 * i_bit_mask[3*i+1] +
-                      1 * i_bit_mask[3*i  ])
-            nstate = state_diagram[sdigit, 0, cstate]
-            hdigit = state_diagram[sdigit, 1, cstate]
-
-            i_bit_mask[3*i+2] = hdigit & 0b100
-            i_bit_mask[3*i+1] = hdigit & 0b010
-            i_bit_mask[3*i  ] = hdigit & 0b001
-
-            cstate = nstate
+    cstate = np.zeros(npoint, dtype=np.int64)
+
+    # Build Hilbert ordering using state diagram, from the most significant
+    # bit down, for all the points at once
+    for i in range(bit_length-1, -1, -1):
+        # Interleave bits
+        sdigit = (4 * ((X[:, 0] >> i) & 1) +
+                  2 * ((X[:, 1] >> i) & 1) +
+                  1 * ((X[:, 2] >> i) & 1))
+        nstate = state_diagram[sdigit, 0, cstate]
+        hdigit = state_diagram[sdigit, 1, cstate]
 
         # Compute ordering
-        for i in range(3*bit_length):
-            order[ip] = order[ip] + i_bit_mask[i]*2**i
+        order += hdigit * 8.0**i
+
+        cstate = nstate
 
     return order
 
@@ -197,3 +178,70 @@ def get_cpu_list(ds, X):
                 cpu_read[j] = True
 
     return sorted(cpu_list)
+
+def get_selector_cpu_list(ds, selector, max_cells=32768):
+    '''
+    Return the list of the CPUs whose Hilbert domains may contain cells
+    selected by a selector, without reading any AMR data. Note that it
+    will be 0-indexed.
+
+    The domain is covered by a regular mesh which is refined where it
+    intersects the selector, until reaching the finest level of the
+    simulation or having more than max_cells cells. The CPUs owning the
+    Hilbert keys of the remaining cells are returned.
+
+    Parameters
+    ----------
+    * ds: Dataset
+      The dataset containing the information
+    * selector: SelectorObject
+      The selector
+    * max_cells: integer
+      The maximum number of cells to test against the selector
+    '''
+    levelmax = ds.parameters['levelmax']
+    ncpu = ds.parameters['ncpu']
+    ndim = ds.parameters['ndim']
+    if ndim != 3:
+        raise NotImplementedError('This function is only implemented in 3D.')
+
+    bound_key = np.zeros(ncpu + 1)
+    for icpu in range(1, ncpu+1):
+        bound_key[icpu-1], bound_key[icpu] = ds.hilbert_indices[icpu]
+
+    LE = np.array(ds.domain_left_edge, dtype='float64')
+    DW = np.array(ds.domain_right_edge, dtype='float64') - LE
+    children = np.array([[i, j, k] for i in range(2)
+                         for j in range(2) for k in range(2)])
+
+    ijk = np.zeros((1, 3), dtype=np.int64)
+    bit_length = 0
+    while bit_length < levelmax + 1 and 8 * ijk.shape[0] <= max_cells:
+        ijk = (2 * ijk[:, None, :] + children[None, :, :]).reshape(-1, 3)
+        bit_length += 1
+        dx = DW / 2**bit_length
+        left_edges = LE + ijk * dx
+        levels = np.zeros((ijk.shape[0], 1), dtype='int32')
+        mask = selector.select_grids(left_edges, left_edges + dx, levels)
+        ijk = ijk[mask]
+        if ijk.shape[0] == 0:
+            return []
+    if bit_length == 0:
+        return list(range(ncpu))
+
+    order = hilbert3d(ijk, bit_length)
+    dkey = (2**(levelmax+1) / 2**bit_length)**ndim
+    key_min = order * dkey
+    key_max = (order + 1) * dkey
+
+    # The first CPU whose keys end after key_min and the last CPU whose keys
+    # start before key_max
+    cpu_min = np.searchsorted(bound_key[1:], key_min, side='right')
+    cpu_max = np.searchsorted(bound_key[:-1], key_max, side='left') - 1
+    valid = cpu_min <= cpu_max
+    hits = np.zeros(ncpu + 1, dtype=np.int64)
+    np.add.at(hits, cpu_min[valid], 1)
+    np.add.at(hits, cpu_max[valid] + 1, -1)
+    cpu_read = np.cumsum(hits)[:ncpu] > 0
+
+    return list(np.nonzero(cpu_read)[0])
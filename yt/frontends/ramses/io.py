@@ -13,9 +13,10 @@ RAMSES-specific IO
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
-from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 import numpy as np
 
+from yt.config import ytcfg
 from yt.utilities.io_handler import \
     BaseIOHandler
 from yt.utilities.logger import ytLogger as mylog
@@ -97,42 +98,58 @@ class IOHandlerRAMSES(BaseIOHandler):
     _dataset_type = "ramses"
 
     def _read_fluid_selection(self, chunks, selector, fields, size):
-        tr = defaultdict(list)
+        subsets = [subset for chunk in chunks for subset in chunk.objs]
+        # The cells selected in each domain are read into consecutive slices
+        # of the output arrays, so domains can be read in any order.
+        offsets = np.zeros(len(subsets) + 1, dtype="int64")
+        for i, subset in enumerate(subsets):
+            offsets[i + 1] = offsets[i] + subset.count_selected(selector)
+        d = dict((field, np.zeros(offsets[-1], dtype="float64"))
+                 for field in fields)
 
         # Set of field types
         ftypes = set(f[0] for f in fields)
-        for chunk in chunks:
+
+        def read_subset(i):
+            subset = subsets[i]
             # Gather fields by type to minimize i/o operations
             for ft in ftypes:
                 # Get all the fields of the same type
                 field_subs = list(
                     filter(lambda f: f[0]==ft, fields))
 
-                # Loop over subsets
-                for subset in chunk.objs:
-                    fname = None
-                    for fh in subset.domain.field_handlers:
-                        if fh.ftype == ft:
-                            file_handler = fh
-                            fname = fh.fname
-                            break
-
-                    if fname is None:
-                        raise YTFieldTypeNotFound(ft)
-
-                    # Now we read the entire thing
-                    with FortranFile(fname) as fd:
-                        # This contains the boundary information, so we skim through
-                        # and pick off the right vectors
-                        rv = subset.fill(fd, field_subs, selector, file_handler)
-                    for ft, f in field_subs:
-                        d = rv.pop(f)
-                        mylog.debug("Filling %s with %s (%0.3e %0.3e) (%s zones)",
-                            f, d.size, d.min(), d.max(), d.size)
-                        tr[(ft, f)].append(d)
-        d = {}
-        for field in fields:
-            d[field] = np.concatenate(tr.pop(field))
+                fname = None
+                for fh in subset.domain.field_handlers:
+                    if fh.ftype == ft:
+                        file_handler = fh
+                        fname = fh.fname
+                        break
+
+                if fname is None:
+                    raise YTFieldTypeNotFound(ft)
+
+                tr = dict((f, d[ft, f][offsets[i]:offsets[i + 1]])
+                          for ft, f in field_subs)
+                # Now we read the entire thing
+                with FortranFile(fname) as fd:
+                    # This contains the boundary information, so we skim through
+                    # and pick off the right vectors
+                    subset.fill(fd, field_subs, selector, file_handler, tr)
+                mylog.debug("Filled %s from domain %s (%s zones)",
+                    [f for ft, f in field_subs], subset.domain_id,
+                    offsets[i + 1] - offsets[i])
+
+        nthreads = min(ytcfg.getint("yt", "ramses_io_threads"), len(subsets))
+        if nthreads > 1:
+            pool = ThreadPool(nthreads)
+            try:
+                pool.map(read_subset, range(len(subsets)))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for i in range(len(subsets)):
+                read_subset(i)
 
         return d
 
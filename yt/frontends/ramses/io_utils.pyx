@@ -15,7 +15,7 @@ ctypedef np.float64_t DOUBLE_t
 @cython.nonecheck(False)
 def read_amr(FortranFile f, dict headers,
              np.ndarray[np.int64_t, ndim=1] ngridbound, INT64_t min_level,
-             RAMSESOctreeContainer oct_handler):
+             RAMSESOctreeContainer oct_handler, list records = None):
 
     cdef INT64_t ncpu, nboundary, max_level, nlevelmax, ncpu_and_bound
     cdef DOUBLE_t nx, ny, nz
@@ -74,9 +74,40 @@ def read_amr(FortranFile f, dict headers,
                                     count_boundary = 1)
                 if n > 0:
                     max_level = max(ilevel - min_level, max_level)
+                # Keep what was added, so that it can be replayed with
+                # add_amr_octs without reading the file again.
+                if records is not None:
+                    records.append((icpu + 1, ilevel - min_level,
+                                    pos[:ng, :].copy()))
 
     return max_level
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+@cython.nonecheck(False)
+def add_amr_octs(RAMSESOctreeContainer oct_handler,
+                 np.ndarray[np.int64_t, ndim=1] domains,
+                 np.ndarray[np.int64_t, ndim=1] levels,
+                 np.ndarray[np.int64_t, ndim=1] counts,
+                 np.ndarray[np.float64_t, ndim=2] pos):
+    """
+    Add octs recorded by read_amr to oct_handler, in the same order.  The
+    i-th group of counts[i] positions belongs to domain domains[i] at level
+    levels[i].  Returns the maximum level of the added octs.
+    """
+    cdef INT64_t i, n, offset, max_level
+    max_level = 0
+    offset = 0
+    for i in range(domains.shape[0]):
+        n = oct_handler.add(domains[i], levels[i],
+                            pos[offset:offset + counts[i], :],
+                            count_boundary = 1)
+        if n > 0:
+            max_level = max(levels[i], max_level)
+        offset += counts[i]
+    return max_level
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
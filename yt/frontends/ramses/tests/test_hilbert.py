@@ -1,6 +1,8 @@
-from yt.frontends.ramses.hilbert import get_cpu_list, hilbert3d
+from yt.frontends.ramses.hilbert import get_cpu_list, hilbert3d, \
+    get_selector_cpu_list
 from yt.testing import \
     assert_equal, \
+    fake_random_ds, \
     requires_file
 import numpy as np
 import yt
@@ -47,3 +49,39 @@ def test_get_cpu_list():
         ls = get_cpu_list(ds, bbox)
         assert(len(ls) > 0)
         assert(all(np.array(o) == np.array(ls)))
+
+
+def test_get_selector_cpu_list():
+    # A domain decomposition into 16 CPUs of a box refined down to level 5,
+    # and the selector of a small sphere from another dataset sharing its
+    # unitary domain.
+    levelmax, ncpu = 4, 16
+
+    class FakeDataset(object):
+        parameters = dict(levelmax=levelmax, ncpu=ncpu, ndim=3)
+        domain_left_edge = np.zeros(3)
+        domain_right_edge = np.ones(3)
+
+    ds = FakeDataset()
+    nmax = 2**(3*(levelmax+1))
+    bounds = np.linspace(0, nmax, ncpu + 1)
+    ds.hilbert_indices = dict((icpu + 1, (bounds[icpu], bounds[icpu + 1]))
+                              for icpu in range(ncpu))
+
+    # The CPUs owning any of the finest cells intersecting the selector.
+    n = 2**(levelmax+1)
+    ijk = np.indices((n, n, n)).reshape(3, -1).T
+    sel_ds = fake_random_ds(64)
+    for sp in [sel_ds.sphere([0.3, 0.6, 0.2], 0.05),
+               sel_ds.sphere([0.99, 0.99, 0.5], 0.05),
+               sel_ds.region([0.5]*3, [0.1, 0.45, 0.5], [0.2, 0.55, 0.6])]:
+        mask = sp.selector.select_grids(ijk / float(n), (ijk + 1) / float(n),
+                                        np.zeros((ijk.shape[0], 1), 'int32'))
+        keys = hilbert3d(ijk[mask], levelmax + 1)
+        expected = sorted(set(np.searchsorted(bounds[1:], keys, 'right')))
+        for max_cells in [8, 512, 32768]:
+            cpus = get_selector_cpu_list(ds, sp.selector, max_cells)
+            assert set(expected) <= set(cpus)
+        # At the finest level the list is exact.
+        assert_equal(cpus, expected)
+        assert len(cpus) < ncpu
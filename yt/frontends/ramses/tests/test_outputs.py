@@ -28,6 +28,8 @@ from yt.frontends.ramses.api import RAMSESDataset
 from yt.config import ytcfg
 from yt.frontends.ramses.field_handlers import DETECTED_FIELDS, HydroFieldFileHandler
 import os
+import shutil
+import tempfile
 import yt
 import numpy as np
 
@@ -426,3 +428,67 @@ def test_ramses_mixed_files():
 
     # Access the field
     ds.r[('gas', 'mixed_files')]
+
+@requires_file(output_00080)
+def test_amr_cache():
+    # Work on a copy without any caches other tests have written into the
+    # test data, so the first load has to build them.
+    tmpdir = tempfile.mkdtemp()
+    try:
+        dirname = os.path.join(tmpdir, "output_00080")
+        shutil.copytree(os.path.join(ytcfg.get("yt", "test_data_dir"),
+                                     os.path.dirname(output_00080)), dirname,
+                        ignore=shutil.ignore_patterns("*.npz"))
+        fn = os.path.join(dirname, "info_00080.txt")
+        ds1 = yt.load(fn)
+        index1 = ds1.index
+        # Each domain is cached, on its own, once its octs are first read.
+        assert not any(os.path.isfile(dom.amr_cache_filename)
+                       for dom in index1.domains)
+        ds1.r[:]["index", "ones"]
+        assert all(os.path.isfile(dom.amr_cache_filename)
+                   for dom in index1.domains)
+        assert not any(dom._from_amr_cache for dom in index1.domains)
+        ds2 = yt.load(fn)
+        index2 = ds2.index
+        # A small region only loads the caches of the domains it may touch.
+        sp = ds2.sphere("c", 0.01)
+        sp["index", "ones"]
+        candidates = index2._candidate_domains(sp.selector)
+        for dom in index2.domains:
+            if dom.amr_loaded:
+                assert dom in candidates
+                assert dom._from_amr_cache
+        ds2.r[:]["index", "ones"]
+        assert all(dom._from_amr_cache for dom in index2.domains)
+        assert_equal(index1.max_level, index2.max_level)
+        for dom1, dom2 in zip(index1.domains, index2.domains):
+            assert_equal(dom1.max_level, dom2.max_level)
+            assert_equal(dom1.level_count, dom2.level_count)
+            for fh1, fh2 in zip(dom1.field_handlers, dom2.field_handlers):
+                assert_equal(fh1.offset, fh2.offset)
+        for field in [("gas", "density"), ("index", "x")]:
+            assert_equal(ds1.r[:][field], ds2.r[:][field])
+        sp1 = ds1.sphere("c", 0.1)
+        sp2 = ds2.sphere("c", 0.1)
+        assert_equal(sp1["gas", "density"], sp2["gas", "density"])
+    finally:
+        shutil.rmtree(tmpdir)
+
+@requires_file(output_00080)
+def test_threaded_fluid_reads():
+    ds = yt.load(output_00080)
+    sp = ds.sphere("c", 0.2)
+    fields = [("gas", "density"), ("gas", "temperature")]
+    ref = dict((field, ds.all_data()[field]) for field in fields)
+    ref_sp = sp["gas", "density"]
+    old = ytcfg.get("yt", "ramses_io_threads")
+    ytcfg["yt", "ramses_io_threads"] = "4"
+    try:
+        ds = yt.load(output_00080)
+        ad = ds.all_data()
+        for field in fields:
+            assert_equal(ad[field], ref[field])
+        assert_equal(ds.sphere("c", 0.2)["gas", "density"], ref_sp)
+    finally:
+        ytcfg["yt", "ramses_io_threads"] = old
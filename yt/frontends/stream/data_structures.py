@@ -68,6 +68,8 @@ from yt.utilities.exceptions import \
     YTInconsistentGridFieldShape, \
     YTInconsistentParticleFieldShape, \
     YTInconsistentGridFieldShapeGridDims
+from yt.units.unit_object import \
+    Unit
 from yt.units.yt_array import \
     YTQuantity, \
     uconcatenate
@@ -363,6 +365,83 @@ class StreamDataset(Dataset):
         self.particle_types = tuple(particle_types)
         self.particle_types_raw = self.particle_types
 
+    # Whether particles may be moved by swapping their positions.  This is
+    # not the case if the index is built from the particle positions.
+    _static_particle_positions = False
+
+    def swap_field_buffers(self, data, sim_time=None):
+        """
+        Replace the arrays of fields the dataset already has with new
+        arrays of the same shape and units, without rebuilding the index.
+
+        Native-endian float64 arrays are kept by reference, as with
+        ``copy=False`` in
+        :func:`~yt.frontends.stream.data_structures.load_uniform_grid`, so
+        the cost of this does not depend on the size of the data.  Data
+        objects created before the swap keep any field values they have
+        already read, so new data objects should be made afterwards.
+
+        Parameters
+        ----------
+        data : dict or list of dicts
+            The new field arrays, given as to
+            :func:`~yt.frontends.stream.data_structures.load_amr_grids`, with
+            one dict for each grid, or a single dict if the dataset has only
+            one grid.  Fields not given are left alone.  Particles must stay
+            within the grids they were assigned to when the data was loaded.
+        sim_time : float, optional
+            The new simulation time, in code units.
+
+        Examples
+        --------
+
+        >>> dens = np.random.random((64, 64, 64))
+        >>> ds = yt.load_uniform_grid({"density": dens}, dens.shape,
+        ...                           copy=False)
+        >>> for step in range(10):
+        ...     advance_simulation(dens)
+        ...     ds.swap_field_buffers({"density": dens}, sim_time=step)
+        ...     print(ds.all_data().quantities.extrema("density"))
+        """
+        if isinstance(data, dict):
+            data = [data]
+        index = self.index
+        fields = self.stream_handler.fields
+        keys = sorted(fields)
+        if len(data) != len(keys):
+            raise RuntimeError("%d dicts of fields given for %d grids." %
+                               (len(data), len(keys)))
+        for key, gdata in zip(keys, data):
+            field_units, gdata, _ = process_data(gdata, copy=False)
+            for field, val in gdata.items():
+                if field not in fields[key]:
+                    raise RuntimeError(
+                        "Field %s is not in the dataset, use "
+                        "index.update_data to add it." % (field,))
+                if val.shape != fields[key][field].shape:
+                    raise RuntimeError(
+                        "Field %s has shape %s, but %s was given." %
+                        (field, fields[key][field].shape, val.shape))
+                if self._static_particle_positions and \
+                  field[1].startswith("particle_position"):
+                    raise RuntimeError(
+                        "Particle positions cannot be swapped, as the index "
+                        "is built from them.")
+                units = field_units.get(field, "")
+                if units != "" and \
+                  Unit(units, registry=self.unit_registry) != \
+                  Unit(self.field_info[field].units,
+                       registry=self.unit_registry):
+                    raise RuntimeError(
+                        "Field %s has units of %s, but %s was given." %
+                        (field, self.field_info[field].units, units))
+                fields[key][field] = val
+                if hasattr(index, "grids"):
+                    index.grids[key].field_data.pop(field, None)
+        if sim_time is not None:
+            self.stream_handler.simulation_time = sim_time
+            self.current_time = self.quan(sim_time, "code_time")
+
 class StreamDictFieldHandler(dict):
     _additional_fields = ()
 
@@ -492,7 +571,14 @@ def assign_particle_data(ds, pdata, bbox):
         npart = ds.stream_handler.fields[gi].pop("number_of_particles", 0)
         ds.stream_handler.particle_count[gi] = npart
 
-def process_data(data, grid_dims=None):
+def _field_buffer(val, copy):
+    # Without copying, native-endian float64 arrays are kept by reference,
+    # as they can be read without conversion.  Anything else is copied.
+    if not copy and val.dtype == np.float64:
+        return val
+    return val.copy()
+
+def process_data(data, grid_dims=None, copy=True):
     new_data, field_units = {}, {}
     for field, val in data.items():
         # val is a data array
@@ -500,11 +586,11 @@ def process_data(data, grid_dims=None):
             # val is a YTArray
             if hasattr(val, "units"):
                 field_units[field] = val.units
-                new_data[field] = val.copy().d
+                new_data[field] = _field_buffer(val.d, copy)
             # val is a numpy array
             else:
                 field_units[field] = ""
-                new_data[field] = val.copy()
+                new_data[field] = _field_buffer(val, copy)
 
         # val is a tuple of (data, units)
         elif isinstance(val, tuple) and len(val) == 2:
@@ -590,7 +676,7 @@ def load_uniform_grid(data, domain_dimensions, length_unit=None, bbox=None,
                       nprocs=1, sim_time=0.0, mass_unit=None, time_unit=None,
                       velocity_unit=None, magnetic_unit=None,
                       periodicity=(True, True, True),
-                      geometry="cartesian", unit_system="cgs"):
+                      geometry="cartesian", unit_system="cgs", copy=True):
     r"""Load a uniform grid of data into yt as a
     :class:`~yt.frontends.stream.data_structures.StreamHandler`.
 
@@ -639,6 +725,11 @@ def load_uniform_grid(data, domain_dimensions, length_unit=None, bbox=None,
         be z, x, y, this would be: ("cartesian", ("z", "x", "y")).  The same
         can be done for other coordinates, for instance:
         ("spherical", ("theta", "phi", "r")).
+    copy : boolean, optional
+        If False, field arrays that are already native-endian float64 are
+        kept by reference rather than copied, so changes made to them later
+        are seen by the dataset.  Other arrays are always copied.  Defaults
+        to True.
 
     Examples
     --------
@@ -671,7 +762,7 @@ def load_uniform_grid(data, domain_dimensions, length_unit=None, bbox=None,
     # First we fix our field names, apply units to data
     # and check for consistency of field shapes
     field_units, data, number_of_particles = process_data(
-        data, grid_dims=tuple(domain_dimensions))
+        data, grid_dims=tuple(domain_dimensions), copy=copy)
 
     sfh = StreamDictFieldHandler()
 
@@ -768,7 +859,8 @@ def load_amr_grids(grid_data, domain_dimensions,
                    bbox=None, sim_time=0.0, length_unit=None,
                    mass_unit=None, time_unit=None, velocity_unit=None,
                    magnetic_unit=None, periodicity=(True, True, True),
-                   geometry="cartesian", refine_by=2, unit_system="cgs"):
+                   geometry="cartesian", refine_by=2, unit_system="cgs",
+                   copy=True):
     r"""Load a set of grids of data into yt as a
     :class:`~yt.frontends.stream.data_structures.StreamHandler`.
     This should allow a sequence of grids of varying resolution of data to be
@@ -826,6 +918,11 @@ def load_amr_grids(grid_data, domain_dimensions,
         instance, this can be used to say that some datasets have refinement of
         1 in one dimension, indicating that they span the full range in that
         dimension.
+    copy : boolean, optional
+        If False, field arrays that are already native-endian float64 are
+        kept by reference rather than copied, so changes made to them later
+        are seen by the dataset.  Other arrays are always copied.  Defaults
+        to True.
 
     Examples
     --------
@@ -876,7 +973,7 @@ def load_amr_grids(grid_data, domain_dimensions,
                                       "particle fields.")
             g.pop("number_of_particles")
         field_units, data, n_particles = process_data(
-            g, grid_dims=tuple(grid_dimensions[i,:]))
+            g, grid_dims=tuple(grid_dimensions[i,:]), copy=copy)
         number_of_particles[i, :] = n_particles
         sfh[i] = data
 
@@ -1081,6 +1178,7 @@ class StreamParticlesDataset(StreamDataset):
     filename_template = "stream_file"
     n_ref = 64
     over_refine_factor = 1
+    _static_particle_positions = True
 
 def load_particles(data, length_unit = None, bbox=None,
                    sim_time=0.0, mass_unit = None, time_unit = None,
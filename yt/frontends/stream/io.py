@@ -36,10 +36,10 @@ class IOHandlerStream(BaseIOHandler):
         #if grid.id not in self.grids_in_memory:
         #    mylog.error("Was asked for %s but I have %s", grid.id, self.grids_in_memory.keys())
         #    raise KeyError
-        tr = self.fields[grid.id][field]
-        # If it's particles, we copy.
-        if len(tr.shape) == 1: return tr.copy()
-        # New in-place unit conversion breaks if we don't copy first
+        # The arrays may be buffers handed to us by the user, so rather than
+        # copying them we return a view that cannot be modified in place.
+        tr = self.fields[grid.id][field].view()
+        tr.flags.writeable = False
         return tr
 
     def _read_fluid_selection(self, chunks, selector, fields, size):
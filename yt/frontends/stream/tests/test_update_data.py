@@ -1,5 +1,15 @@
-from yt.testing import fake_random_ds
+import numpy as np
+
+from yt.testing import \
+    fake_random_ds, \
+    assert_equal, \
+    assert_raises
 from yt.data_objects.profiles import create_profile
+from yt.frontends.stream.api import \
+    load_uniform_grid, \
+    load_amr_grids, \
+    load_particles
+from yt.units.yt_array import YTArray
 from numpy.random import uniform
 
 def test_update_data():
@@ -14,3 +24,73 @@ def test_update_data():
     dd = ds.all_data()
     profile = create_profile(dd, "density", "temperature", 10)
     profile["temperature"]
+
+def test_zero_copy():
+    dens = uniform(size=(16, 16, 16))
+    temp = uniform(size=(16, 16, 16)).astype("float32")
+    pmass = np.ones(10)
+    ppos = uniform(size=10)
+    data = {"density": YTArray(dens, "g/cm**3"), "temperature": temp,
+            "particle_mass": pmass, "particle_position_x": ppos,
+            "particle_position_y": ppos, "particle_position_z": ppos}
+    for copy in [True, False]:
+        ds = load_uniform_grid(data, dens.shape, copy=copy)
+        fields = ds.stream_handler.fields[0]
+        assert_equal(np.may_share_memory(fields["stream", "density"], dens),
+                     not copy)
+        assert_equal(fields["io", "particle_mass"] is pmass, not copy)
+        # other types are always copied
+        assert not np.may_share_memory(fields["stream", "temperature"], temp)
+
+        ds = load_uniform_grid({"density": dens}, dens.shape,
+                               nprocs=8, copy=copy)
+        for grid in ds.index.grids:
+            assert_equal(np.may_share_memory(
+                ds.stream_handler.fields[grid.id]["stream", "density"], dens),
+                not copy)
+
+    grid_data = [dict(left_edge=[0.0, 0.0, 0.0], right_edge=[1.0, 1.0, 1.0],
+                      level=0, dimensions=[16, 16, 16], density=dens)]
+    ds = load_amr_grids(grid_data, [16, 16, 16], copy=False)
+    assert ds.stream_handler.fields[0]["stream", "density"] is dens
+
+    # reads see changes made to the buffers afterwards
+    dens[:] = 2.0
+    assert_equal(ds.all_data()["density"], 2.0)
+
+def test_swap_field_buffers():
+    dens = np.ones((16, 16, 16))
+    ds = load_uniform_grid({"density": dens}, dens.shape, nprocs=8)
+    assert_equal(ds.all_data()["density"].sum(), dens.size)
+
+    new_dens = np.arange(dens.size, dtype="float64").reshape(dens.shape)
+    data = []
+    for g in ds.index.grids:
+        i, j, k = g.get_global_startindex()
+        data.append({"density": new_dens[i:i + 8, j:j + 8, k:k + 8]})
+    ds.swap_field_buffers(data, sim_time=3.0)
+    assert_equal(ds.current_time, ds.quan(3.0, "code_time"))
+    for g, gdata in zip(ds.index.grids, data):
+        assert ds.stream_handler.fields[g.id]["stream", "density"] is \
+          gdata["density"]
+        assert_equal(g["density"], gdata["density"])
+    assert_equal(ds.all_data()["density"].sum(), new_dens.sum())
+
+    # the shapes, units, and fields must match the dataset
+    assert_raises(RuntimeError, ds.swap_field_buffers, {"density": dens})
+    bad = [{"density": np.ones((4, 4, 4))} for g in ds.index.grids]
+    assert_raises(RuntimeError, ds.swap_field_buffers, bad)
+    bad = [{"density": (gdata["density"], "K")} for gdata in data]
+    assert_raises(RuntimeError, ds.swap_field_buffers, bad)
+    bad = [{"temperature": gdata["density"]} for gdata in data]
+    assert_raises(RuntimeError, ds.swap_field_buffers, bad)
+
+    pos = uniform(size=(3, 100))
+    ds = load_particles({"particle_position_x": pos[0],
+                         "particle_position_y": pos[1],
+                         "particle_position_z": pos[2],
+                         "particle_mass": np.ones(100)})
+    ds.swap_field_buffers({"particle_mass": np.ones(100) * 2})
+    assert_equal(ds.all_data()["io", "particle_mass"].sum(), 200)
+    assert_raises(RuntimeError, ds.swap_field_buffers,
+                  {"particle_position_x": pos[1]})
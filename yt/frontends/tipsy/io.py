@@ -20,6 +20,7 @@ import numpy as np
 from numpy.lib.recfunctions import append_fields
 import os
 
+from yt.config import ytcfg
 from yt.utilities.io_handler import \
     BaseIOHandler
 from yt.utilities.lib.geometry_utils import \
@@ -67,11 +68,60 @@ class IOHandlerTipsyBinary(BaseIOHandler):
 
     def __init__(self, *args, **kwargs):
         self._aux_fields = []
+        self._memmaps = {}
         super(IOHandlerTipsyBinary, self).__init__(*args, **kwargs)
+        # These are used to clip coordinates on read, and need to be set even
+        # when the particle index is loaded from its on-disk cache.
+        DLE, DRE = self.ds.domain_left_edge, self.ds.domain_right_edge
+        self.domain_left_edge = DLE.in_units("code_length").ndarray_view()
+        self.domain_right_edge = DRE.in_units("code_length").ndarray_view()
 
     def _read_fluid_selection(self, chunks, selector, fields, size):
         raise NotImplementedError
 
+    def _get_memmap(self, data_file):
+        """
+        Return a dict mapping each particle type in *data_file* to a
+        structured view of its records in a memory map of the file.  The map
+        is created once per file and shared by all subsequent reads.
+        """
+        if data_file.filename not in self._memmaps:
+            offsets = self._calculate_particle_offsets(data_file)
+            views = {}
+            for ptype in self._ptypes:
+                count = data_file.total_particles[ptype]
+                if count == 0:
+                    continue
+                views[ptype] = np.memmap(
+                    data_file.filename, dtype=self._pdtypes[ptype], mode="r",
+                    offset=offsets[ptype], shape=(count,)).view(np.ndarray)
+            self._memmaps[data_file.filename] = views
+        return self._memmaps[data_file.filename]
+
+    def _iterate_particles(self, data_file, ptype, chunksize):
+        """
+        Yield the records of *ptype* in *data_file*, at most *chunksize* at a
+        time.  When the ``tipsy_memmap`` configuration option is set these are
+        views of the memory-mapped file, otherwise they are read into memory.
+        """
+        count = data_file.total_particles[ptype]
+        if count == 0:
+            return
+        if ytcfg.getboolean("yt", "tipsy_memmap"):
+            records = self._get_memmap(data_file)[ptype]
+            for start in range(0, count, chunksize):
+                yield records[start:start + chunksize]
+            return
+        offsets = self._calculate_particle_offsets(data_file)
+        with open(data_file.filename, "rb") as f:
+            f.seek(offsets[ptype], os.SEEK_SET)
+            total = 0
+            while total < count:
+                c = min(chunksize, count - total)
+                p = np.fromfile(f, self._pdtypes[ptype], count=c)
+                total += p.size
+                yield p
+
     def _fill_fields(self, fields, vals, mask, data_file):
         if mask is None:
             size = 0
@@ -107,16 +157,10 @@ class IOHandlerTipsyBinary(BaseIOHandler):
                 data_files.update(obj.data_files)
         for data_file in sorted(data_files):
             poff = data_file.field_offsets
-            tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
             for ptype, field_list in sorted(ptf.items(),
                                             key=lambda a: poff[a[0]]):
-                f.seek(poff[ptype], os.SEEK_SET)
-                total = 0
-                while total < tp[ptype]:
-                    count = min(self._chunksize, tp[ptype] - total)
-                    p = np.fromfile(f, self._pdtypes[ptype], count=count)
-                    total += p.size
+                for p in self._iterate_particles(data_file, ptype,
+                                                 self._chunksize):
                     d = [p["Coordinates"][ax].astype("float64")
                          for ax in 'xyz']
                     del p
@@ -133,7 +177,6 @@ class IOHandlerTipsyBinary(BaseIOHandler):
             aux_fields_offsets = \
                 self._calculate_particle_offsets_aux(data_file)
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
 
             # we need to open all aux files for chunking to work
             aux_fh = {}
@@ -142,17 +185,15 @@ class IOHandlerTipsyBinary(BaseIOHandler):
 
             for ptype, field_list in sorted(ptf.items(),
                                             key=lambda a: poff[a[0]]):
-                f.seek(poff[ptype], os.SEEK_SET)
                 afields = list(set(field_list).intersection(self._aux_fields))
                 for afield in afields:
                     aux_fh[afield].seek(
                         aux_fields_offsets[afield][ptype][0], os.SEEK_SET)
 
                 total = 0
-                while total < tp[ptype]:
-                    count = min(self._chunksize, tp[ptype] - total)
-                    p = np.fromfile(f, self._pdtypes[ptype], count=count)
-
+                for p in self._iterate_particles(data_file, ptype,
+                                                 self._chunksize):
+                    count = p.size
                     auxdata = []
                     for afield in afields:
                         if isinstance(self._aux_pdtypes[afield], np.dtype):
@@ -189,7 +230,6 @@ class IOHandlerTipsyBinary(BaseIOHandler):
                         yield (ptype, field), tf.pop(field)
 
             # close all file handles
-            f.close()
             for fh in list(aux_fh.values()):
                 fh.close()
 
@@ -200,35 +240,24 @@ class IOHandlerTipsyBinary(BaseIOHandler):
         whole set of particles, and sets the domain to +/- that value.
         '''
         ds = data_file.ds
-        ind = 0
         # Check to make sure that the domain hasn't already been set
         # by the parameter file
         if np.all(np.isfinite(ds.domain_left_edge)) and \
                 np.all(np.isfinite(ds.domain_right_edge)):
             return
-        with open(data_file.filename, "rb") as f:
-            ds.domain_left_edge = 0
-            ds.domain_right_edge = 0
-            f.seek(ds._header_offset)
-            mi = np.array([1e30, 1e30, 1e30], dtype="float64")
-            ma = -np.array([1e30, 1e30, 1e30], dtype="float64")
-            for iptype, ptype in enumerate(self._ptypes):
-                # We'll just add the individual types separately
-                count = data_file.total_particles[ptype]
-                if count == 0:
-                    continue
-                stop = ind + count
-                while ind < stop:
-                    c = min(CHUNKSIZE, stop - ind)
-                    pp = np.fromfile(f, dtype=self._pdtypes[ptype],
-                                     count=c)
-                    np.minimum(mi, [pp["Coordinates"]["x"].min(),
-                                    pp["Coordinates"]["y"].min(),
-                                    pp["Coordinates"]["z"].min()], mi)
-                    np.maximum(ma, [pp["Coordinates"]["x"].max(),
-                                    pp["Coordinates"]["y"].max(),
-                                    pp["Coordinates"]["z"].max()], ma)
-                    ind += c
+        ds.domain_left_edge = 0
+        ds.domain_right_edge = 0
+        mi = np.array([1e30, 1e30, 1e30], dtype="float64")
+        ma = -np.array([1e30, 1e30, 1e30], dtype="float64")
+        for iptype, ptype in enumerate(self._ptypes):
+            # We'll just add the individual types separately
+            for pp in self._iterate_particles(data_file, ptype, CHUNKSIZE):
+                np.minimum(mi, [pp["Coordinates"]["x"].min(),
+                                pp["Coordinates"]["y"].min(),
+                                pp["Coordinates"]["z"].min()], mi)
+                np.maximum(ma, [pp["Coordinates"]["x"].max(),
+                                pp["Coordinates"]["y"].max(),
+                                pp["Coordinates"]["z"].max()], ma)
         # We extend by 1%.
         DW = ma - mi
         mi -= 0.01 * DW
@@ -245,38 +274,28 @@ class IOHandlerTipsyBinary(BaseIOHandler):
                           dtype="uint64")
         ind = 0
         DLE, DRE = ds.domain_left_edge, ds.domain_right_edge
-        self.domain_left_edge = DLE.in_units("code_length").ndarray_view()
-        self.domain_right_edge = DRE.in_units("code_length").ndarray_view()
-        with open(data_file.filename, "rb") as f:
-            f.seek(ds._header_offset)
-            for iptype, ptype in enumerate(self._ptypes):
-                # We'll just add the individual types separately
-                count = data_file.total_particles[ptype]
-                if count == 0:
-                    continue
-                stop = ind + count
-                while ind < stop:
-                    c = min(CHUNKSIZE, stop - ind)
-                    pp = np.fromfile(f, dtype=self._pdtypes[ptype],
-                                     count=c)
-                    mis = np.empty(3, dtype="float64")
-                    mas = np.empty(3, dtype="float64")
-                    for axi, ax in enumerate('xyz'):
-                        mi = pp["Coordinates"][ax].min()
-                        ma = pp["Coordinates"][ax].max()
-                        mylog.debug(
-                            "Spanning: %0.3e .. %0.3e in %s", mi, ma, ax)
-                        mis[axi] = mi
-                        mas[axi] = ma
-                    pos = np.empty((pp.size, 3), dtype="float64")
-                    for i, ax in enumerate("xyz"):
-                        pos[:, i] = pp["Coordinates"][ax]
-                    regions.add_data_file(pos, data_file.file_id,
-                                          data_file.ds.filter_bbox)
-                    morton[ind:ind + c] = compute_morton(
-                        pos[:, 0], pos[:, 1], pos[:, 2],
-                        DLE, DRE, data_file.ds.filter_bbox)
-                    ind += c
+        for iptype, ptype in enumerate(self._ptypes):
+            # We'll just add the individual types separately
+            for pp in self._iterate_particles(data_file, ptype, CHUNKSIZE):
+                c = pp.size
+                mis = np.empty(3, dtype="float64")
+                mas = np.empty(3, dtype="float64")
+                for axi, ax in enumerate('xyz'):
+                    mi = pp["Coordinates"][ax].min()
+                    ma = pp["Coordinates"][ax].max()
+                    mylog.debug(
+                        "Spanning: %0.3e .. %0.3e in %s", mi, ma, ax)
+                    mis[axi] = mi
+                    mas[axi] = ma
+                pos = np.empty((c, 3), dtype="float64")
+                for i, ax in enumerate("xyz"):
+                    pos[:, i] = pp["Coordinates"][ax]
+                regions.add_data_file(pos, data_file.file_id,
+                                      data_file.ds.filter_bbox)
+                morton[ind:ind + c] = compute_morton(
+                    pos[:, 0], pos[:, 1], pos[:, 2],
+                    DLE, DRE, data_file.ds.filter_bbox)
+                ind += c
         mylog.info("Adding %0.3e particles", morton.size)
         return morton
 
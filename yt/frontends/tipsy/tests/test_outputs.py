@@ -15,7 +15,15 @@ Tipsy tests using the AGORA dataset
 #-----------------------------------------------------------------------------
 
 from collections import OrderedDict
+import os
+import shutil
+import struct
+import tempfile
 
+import numpy as np
+
+from yt.config import ytcfg
+from yt.convenience import load
 from yt.testing import \
     assert_equal, \
     requires_file
@@ -27,6 +35,7 @@ from yt.utilities.answer_testing.framework import \
     FieldValuesTest, \
     PixelizedProjectionValuesTest
 from yt.frontends.tipsy.api import TipsyDataset
+from yt.frontends.tipsy.io import IOHandlerTipsyBinary
 
 _fields = (("deposit", "all_density"),
            ("deposit", "all_count"),
@@ -120,3 +129,45 @@ def test_tipsy_galaxy():
 def test_TipsyDataset():
     assert isinstance(data_dir_load(pkdgrav), TipsyDataset)
     assert isinstance(data_dir_load(gasoline_dmonly), TipsyDataset)
+
+
+def test_tipsy_memmap():
+    tmpdir = tempfile.mkdtemp()
+    fn = os.path.join(tmpdir, "fake.tipsy")
+    npart = OrderedDict([("Gas", 500), ("DarkMatter", 800), ("Stars", 300)])
+    pdtypes = IOHandlerTipsyBinary._compute_dtypes({}, ">")
+    np.random.seed(0x4d3d3d3)
+    records = {}
+    with open(fn, "wb") as f:
+        f.write(struct.pack(">diiiiii", 0.0, sum(npart.values()), 3,
+                            npart["Gas"], npart["DarkMatter"],
+                            npart["Stars"], 0))
+        for ptype, count in npart.items():
+            rec = np.zeros(count, dtype=pdtypes[ptype])
+            for name in pdtypes[ptype].names:
+                if pdtypes[ptype][name].names is None:
+                    rec[name] = np.random.random(count)
+                    continue
+                for ax in "xyz":
+                    rec[name][ax] = np.random.random(count)
+            f.write(rec.tobytes())
+            records[ptype] = rec
+    old = ytcfg.get("yt", "tipsy_memmap")
+    try:
+        for use_memmap in ["True", "False"]:
+            ytcfg["yt", "tipsy_memmap"] = use_memmap
+            ds = load(fn, bounding_box=[[0, 1]]*3)
+            ad = ds.all_data()
+            sp = ds.sphere([0.5]*3, 0.4)
+            for ptype in npart:
+                rec = records[ptype]
+                pos = np.array([rec["Coordinates"][ax] for ax in "xyz"]).T
+                assert_equal(ad[ptype, "Mass"].d, rec["Mass"])
+                mask = ((pos - 0.5)**2).sum(axis=1) <= 0.4**2
+                assert_equal(sp[ptype, "Mass"].d, rec["Mass"][mask])
+                if ptype == "Gas":
+                    assert_equal(sp[ptype, "Density"].d,
+                                 rec["Density"][mask])
+    finally:
+        ytcfg["yt", "tipsy_memmap"] = old
+        shutil.rmtree(tmpdir)
@@ -188,7 +188,8 @@ class YTDataset(SavedDataset):
     def _with_parameter_file_open(self, f):
         self.num_particles = \
           dict([(group, parse_h5_attr(f[group], "num_elements"))
-                for group in f if group != self.default_fluid_type])
+                for group in f if group not in
+                (self.default_fluid_type, "spatial_index")])
 
     def create_field_info(self):
         self.field_dependencies = {}
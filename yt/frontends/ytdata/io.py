@@ -14,6 +14,8 @@ YTData data-file handling function
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+from collections import \
+    defaultdict
 import numpy as np
 
 from yt.extern.six import \
@@ -201,26 +203,73 @@ class IOHandlerYTDataContainerHDF5(BaseIOHandler):
                        for ax in "xyz")
                     yield ptype, (x, y, z)
 
+    def _select_chunks(self, f, ptype, count, selector):
+        # Yields the start and end of each run of the count elements of
+        # ptype that may be selected by selector, along with the mask of
+        # the elements it selects.  When the file has a spatial index, only
+        # the chunks whose bounding boxes the selector overlaps are read.
+        runs = [(0, count)]
+        if "spatial_index" in f and ptype in f["spatial_index"]:
+            g = f["spatial_index"][ptype]
+            chunk_size = int(parse_h5_attr(g, "chunk_size"))
+            units = parse_h5_attr(g, "units")
+            le = self.ds.arr(g["left_edge"][()], units).to("code_length").d
+            re = self.ds.arr(g["right_edge"][()], units).to("code_length").d
+            # Pad the boxes so that chunks holding a single point on the
+            # edge of a selector are still selected.
+            pad = 1e-10 * (self.ds.domain_width.to("code_length").d)
+            levels = np.zeros((le.shape[0], 1), dtype="int32")
+            chunk_mask = selector.select_grids(le - pad, re + pad, levels)
+            # Consecutive selected chunks are read together.
+            edges = np.diff(np.concatenate([[0], chunk_mask.view("int8"), [0]]))
+            runs = [(start * chunk_size, min(end * chunk_size, count))
+                    for start, end in zip(np.where(edges == 1)[0],
+                                          np.where(edges == -1)[0])]
+        units = _get_position_array_units(ptype, f, "x")
+        for start, end in runs:
+            x, y, z = \
+              (self.ds.arr(_get_position_array(ptype, f, ax, start, end),
+                           units)
+               for ax in "xyz")
+            mask = selector.select_points(x, y, z, 0.0)
+            del x, y, z
+            if mask is None: continue
+            yield start, end, mask
+
+    def _count_particles_chunks(self, chunks, ptf, selector):
+        psize = defaultdict(lambda: 0)
+        for data_file in self._get_data_files(chunks):
+            with h5py.File(data_file.filename, "r") as f:
+                for ptype in sorted(ptf):
+                    count = data_file.total_particles[ptype]
+                    if count == 0: continue
+                    for start, end, mask in \
+                      self._select_chunks(f, ptype, count, selector):
+                        psize[ptype] += mask.sum()
+        return dict(psize.items())
+
     def _read_particle_fields(self, chunks, ptf, selector):
         # Now we have all the sizes, and we can allocate
-        chunks = list(chunks)
+        for data_file in self._get_data_files(chunks):
+            with h5py.File(data_file.filename, "r") as f:
+                for ptype, field_list in sorted(ptf.items()):
+                    count = data_file.total_particles[ptype]
+                    if count == 0: continue
+                    selected = list(
+                        self._select_chunks(f, ptype, count, selector))
+                    if not selected: continue
+                    for field in field_list:
+                        data = np.concatenate(
+                            [f[ptype][field][start:end][mask]
+                             for start, end, mask in selected])
+                        yield (ptype, field), data.astype("float64")
+
+    def _get_data_files(self, chunks):
         data_files = set([])
         for chunk in chunks:
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
-        for data_file in sorted(data_files):
-            with h5py.File(data_file.filename, "r") as f:
-                for ptype, field_list in sorted(ptf.items()):
-                    units = _get_position_array_units(ptype, f, "x")
-                    x, y, z = \
-                      (self.ds.arr(_get_position_array(ptype, f, ax), units)
-                       for ax in "xyz")
-                    mask = selector.select_points(x, y, z, 0.0)
-                    del x, y, z
-                    if mask is None: continue
-                    for field in field_list:
-                        data = f[ptype][field][mask].astype("float64")
-                        yield (ptype, field), data
+        return sorted(data_files)
 
     def _initialize_index(self, data_file, regions):
         all_count = self._count_particles(data_file)
@@ -271,6 +320,7 @@ class IOHandlerYTDataContainerHDF5(BaseIOHandler):
         units = {}
         with h5py.File(data_file.filename, "r") as f:
             for ptype in f:
+                if ptype == "spatial_index": continue
                 fields.extend([(ptype, str(field)) for field in f[ptype]])
                 units.update(dict([((ptype, str(field)), 
                                     parse_h5_attr(f[ptype][field], "units"))
@@ -279,6 +329,7 @@ class IOHandlerYTDataContainerHDF5(BaseIOHandler):
 
 class IOHandlerYTSpatialPlotHDF5(IOHandlerYTDataContainerHDF5):
     _dataset_type = "ytspatialplot_hdf5"
+    _count_particles_chunks = BaseIOHandler._count_particles_chunks
 
     def _read_particle_coords(self, chunks, ptf):
         # This will read chunks and yield the results.
@@ -360,12 +411,12 @@ class IOHandlerYTSpatialPlotHDF5(IOHandlerYTDataContainerHDF5):
                 ind += pos.shape[0]
         return morton
 
-def _get_position_array(ptype, f, ax):
+def _get_position_array(ptype, f, ax, start=None, end=None):
     if ptype == "grid":
         pos_name = ""
     else:
         pos_name = "particle_position_"
-    return f[ptype][pos_name + ax][()].astype("float64")
+    return f[ptype][pos_name + ax][start:end].astype("float64")
 
 def _get_position_array_units(ptype, f, ax):
     if ptype == "grid":
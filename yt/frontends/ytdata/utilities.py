@@ -19,13 +19,15 @@ import numpy as np
 from yt.funcs import iterable
 from yt.units.yt_array import \
     YTArray
+from yt.utilities.lib.geometry_utils import \
+    compute_morton
 from yt.utilities.logger import \
     ytLogger as mylog
 from yt.utilities.on_demand_imports import \
     _h5py as h5py
 
 def save_as_dataset(ds, filename, data, field_types=None,
-                    extra_attrs=None):
+                    extra_attrs=None, chunk_size=None, compression=None):
     r"""Export a set of field arrays to a reloadable yt dataset.
 
     This function can be used to create a yt loadable dataset from a 
@@ -50,6 +52,16 @@ def save_as_dataset(ds, filename, data, field_types=None,
         used.
     extra_attrs: dict, optional
         A dictionary of additional attributes to be saved.
+    chunk_size: int, optional
+        If given, the fields of each field type with positions are
+        sorted by the Morton index of their positions and stored in
+        chunks of this many elements.  The bounding box of each chunk is
+        saved in the "spatial_index" group, so that the chunks a data
+        object does not overlap are not read when the dataset is
+        reloaded.
+    compression: str, optional
+        The HDF5 compression filter, such as "gzip", used for the fields
+        stored in chunks.
 
     Returns
     -------
@@ -129,27 +141,88 @@ def save_as_dataset(ds, filename, data, field_types=None,
     if "data_type" not in extra_attrs:
         fh.attrs["data_type"] = "yt_array_data"
 
+    groups = {}
     for field in data:
         if field_types is None:
             field_type = "data"
         else:
             field_type = field_types[field]
+        groups.setdefault(field_type, []).append(field)
+
+    for field_type, fields in groups.items():
         if field_type not in fh:
             fh.create_group(field_type)
 
-        if isinstance(field, tuple):
-            field_name = field[1]
-        else:
-            field_name = field
+        order = None
+        if chunk_size is not None:
+            order = _spatial_index(ds, fh, field_type,
+                                   [data[f] for f in fields], fields,
+                                   chunk_size)
+
+        for field in fields:
+            if isinstance(field, tuple):
+                field_name = field[1]
+            else:
+                field_name = field
+
+            # for python3
+            if data[field].dtype.kind == 'U':
+                data[field] = data[field].astype('|S')
+
+            if order is None:
+                _yt_array_hdf5(fh[field_type], field_name, data[field])
+            else:
+                _yt_array_hdf5(fh[field_type], field_name,
+                               data[field][order],
+                               chunks=(min(chunk_size, len(order)),) +
+                                      data[field].shape[1:],
+                               compression=compression)
+            if "num_elements" not in fh[field_type].attrs:
+                fh[field_type].attrs["num_elements"] = data[field].size
+    fh.close()
 
-        # for python3
-        if data[field].dtype.kind == 'U':
-            data[field] = data[field].astype('|S')
+def _spatial_index(ds, fh, field_type, arrays, fields, chunk_size):
+    r"""Find the order sorting the elements of a field type by the Morton
+    index of their positions, and save the bounding box of each chunk of
+    chunk_size sorted elements to the "spatial_index" group of fh.
 
-        _yt_array_hdf5(fh[field_type], field_name, data[field])
-        if "num_elements" not in fh[field_type].attrs:
-            fh[field_type].attrs["num_elements"] = data[field].size
-    fh.close()
+    Returns the order, or None if the positions of the field type are not
+    among its fields or the domain is unknown.
+    """
+
+    names = {}
+    for field, arr in zip(fields, arrays):
+        names[field[1] if isinstance(field, tuple) else field] = arr
+    for prefix in ("", "particle_position_"):
+        pos = [names.get(prefix + ax) for ax in "xyz"]
+        if not any(p is None for p in pos):
+            break
+    else:
+        return None
+    if not hasattr(ds, "domain_left_edge") or \
+      not all(isinstance(p, YTArray) and p.ndim == 1 and p.size > 0
+              for p in pos) or \
+      any(len(arr) != pos[0].size for arr in arrays):
+        return None
+
+    dle = ds.domain_left_edge.to("code_length").d
+    dre = ds.domain_right_edge.to("code_length").d
+    pos = np.array([p.to("code_length").d for p in pos]).T
+    # Positions on the right edge of the domain have no Morton index.
+    keys = np.clip(pos, dle, np.nextafter(dre, dle))
+    morton = compute_morton(keys[:,0], keys[:,1], keys[:,2], dle, dre)
+    order = np.argsort(morton, kind="mergesort")
+    pos = pos[order]
+    chunk_size = min(chunk_size, pos.shape[0])
+    starts = np.arange(0, pos.shape[0], chunk_size)
+    if "spatial_index" not in fh:
+        fh.create_group("spatial_index")
+    g = fh["spatial_index"].create_group(field_type)
+    g.attrs["chunk_size"] = chunk_size
+    g.attrs["units"] = "code_length"
+    g.create_dataset("left_edge", data=np.minimum.reduceat(pos, starts))
+    g.create_dataset("right_edge", data=np.maximum.reduceat(pos, starts))
+    return order
 
 def _hdf5_yt_array(fh, field, ds=None):
     r"""Load an hdf5 dataset as a YTArray.
@@ -183,7 +256,7 @@ def _hdf5_yt_array(fh, field, ds=None):
     if units == "dimensionless": units = ""
     return new_arr(fh[field][()], units)
 
-def _yt_array_hdf5(fh, field, data):
+def _yt_array_hdf5(fh, field, data, chunks=None, compression=None):
     r"""Save a YTArray to an open hdf5 file or group.
 
     Save a YTArray to an open hdf5 file or group, and save the 
@@ -197,6 +270,10 @@ def _yt_array_hdf5(fh, field, data):
         The name of the field to be saved.
     data : YTArray
         The data array to be saved.
+    chunks : tuple, optional
+        The shape of the chunks the dataset is stored in.
+    compression : str, optional
+        The compression filter applied to the chunks.
 
     Returns
     -------
@@ -205,7 +282,8 @@ def _yt_array_hdf5(fh, field, data):
     
     """
 
-    dataset = fh.create_dataset(str(field), data=data)
+    dataset = fh.create_dataset(str(field), data=data, chunks=chunks,
+                                compression=compression)
     units = ""
     if isinstance(data, YTArray):
         units = str(data.units)
@@ -15,11 +15,14 @@ Geometry container base class.
 #-----------------------------------------------------------------------------
 
 import os
-from yt.extern.six.moves import cPickle
+from yt.extern.six.moves import cPickle, queue
+import threading
 import weakref
 from yt.utilities.on_demand_imports import _h5py as h5py
 import numpy as np
 
+from collections import OrderedDict
+
 from yt.config import ytcfg
 from yt.funcs import iterable
 from yt.units.yt_array import \
@@ -35,6 +38,7 @@ class Index(ParallelAnalysisInterface):
     _global_mesh = True
     _unsupported_objects = ()
     _index_properties = ()
+    _io_lock_obj = None
 
     def __init__(self, ds, dataset_type):
         ParallelAnalysisInterface.__init__(self)
@@ -238,15 +242,38 @@ class Index(ParallelAnalysisInterface):
             chunk_size = dobj.size
         else:
             chunk_size = chunk.data_size
-        fields_to_return = self.io._read_fluid_selection(
-            self._chunk_io(dobj),
-            selector,
-            fields_to_read,
-            chunk_size)
+        # Fields read ahead of time by _prefetch_chunks are handed over
+        # rather than read again.  They are kept for the life of the chunk,
+        # since a field can be needed more than once while it is processed,
+        # and copied since callers convert the arrays they get in place.
+        prefetched = getattr(chunk, "_prefetched", None) or {}
+        fields_to_return = {}
+        for field in fields_to_read:
+            if field in prefetched:
+                fields_to_return[field] = prefetched[field].copy()
+        fields_to_read = [f for f in fields_to_read
+                          if f not in fields_to_return]
+        if len(fields_to_read) > 0:
+            with self._io_lock:
+                fields_to_return.update(self.io._read_fluid_selection(
+                    self._chunk_io(dobj),
+                    selector,
+                    fields_to_read,
+                    chunk_size))
         return fields_to_return, fields_to_generate
 
+    @property
+    def _io_lock(self):
+        # Serializes reads between the main thread and a prefetching thread,
+        # since IO handlers are not generally safe to use concurrently.
+        if self._io_lock_obj is None:
+            self._io_lock_obj = threading.RLock()
+        return self._io_lock_obj
+
     def _chunk(self, dobj, chunking_style, ngz = 0, **kwargs):
         # A chunk is either None or (grids, size)
+        prefetch_fields = kwargs.pop("prefetch_fields", None)
+        prefetch = kwargs.pop("prefetch", None)
         if dobj._current_chunk is None:
             self._identify_base_chunk(dobj)
         if ngz != 0 and chunking_style != "spatial":
@@ -256,10 +283,92 @@ class Index(ParallelAnalysisInterface):
         elif chunking_style == "spatial":
             return self._chunk_spatial(dobj, ngz, **kwargs)
         elif chunking_style == "io":
-            return self._chunk_io(dobj, **kwargs)
+            chunks = self._chunk_io(dobj, **kwargs)
+            if prefetch is None:
+                prefetch = ytcfg.getint("yt", "io_prefetch_chunks")
+            if prefetch and prefetch_fields and self._can_prefetch:
+                chunks = self._prefetch_chunks(dobj, chunks, prefetch_fields,
+                                               int(prefetch))
+            return chunks
         else:
             raise NotImplementedError
 
+    @property
+    def _can_prefetch(self):
+        # Prefetched fields are only picked up by Index._read_fluid_fields,
+        # and only it reads with the arguments the reading thread uses, so
+        # indexes with their own way of reading fluid fields do not
+        # prefetch.
+        method = getattr(type(self)._read_fluid_fields, "__func__",
+                         type(self)._read_fluid_fields)
+        return method is getattr(Index._read_fluid_fields, "__func__",
+                                 Index._read_fluid_fields)
+
+    def _prefetch_chunks(self, dobj, chunks, fields, depth):
+        """
+        Iterate over *chunks* while a worker thread reads the on-disk fluid
+        fields needed for *fields* on up to *depth* chunks ahead of the one
+        being processed.  The data read are attached to each chunk and used
+        by _read_fluid_fields in place of reading them again.
+        """
+        fields = dobj._determine_fields(
+            dobj._identify_dependencies(dobj._determine_fields(fields)))
+        fields = [f for f in fields
+                  if not self.ds._get_field_info(*f).particle_type]
+        fields_to_read, _ = self._split_fields(fields)
+        if len(fields_to_read) == 0:
+            for chunk in chunks:
+                yield chunk
+            return
+        selector = dobj.selector
+        io_lock = self._io_lock
+        # The queue is bounded, so at most depth chunks are held in memory
+        # besides the one being read and the one being processed.
+        chunk_queue = queue.Queue(maxsize = max(depth, 1))
+        stop = threading.Event()
+        done = object()
+
+        def _put(item):
+            while not stop.is_set():
+                try:
+                    chunk_queue.put(item, timeout = 0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _read_ahead():
+            try:
+                for chunk in chunks:
+                    if stop.is_set():
+                        return
+                    with io_lock:
+                        chunk._prefetched = self.io._read_fluid_selection(
+                            [chunk], selector, fields_to_read,
+                            chunk.data_size)
+                    if not _put((chunk, None)):
+                        return
+            except Exception as e:
+                _put((None, e))
+                return
+            _put((done, None))
+
+        worker = threading.Thread(target = _read_ahead,
+                                  name = "yt-io-prefetch")
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                chunk, exc = chunk_queue.get()
+                if exc is not None:
+                    raise exc
+                if chunk is done:
+                    break
+                yield chunk
+        finally:
+            stop.set()
+            worker.join()
+
 def cached_property(func):
     n = '_%s' % func.__name__
     def cached_func(self):
@@ -286,13 +395,14 @@ class YTDataChunk(object):
         self._field_type = field_type
         self._cache = cache
         self._fast_index = fast_index
+        self._prefetched = None
 
     def _accumulate_values(self, method):
         # We call this generically.  It's somewhat slower, since we're doing
         # costly getattr functions, but this allows us to generalize.
         mname = "select_%s" % method
         arrs = []
-        for obj in self._fast_index or self.objs:
+        for obj in self.objs:
             f = getattr(obj, mname)
             arrs.append(f(self.dobj))
         if method == "dtcoords":
@@ -387,7 +497,9 @@ class YTDataChunk(object):
         self._tcoords = ct # Se this for tcoords
         if self.data_size == 0: return cdt
         ind = 0
-        for obj in self._fast_index or self.objs:
+        # The fast index does not provide ray parameters, so these always
+        # come from the individual objects.
+        for obj in self.objs:
             gdt, gt = obj.select_tcoords(self.dobj)
             if gt.size == 0: continue
             ct[ind:ind+gt.size] = gt
@@ -447,3 +559,84 @@ class ChunkDataCache(object):
         g = self.queue.pop(0)
         g._initialize_cache(self.cache.pop(g.id, {}))
         return g
+
+
+class SelectorMaskCache(object):
+    """
+    A cache of the masks selectors produce on the grids of an index.
+
+    Masks are keyed by the selector and the grid id, so that data objects
+    covering the same region share them.  When the masks held use more than
+    *max_bytes*, the least recently used ones are evicted.  A *max_bytes* of
+    zero or less disables the cache.
+    """
+    # An estimate of the memory used by an entry beyond its mask, so that
+    # the many empty masks of a small selection are accounted for too.
+    _entry_overhead = 128
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._masks = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, selector, grid):
+        return (selector.__class__, hash(selector), grid.id)
+
+    def get(self, selector, grid):
+        """
+        Return the (mask, count) pair stored for *selector* on *grid*, or
+        None if it is not in the cache.
+        """
+        key = self._key(selector, grid)
+        with self._lock:
+            entry = self._masks.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._masks[key] = entry
+            self.hits += 1
+        return entry[0], entry[1]
+
+    def add(self, selector, grid, mask, count):
+        """
+        Store the *mask* of *selector* on *grid*, which selects *count*
+        cells.  The mask may be None if no cells are selected.
+        """
+        nbytes = self._entry_overhead
+        if mask is not None:
+            nbytes += mask.nbytes
+        if nbytes > self.max_bytes:
+            return
+        key = self._key(selector, grid)
+        with self._lock:
+            old = self._masks.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[2]
+            self._masks[key] = (mask, count, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, _, evicted) = self._masks.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    @property
+    def hit_rate(self):
+        """The fraction of lookups that found a mask in the cache."""
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return float(self.hits) / lookups
+
+    def clear(self):
+        """Remove all masks from the cache and reset its statistics."""
+        with self._lock:
+            self._masks.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._masks)
@@ -31,11 +31,20 @@ cdef class GridTree:
     cdef int num_grids
     cdef int num_root_grids
     cdef int num_leaf_grids
+    cdef int refine_by
+    cdef np.int64_t *visit_order
+    cdef np.int64_t num_visit
     cdef public bitarray mask
     cdef void setup_data(self, GridVisitorData *data)
     cdef void visit_grids(self, GridVisitorData *data,
                           grid_visitor_function *func,
                           SelectorObject selector)
+    cdef int visit_grid(self,
+                        GridVisitorData *data,
+                        grid_visitor_function *func,
+                        SelectorObject selector,
+                        GridTreeNode *grid,
+                        np.uint8_t *buf = ?)
     cdef void recursively_visit_grid(self,
                           GridVisitorData *data,
                           grid_visitor_function *func,
@@ -21,22 +21,23 @@ from yt.utilities.lib.bitarray cimport bitarray
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cdef GridTreeNode Grid_initialize(np.ndarray[np.float64_t, ndim=1] le,
-                                  np.ndarray[np.float64_t, ndim=1] re,
-                                  np.ndarray[np.int32_t, ndim=1] dims,
+cdef GridTreeNode Grid_initialize(np.ndarray[np.float64_t, ndim=2] le,
+                                  np.ndarray[np.float64_t, ndim=2] re,
+                                  np.ndarray[np.int32_t, ndim=2] dims,
                                   int num_children, int level, int index):
-
+    # The edges and dimensions of this grid are row *index* of the arrays;
+    # passing the full arrays avoids creating a slice for every grid.
     cdef GridTreeNode node
     cdef int i
 
     node.index = index
     node.level = level
     for i in range(3):
-        node.left_edge[i] = le[i]
-        node.right_edge[i] = re[i]
-        node.dims[i] = dims[i]
-        node.dds[i] = (re[i] - le[i])/dims[i]
-        node.start_index[i] = <np.int64_t> rint(le[i] / node.dds[i])
+        node.left_edge[i] = le[index, i]
+        node.right_edge[i] = re[index, i]
+        node.dims[i] = dims[index, i]
+        node.dds[i] = (re[index, i] - le[index, i])/dims[index, i]
+        node.start_index[i] = <np.int64_t> rint(le[index, i] / node.dds[i])
     node.num_children = num_children
     if num_children <= 0:
         node.children = NULL
@@ -59,7 +60,8 @@ cdef class GridTree:
                   np.ndarray[np.int32_t, ndim=2] dimensions,
                   np.ndarray[np.int64_t, ndim=1] parent_ind,
                   np.ndarray[np.int64_t, ndim=1] level,
-                  np.ndarray[np.int64_t, ndim=1] num_children):
+                  np.ndarray[np.int64_t, ndim=1] num_children,
+                  int refine_by = 2):
 
         cdef int i, j, k
         cdef np.ndarray[np.int_t, ndim=1] child_ptr
@@ -69,14 +71,17 @@ cdef class GridTree:
         self.num_grids = num_grids
         self.num_root_grids = 0
         self.num_leaf_grids = 0
+        self.refine_by = refine_by
+        self.visit_order = NULL
+        self.num_visit = 0
         
         self.grids = <GridTreeNode *> malloc(
                 sizeof(GridTreeNode) * num_grids)
                 
         for i in range(num_grids):
-            self.grids[i] = Grid_initialize(left_edge[i,:],
-                                            right_edge[i,:],
-                                            dimensions[i,:],
+            self.grids[i] = Grid_initialize(left_edge,
+                                            right_edge,
+                                            dimensions,
                                             num_children[i],
                                             level[i], i)
             if level[i] == 0:
@@ -101,8 +106,51 @@ cdef class GridTree:
     def __init__(self, *args, **kwargs):
         self.mask = None
 
+    def __dealloc__(self):
+        cdef int i
+        # The root grids are copies of nodes in self.grids, so they share
+        # their children arrays and must not free them a second time.
+        if self.grids != NULL:
+            for i in range(self.num_grids):
+                if self.grids[i].children != NULL:
+                    free(self.grids[i].children)
+            free(self.grids)
+        if self.root_grids != NULL:
+            free(self.root_grids)
+        if self.visit_order != NULL:
+            free(self.visit_order)
+
     def __iter__(self):
         yield self
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def set_visit_order(self, order):
+        """
+        Restrict selection to the grids with indices *order*, visited in that
+        order rather than by recursing down from the root grids.  This allows
+        the cells selected by the tree to line up with data read grid by grid
+        in the same order.  Passing None restores the recursive traversal.
+        """
+        cdef int i
+        cdef np.ndarray[np.int64_t, ndim=1] arr
+        if self.visit_order != NULL:
+            free(self.visit_order)
+            self.visit_order = NULL
+            self.num_visit = 0
+        # Any mask computed so far was laid out for the previous order.
+        self.mask = None
+        if order is None:
+            return
+        arr = np.asarray(order, dtype="int64").ravel()
+        for i in range(arr.shape[0]):
+            if arr[i] < 0 or arr[i] >= self.num_grids:
+                raise IndexError("Grid index %s is out of range." % arr[i])
+        self.visit_order = <np.int64_t *> malloc(
+                sizeof(np.int64_t) * max(arr.shape[0], 1))
+        for i in range(arr.shape[0]):
+            self.visit_order[i] = arr[i]
+        self.num_visit = arr.shape[0]
     
     @cython.boundscheck(False)
     @cython.wraparound(False)
@@ -155,7 +203,7 @@ cdef class GridTree:
         data.n_tuples = 0
         data.child_tuples = NULL
         data.array = NULL
-        data.ref_factor = 2 #### FIX THIS
+        data.ref_factor = self.refine_by
 
     cdef void visit_grids(self, GridVisitorData *data,
                           grid_visitor_function *func,
@@ -169,11 +217,31 @@ cdef class GridTree:
         cdef np.uint8_t *buf = NULL
         if self.mask is not None:
             buf = self.mask.buf
-        for i in range(self.num_root_grids):
-            grid = &self.root_grids[i]
-            self.recursively_visit_grid(data, func, selector, grid, buf)
+        if self.visit_order != NULL:
+            for i in range(self.num_visit):
+                grid = &self.grids[self.visit_order[i]]
+                self.visit_grid(data, func, selector, grid, buf)
+        else:
+            for i in range(self.num_root_grids):
+                grid = &self.root_grids[i]
+                self.recursively_visit_grid(data, func, selector, grid, buf)
         grid_visitors.free_tuples(data)
 
+    cdef int visit_grid(self, GridVisitorData *data,
+                        grid_visitor_function *func,
+                        SelectorObject selector,
+                        GridTreeNode *grid,
+                        np.uint8_t *buf = NULL):
+        # Visit the cells of this grid alone, returning whether its bounding
+        # box was selected.
+        data.grid = grid
+        if selector.select_bbox(grid.left_edge, grid.right_edge) == 0:
+            # Note that this does not increment the global_index.
+            return 0
+        grid_visitors.setup_tuples(data)
+        selector.visit_grid_cells(data, func, buf)
+        return 1
+
     cdef void recursively_visit_grid(self, GridVisitorData *data,
                                      grid_visitor_function *func,
                                      SelectorObject selector,
@@ -182,12 +250,8 @@ cdef class GridTree:
         # Visit this grid and all of its child grids, with a given grid visitor
         # function.  We early terminate if we are not selected by the selector.
         cdef int i
-        data.grid = grid
-        if selector.select_bbox(grid.left_edge, grid.right_edge) == 0:
-            # Note that this does not increment the global_index.
+        if self.visit_grid(data, func, selector, grid, buf) == 0:
             return
-        grid_visitors.setup_tuples(data)
-        selector.visit_grid_cells(data, func, buf)
         for i in range(grid.num_children):
             self.recursively_visit_grid(data, func, selector, grid.children[i],
                                         buf)
@@ -204,6 +268,9 @@ cdef class GridTree:
                      self.grids[i].dims[2])
         cdef bitarray mask = bitarray(size)
         data.array = <void*>mask.buf
+        # A mask left over from a previous selector must not be used while
+        # building the mask for this one.
+        self.mask = None
         self.visit_grids(&data, grid_visitors.mask_cells, selector)
         self.mask = mask
         size = 0
@@ -25,7 +25,7 @@ from yt.config import ytcfg
 from yt.funcs import \
     ensure_list, ensure_numpy_array
 from yt.geometry.geometry_handler import \
-    Index, YTDataChunk, ChunkDataCache
+    Index, YTDataChunk, ChunkDataCache, SelectorMaskCache
 from yt.utilities.definitions import MAXLEVEL
 from yt.utilities.logger import ytLogger as mylog
 from .grid_container import \
@@ -36,6 +36,11 @@ class GridIndex(Index):
     """The index class for patch and block AMR datasets. """
     float_type = 'float64'
     _preload_implemented = False
+    _fast_index_failed = False
+    # Data objects selected by grid membership rather than by their geometry,
+    # which the grid tree cannot reproduce.
+    _fast_index_excluded = ("grid", "data_collection")
+    _selector_mask_cache = None
     _index_properties = ("grid_left_edge", "grid_right_edge",
                          "grid_levels", "grid_particle_count",
                          "grid_dimensions")
@@ -113,6 +118,19 @@ class GridIndex(Index):
         for g in self.grids: g.clear_data()
         self.io.queue.clear()
 
+    @property
+    def selector_mask_cache(self):
+        """
+        The cache of selector masks shared by the grids of this index.  Its
+        size in megabytes is set by the ``selector_mask_cache_size``
+        configuration option.
+        """
+        if self._selector_mask_cache is None:
+            size = ytcfg.getfloat("yt", "selector_mask_cache_size")
+            self._selector_mask_cache = \
+                SelectorMaskCache(int(size * 1024 * 1024))
+        return self._selector_mask_cache
+
     def get_smallest_dx(self):
         """
         Returns (in code units) the smallest cell size in the simulation.
@@ -252,36 +270,64 @@ class GridIndex(Index):
         return self.grids[ind], ind
 
     def _get_grid_tree(self):
-
-        left_edge = self.ds.arr(np.zeros((self.num_grids, 3)),
-                               'code_length')
-        right_edge = self.ds.arr(np.zeros((self.num_grids, 3)),
-                                'code_length')
-        level = np.zeros((self.num_grids), dtype='int64')
-        parent_ind = np.zeros((self.num_grids), dtype='int64')
-        num_children = np.zeros((self.num_grids), dtype='int64')
-        dimensions = np.zeros((self.num_grids, 3), dtype="int32")
-
-        for i, grid in enumerate(self.grids) :
-
-            left_edge[i,:] = grid.LeftEdge
-            right_edge[i,:] = grid.RightEdge
-            level[i] = grid.Level
-            if grid.Parent is None :
-                parent_ind[i] = -1
-            else :
-                parent_ind[i] = grid.Parent.id - grid.Parent._id_offset
-            num_children[i] = np.int64(len(grid.Children))
-            dimensions[i,:] = grid.ActiveDimensions
-
+        # The parent/child structure is gathered from the grid objects only
+        # once; the tree itself is cheap to build from these arrays and is
+        # created anew each time, since selecting with it stores state on it.
+        if getattr(self, "_grid_tree_structure", None) is None:
+            parent_ind = np.empty(self.num_grids, dtype='int64')
+            num_children = np.empty(self.num_grids, dtype='int64')
+            for i, grid in enumerate(self.grids):
+                if grid.Parent is None:
+                    parent_ind[i] = -1
+                else:
+                    parent_ind[i] = grid.Parent.id - grid.Parent._id_offset
+                num_children[i] = len(grid.Children)
+            self._grid_tree_structure = (parent_ind, num_children)
+        parent_ind, num_children = self._grid_tree_structure
+        left_edge = np.ascontiguousarray(self.grid_left_edge,
+                                         dtype='float64')
+        right_edge = np.ascontiguousarray(self.grid_right_edge,
+                                          dtype='float64')
+        level = np.ascontiguousarray(self.grid_levels[:, 0], dtype='int64')
+        dimensions = np.ascontiguousarray(self.grid_dimensions,
+                                          dtype='int32')
         return GridTree(self.num_grids, left_edge, right_edge, dimensions,
-                        parent_ind, level, num_children)
+                        parent_ind, level, num_children,
+                        refine_by = int(getattr(self.ds, "refine_by", 2)))
+
+    def _get_fast_index(self, dobj):
+        """
+        Return a grid tree that counts and selects the cells of *dobj* in the
+        order of its grids, or None if *dobj* should be selected grid by
+        grid.
+        """
+        if dobj._type_name in self._fast_index_excluded:
+            return None
+        use_fast_index = getattr(dobj, "use_fast_index", None)
+        if use_fast_index is None:
+            use_fast_index = ytcfg.getboolean("yt", "fast_grid_index")
+        if not use_fast_index:
+            return None
+        # The grid tree assumes a single integer refinement factor.
+        refine_by = getattr(self.ds, "refine_by", 2)
+        if self._fast_index_failed or np.ndim(refine_by) != 0 or \
+           int(refine_by) != refine_by:
+            return None
+        try:
+            fast_index = self._get_grid_tree()
+        except RuntimeError:
+            mylog.warning("The grid tree could not be built for %s; "
+                          "selecting grid by grid instead.", self.ds)
+            self._fast_index_failed = True
+            return None
+        fast_index.set_visit_order(
+            [g.id - g._id_offset for g in dobj._chunk_info])
+        return fast_index
 
     def convert(self, unit):
         return self.dataset.conversion_factors[unit]
 
     def _identify_base_chunk(self, dobj):
-        fast_index = None
         if dobj._type_name == "grid":
             dobj._chunk_info = np.empty(1, dtype='object')
             dobj._chunk_info[0] = weakref.proxy(dobj)
@@ -297,9 +343,7 @@ class GridIndex(Index):
             dobj._chunk_info = np.empty(len(grids), dtype='object')
             for i, g in enumerate(grids):
                 dobj._chunk_info[i] = g
-        # These next two lines, when uncommented, turn "on" the fast index.
-        #if dobj._type_name != "grid":
-        #    fast_index = self._get_grid_tree()
+        fast_index = self._get_fast_index(dobj)
         if getattr(dobj, "size", None) is None:
             dobj.size = self._count_selection(dobj, fast_index = fast_index)
         if getattr(dobj, "shape", None) is None:
@@ -354,7 +398,6 @@ class GridIndex(Index):
         preload_fields, _ = self._split_fields(preload_fields)
         gfiles = defaultdict(list)
         gobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
-        fast_index = dobj._current_chunk._fast_index
         for g in gobjs:
             # Force to be a string because sometimes g.filename is None.
             gfiles[str(g.filename)].append(g)
@@ -380,9 +423,11 @@ class GridIndex(Index):
             gs = gfiles[fn]
             for grids in (gs[pos:pos + size] for pos
                           in range(0, len(gs), size)):
+                # The fast index covers every grid of dobj, so it cannot be
+                # used for chunks holding only some of them.
                 dc = YTDataChunk(dobj, "io", grids,
                         self._count_selection(dobj, grids),
-                        cache = cache, fast_index = fast_index)
+                        cache = cache)
                 # We allow four full chunks to be included.
                 with self.io.preload(dc, preload_fields, 
                             4.0 * size):
@@ -15,16 +15,50 @@ Particle-only geometry handler
 #-----------------------------------------------------------------------------
 
 import collections
+import multiprocessing
 import numpy as np
 import os
 import weakref
 
+from yt.config import ytcfg
 from yt.funcs import only_on_root
 from yt.utilities.logger import ytLogger as mylog
 from yt.data_objects.octree_subset import ParticleOctreeSubset
 from yt.geometry.geometry_handler import Index, YTDataChunk
 from yt.geometry.particle_oct_container import \
     ParticleOctreeContainer, ParticleRegions
+from yt.utilities.index_cache import \
+    file_stats, load_index_cache, save_index_cache
+
+# Bump this whenever the layout of the on-disk index cache changes, so that
+# stale caches written by older versions are ignored.
+INDEX_CACHE_VERSION = 1
+
+# The index being built by a pool of worker processes.  The workers are
+# forked, so they inherit this rather than having the index pickled.
+_worker_index = None
+
+def _index_data_file(i):
+    index = _worker_index
+    data_file = index.data_files[i]
+    morton = index.io._initialize_index(data_file, index.regions)
+    # Only hand back the region cells this file touched, rather than the
+    # full mask, to keep what is sent back to the parent small.
+    fid = data_file.file_id
+    mask = index.regions.masks[fid // 64]
+    cells = np.flatnonzero(mask & (np.uint64(1) << np.uint64(fid % 64)))
+    return morton, cells
+
+def _get_fork_context():
+    try:
+        return multiprocessing.get_context("fork")
+    except AttributeError:
+        # Python 2 always forks on posix systems.
+        if os.name == "posix":
+            return multiprocessing
+    except ValueError:
+        pass
+    return None
 
 class ParticleIndex(Index):
     """The Index subclass for particle datasets"""
@@ -109,33 +143,148 @@ class ParticleIndex(Index):
         only_on_root(mylog.info, "Identified %0.3e octs", tot)
 
     def _initialize_indices(self):
-        # This will be replaced with a parallel-aware iteration step.
-        # Roughly outlined, what we will do is:
-        #   * Generate Morton indices on each set of files that belong to
-        #     an individual processor
-        #   * Create a global, accumulated histogram
-        #   * Cut based on estimated load balancing
-        #   * Pass particles to specific processors, along with NREF buffer
-        #   * Broadcast back a serialized octree to join
-        #
-        # For now we will do this in serial.
         index_ptype = self.index_ptype
         # Set the index_ptype attribute of self.io dynamically here, so we don't
         # need to assume that the dataset has the attribute.
         self.io.index_ptype = index_ptype
-        morton = np.empty(self.total_particles, dtype="uint64")
-        ind = 0
-        for data_file in self.data_files:
-            if index_ptype == "all":
-                npart = sum(data_file.total_particles.values())
+        fn = self.index_cache_filename
+        morton = None
+        if fn is not None:
+            morton = self._load_index_cache(fn)
+        if morton is None:
+            morton = self._build_morton_index()
+            if fn is not None:
+                self._save_index_cache(fn, morton)
+        # Now we add them all at once.
+        self.oct_handler.add(morton)
+
+    def _build_morton_index(self):
+        # The data files are split into contiguous groups holding roughly
+        # equal numbers of particles.  In parallel each processor generates
+        # the Morton indices for one group, and these are then joined so
+        # that every processor builds the full octree.  On a single
+        # processor the files can instead be farmed out to a pool of local
+        # worker processes, controlled by the particle_index_nprocs option.
+        if self.comm.size > 1:
+            morton = self._build_morton_index_mpi()
+        else:
+            nprocs = ytcfg.getint("yt", "particle_index_nprocs")
+            if nprocs <= 0:
+                nprocs = multiprocessing.cpu_count()
+            nprocs = min(nprocs, len(self.data_files))
+            ctx = _get_fork_context()
+            if nprocs > 1 and ctx is None:
+                mylog.debug("Cannot fork worker processes, building the "
+                            "particle index in serial.")
+            if nprocs > 1 and ctx is not None:
+                morton = self._build_morton_index_pool(ctx, nprocs)
             else:
-                npart = data_file.total_particles[index_ptype]
+                morton = self._build_morton_index_serial(self.data_files)
+        morton.sort()
+        return morton
+
+    def _data_file_particle_count(self, data_file):
+        if self.index_ptype == "all":
+            return sum(data_file.total_particles.values())
+        return data_file.total_particles[self.index_ptype]
+
+    def _build_morton_index_serial(self, data_files):
+        counts = [self._data_file_particle_count(df) for df in data_files]
+        morton = np.empty(sum(counts), dtype="uint64")
+        ind = 0
+        for data_file, npart in zip(data_files, counts):
             morton[ind:ind + npart] = \
                 self.io._initialize_index(data_file, self.regions)
             ind += npart
-        morton.sort()
-        # Now we add them all at once.
-        self.oct_handler.add(morton)
+        return morton
+
+    def _build_morton_index_mpi(self):
+        counts = np.array([self._data_file_particle_count(df)
+                           for df in self.data_files], dtype="int64")
+        cuts = np.linspace(0, counts.sum(), self.comm.size + 1)[1:-1]
+        bounds = np.searchsorted(counts.cumsum(), cuts, side="right")
+        my_files = np.split(np.arange(len(self.data_files)),
+                            bounds)[self.comm.rank]
+        morton = self._build_morton_index_serial(
+            [self.data_files[i] for i in my_files])
+        morton = self.comm.par_combine_object(morton, datatype="array",
+                                              op="cat")
+        # Each file only ever sets its own bit, so summing the masks is the
+        # same as or-ing them together.
+        for i, mask in enumerate(self.regions.masks):
+            mask = self.comm.mpi_allreduce(mask.view("int64"), op="sum")
+            self.regions.masks[i] = mask.view("uint64")
+        return morton
+
+    def _build_morton_index_pool(self, ctx, nprocs):
+        global _worker_index
+        only_on_root(mylog.info, "Building particle index with %s processes",
+                     nprocs)
+        morton = np.empty(self.total_particles, dtype="uint64")
+        ind = 0
+        _worker_index = self
+        pool = ctx.Pool(nprocs)
+        try:
+            results = pool.imap(_index_data_file, range(len(self.data_files)))
+            for data_file, (dmorton, cells) in zip(self.data_files, results):
+                morton[ind:ind + dmorton.size] = dmorton
+                ind += dmorton.size
+                fid = data_file.file_id
+                mask = self.regions.masks[fid // 64].reshape(-1)
+                mask[cells] |= np.uint64(1) << np.uint64(fid % 64)
+        finally:
+            pool.close()
+            pool.join()
+            _worker_index = None
+        return morton
+
+    @property
+    def index_cache_filename(self):
+        """
+        The name of the file the Morton index is cached in, or None if the
+        index should not be cached for this dataset.
+        """
+        fn = getattr(self.dataset, "index_cache_filename", None)
+        if fn is not None:
+            return fn
+        if not ytcfg.getboolean("yt", "cache_particle_index"):
+            return None
+        # Without files on disk there is nothing to validate a cache against.
+        if not all(os.path.isfile(df.filename) for df in self.data_files):
+            return None
+        return "%s.index%s_%s.npz" % (self.index_filename,
+            self.dataset.n_ref, self.dataset.over_refine_factor)
+
+    def _index_cache_key(self):
+        # Everything the cached index depends on.  If any of these change the
+        # cache is considered stale and is rebuilt.
+        masks = self.regions.masks
+        key = dict(
+            version = np.array(INDEX_CACHE_VERSION),
+            n_ref = np.array(self.dataset.n_ref),
+            over_refine_factor = np.array(self.dataset.over_refine_factor),
+            index_ptype = np.array(self.index_ptype),
+            total_particles = np.array(self.total_particles),
+            region_dims = np.array((len(masks),) + masks[0].shape))
+        key.update(file_stats([df.filename for df in self.data_files]))
+        return key
+
+    def _load_index_cache(self, fn):
+        """
+        Load the sorted Morton indices and the file masks from *fn*, returning
+        the Morton indices or None if the cache is missing or stale.
+        """
+        cache = load_index_cache(fn, self._index_cache_key())
+        if cache is None:
+            return None
+        self.regions.masks = list(cache["masks"])
+        only_on_root(mylog.info, "Loaded particle index from %s", fn)
+        return cache["morton"]
+
+    def _save_index_cache(self, fn, morton):
+        save_index_cache(fn, self._index_cache_key(),
+                         dict(morton = morton,
+                              masks = np.array(self.regions.masks)))
 
     def _detect_output_fields(self):
         # TODO: Add additional fields
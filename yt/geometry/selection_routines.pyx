@@ -1468,6 +1468,62 @@ cdef class RaySelector(SelectorObject):
         if total == 0: return None
         return mask.astype("bool")
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    @cython.cdivision(True)
+    cdef void visit_grid_cells(self, GridVisitorData *data,
+                              grid_visitor_function *func,
+                              np.uint8_t *cached_mask = NULL):
+        # Testing cells one at a time walks the ray through each of them, so
+        # instead we walk it through the whole grid at once, as fill_mask
+        # does, and then visit the cells it crossed.
+        cdef int i, j, k, n, di
+        cdef int *tup
+        cdef VolumeContainer vc
+        cdef IntegrationAccumulator ia
+        if cached_mask != NULL:
+            SelectorObject.visit_grid_cells(self, data, func, cached_mask)
+            return
+        if data.grid.level < self.min_level or \
+           data.grid.level > self.max_level:
+            return
+        n = 1
+        for i in range(3):
+            vc.left_edge[i] = data.grid.left_edge[i]
+            vc.right_edge[i] = data.grid.right_edge[i]
+            vc.dds[i] = data.grid.dds[i]
+            vc.idds[i] = 1.0/data.grid.dds[i]
+            vc.dims[i] = data.grid.dims[i]
+            n *= data.grid.dims[i]
+        ia.t = <np.float64_t *> malloc(sizeof(np.float64_t) * n)
+        ia.dt = <np.float64_t *> malloc(sizeof(np.float64_t) * n)
+        ia.child_mask = <np.uint8_t *> malloc(sizeof(np.uint8_t) * n)
+        ia.hits = 0
+        for di in range(n):
+            ia.dt[di] = -1
+            ia.child_mask[di] = 1
+        if data.grid.level < self.max_level:
+            for di in range(data.n_tuples):
+                tup = data.child_tuples[di]
+                for i in range(tup[0], tup[1] + 1):
+                    for j in range(tup[2], tup[3] + 1):
+                        for k in range(tup[4], tup[5] + 1):
+                            ia.child_mask[(i*vc.dims[1]+j)*vc.dims[2]+k] = 0
+        walk_volume(&vc, self.p1, self.vec, dt_sampler, <void*> &ia)
+        di = 0
+        for i in range(vc.dims[0]):
+            data.pos[0] = i
+            for j in range(vc.dims[1]):
+                data.pos[1] = j
+                for k in range(vc.dims[2]):
+                    data.pos[2] = k
+                    func(data, ia.dt[di] >= 0)
+                    data.global_index += 1
+                    di += 1
+        free(ia.t)
+        free(ia.dt)
+        free(ia.child_mask)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.cdivision(True)
@@ -15,8 +15,9 @@ Tests for GridTree
 import numpy as np
 import random
 
+from yt.config import ytcfg
 from yt.testing import \
-    assert_equal, assert_raises
+    assert_equal, assert_raises, fake_amr_ds
 from yt.frontends.stream.api import \
     load_amr_grids
 
@@ -124,3 +125,38 @@ def test_grid_arrays_view():
     assert_equal(grid_arr['right_edge'], ds.index.grid_right_edge)
     assert_equal(grid_arr['dims'], ds.index.grid_dimensions)
     assert_equal(grid_arr['level'], ds.index.grid_levels[:,0])
+
+def test_fast_index():
+    """Selection with the grid tree matches selection grid by grid"""
+    for ds in (setup_test_ds(), fake_amr_ds(fields=["Density"])):
+        field = ds.field_list[0]
+        dobjs = [lambda: ds.sphere([0.5, 0.5, 0.5], 0.2),
+                 lambda: ds.sphere([0.05, 0.05, 0.05], 0.2),
+                 lambda: ds.region([0.5]*3, [0.2]*3, [0.71, 0.8, 0.9]),
+                 lambda: ds.ray([0.1, 0.2, 0.3], [0.9, 0.8, 0.7]),
+                 lambda: ds.ortho_ray(0, (0.3, 0.4)),
+                 lambda: ds.slice(2, 0.53),
+                 lambda: ds.all_data()]
+        for make_dobj in dobjs:
+            dobj1 = make_dobj()
+            dobj2 = make_dobj()
+            dobj2.use_fast_index = True
+            assert_equal(dobj1[field], dobj2[field])
+            assert dobj1._current_chunk._fast_index is None
+            assert dobj2._current_chunk._fast_index is not None
+            assert_equal(dobj1.size, dobj2.size)
+            for attr in ("fcoords", "icoords", "fwidth", "ires"):
+                assert_equal(getattr(dobj1, attr), getattr(dobj2, attr))
+
+    # The configuration option turns the fast index on for every object.
+    old_value = ytcfg.get("yt", "fast_grid_index")
+    ytcfg["yt", "fast_grid_index"] = "True"
+    try:
+        dobj = ds.ray([0.1, 0.2, 0.3], [0.9, 0.8, 0.7])
+        dobj["t"]
+        assert dobj._current_chunk._fast_index is not None
+        dobj.use_fast_index = False
+        dobj.fcoords
+        assert dobj._current_chunk._fast_index is None
+    finally:
+        ytcfg["yt", "fast_grid_index"] = old_value
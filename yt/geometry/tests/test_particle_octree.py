@@ -15,7 +15,13 @@ Tests for particle octree
 
 
 import numpy as np
+import os
+import shutil
+import tempfile
 
+from yt.config import ytcfg
+from yt.convenience import load
+from yt.frontends.gadget.testing import fake_gadget_binary
 from yt.frontends.stream.data_structures import load_particles
 from yt.geometry.oct_container import \
     OctreeContainer
@@ -27,7 +33,9 @@ from yt.geometry.selection_routines import RegionSelector, AlwaysSelector
 from yt.testing import \
     assert_almost_equal, \
     assert_equal, \
-    requires_file
+    fake_random_ds, \
+    requires_file, \
+    requires_module
 from yt.units.unit_registry import UnitRegistry
 from yt.units.yt_array import YTArray
 from yt.utilities.lib.geometry_utils import get_morton_indices
@@ -245,3 +253,75 @@ def test_get_smallest_dx():
     small_dx = (
         ds.domain_width / (ds.domain_dimensions*2.**(ds.index.max_level)))
     assert_equal(ds.index.get_smallest_dx(), small_dx)
+
+@requires_module("h5py")
+def test_particle_index_cache():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+    old_setting = ytcfg.get("yt", "cache_particle_index")
+    ytcfg["yt", "cache_particle_index"] = "True"
+    try:
+        ds = fake_random_ds(16)
+        sp = ds.sphere(ds.domain_center, 0.25)
+        fn = sp.save_as_dataset(fields=["density"])
+
+        ds1 = load(fn)
+        cache_fn = ds1.index.index_cache_filename
+        assert os.path.isfile(cache_fn)
+        counts1 = ds1.index.oct_handler.recursively_count()
+        cv1 = ds1.all_data()["index", "cell_volume"].sum(dtype="float64")
+
+        # The second load must come from the cache and be identical.
+        ds2 = load(fn)
+        assert_equal(ds2.index.index_cache_filename, cache_fn)
+        assert_equal(ds2.index.oct_handler.recursively_count(), counts1)
+        assert_equal(ds2.index.regions.masks, ds1.index.regions.masks)
+        cv2 = ds2.all_data()["index", "cell_volume"].sum(dtype="float64")
+        assert_equal(cv1, cv2)
+
+        # Touching the data file invalidates the cache, which gets rebuilt.
+        mtime = os.stat(fn).st_mtime + 10
+        os.utime(fn, (mtime, mtime))
+        ds3 = load(fn)
+        key = ds3.index._index_cache_key()
+        with np.load(cache_fn) as cache:
+            assert_equal(cache["file_mtimes"], key["file_mtimes"])
+        assert_equal(ds3.index.oct_handler.recursively_count(), counts1)
+
+        # A different n_ref gets its own cache.
+        ds4 = load(fn, n_ref=32)
+        assert ds4.index.index_cache_filename != cache_fn
+        assert os.path.isfile(ds4.index.index_cache_filename)
+    finally:
+        ytcfg["yt", "cache_particle_index"] = old_setting
+        os.chdir(curdir)
+        shutil.rmtree(tmpdir)
+
+def test_particle_index_nprocs():
+    tmpdir = tempfile.mkdtemp()
+    curdir = os.getcwd()
+    os.chdir(tmpdir)
+    old_cache = ytcfg.get("yt", "cache_particle_index")
+    old_nprocs = ytcfg.get("yt", "particle_index_nprocs")
+    ytcfg["yt", "cache_particle_index"] = "False"
+    try:
+        np.random.seed(int(0x4d3d3d3))
+        for i in range(4):
+            fake_gadget_binary("snap.%s" % i, num_files=4)
+        ytcfg["yt", "particle_index_nprocs"] = "1"
+        ds1 = load("snap.0")
+        assert_equal(len(ds1.index.data_files), 4)
+        ytcfg["yt", "particle_index_nprocs"] = "2"
+        ds2 = load("snap.0")
+        assert_equal(ds2.index.oct_handler.recursively_count(),
+                     ds1.index.oct_handler.recursively_count())
+        assert_equal(ds2.index.regions.masks, ds1.index.regions.masks)
+        cv1 = ds1.all_data()["index", "cell_volume"].sum(dtype="float64")
+        cv2 = ds2.all_data()["index", "cell_volume"].sum(dtype="float64")
+        assert_equal(cv1, cv2)
+    finally:
+        ytcfg["yt", "cache_particle_index"] = old_cache
+        ytcfg["yt", "particle_index_nprocs"] = old_nprocs
+        os.chdir(curdir)
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,77 @@
+"""
+Tests for the selector mask cache
+
+
+
+"""
+
+#-----------------------------------------------------------------------------
+# Copyright (c) 2019, yt Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+
+from yt.geometry.geometry_handler import \
+    SelectorMaskCache
+from yt.testing import \
+    assert_equal, \
+    fake_random_ds
+
+
+def test_selector_mask_cache():
+    ds = fake_random_ds(16, nprocs=8)
+    grids = ds.index.grids
+    sp1 = ds.sphere([0.5, 0.5, 0.5], 0.25)
+    sp2 = ds.sphere([0.25, 0.25, 0.25], 0.1)
+    mask = np.ones((8, 8, 8), dtype="bool")
+
+    # Each mask uses 512 bytes plus the per-entry overhead, so three fit.
+    cache = SelectorMaskCache(3 * (512 + SelectorMaskCache._entry_overhead))
+    assert cache.get(sp1.selector, grids[0]) is None
+    for g in grids[:3]:
+        cache.add(sp1.selector, g, mask, 512)
+    assert_equal(len(cache), 3)
+    rv = cache.get(sp1.selector, grids[0])
+    assert rv[0] is mask
+    assert_equal(rv[1], 512)
+    # A different selector on the same grid is a separate entry.
+    assert cache.get(sp2.selector, grids[0]) is None
+
+    # grids[1] is now the least recently used mask, so it is evicted first.
+    cache.add(sp1.selector, grids[3], mask, 512)
+    assert_equal(len(cache), 3)
+    assert_equal(cache.evictions, 1)
+    assert cache.get(sp1.selector, grids[1]) is None
+    assert cache.get(sp1.selector, grids[0]) is not None
+    assert_equal((cache.hits, cache.misses), (2, 3))
+    assert_equal(cache.hit_rate, 0.4)
+
+    cache.clear()
+    assert_equal(len(cache), 0)
+    assert_equal(cache.nbytes, 0)
+    assert_equal(cache.hit_rate, 0.0)
+
+    # A cache without a budget holds nothing.
+    cache = SelectorMaskCache(0)
+    cache.add(sp1.selector, grids[0], mask, 512)
+    assert_equal(len(cache), 0)
+
+
+def test_selector_mask_cache_data_objects():
+    ds = fake_random_ds(16, nprocs=8)
+    cache = ds.index.selector_mask_cache
+    sp1 = ds.sphere([0.5, 0.5, 0.5], 0.25)
+    sp2 = ds.sphere([0.25, 0.25, 0.25], 0.1)
+    dens1 = sp1["density"]
+    dens2 = sp2["density"]
+    hits = cache.hits
+    # Alternating between the two objects reuses the cached masks.
+    for sp, dens in ((sp1, dens1), (sp2, dens2)):
+        new_sp = ds.sphere(sp.center, sp.radius)
+        assert_equal(new_sp["density"], dens)
+    assert cache.hits > hits
+    assert cache.nbytes <= cache.max_bytes
@@ -13,8 +13,10 @@ A wrapper class for h5py file objects.
 # The full license is in the file COPYING.txt, distributed with this software.
 #-----------------------------------------------------------------------------
 
+from yt.extern.six import b
 from yt.utilities.on_demand_imports import _h5py as h5py
 from yt.utilities.on_demand_imports import NotAModule
+from collections import OrderedDict
 from contextlib import contextmanager
 
 
@@ -65,6 +67,73 @@ class HDF5FileHandler(object):
             self.handle.close()
 
 
+class HDF5FileHandlePool(object):
+    """
+    A bounded, least-recently-used pool of open, read-only, low-level HDF5
+    file ids.
+
+    Handing out the same file id for repeated reads of a file avoids paying
+    the cost of opening the file and reading its metadata every time.  When
+    more than *max_open* files are held, the least recently used one is
+    released.  A released file id is only closed once nothing else holds a
+    reference to it, so ids that are still in use are never invalidated.
+
+    Parameters
+    ----------
+    max_open : int
+        The maximum number of file ids kept open by the pool.
+
+    Examples
+    --------
+    >>> pool = HDF5FileHandlePool(16)
+    >>> fid = pool.get("DD0010/moving7_0010.cpu0000")
+    >>> pool.hits, pool.misses
+    (0, 1)
+    """
+    def __init__(self, max_open=64):
+        if max_open < 1:
+            raise ValueError("max_open must be at least 1, not %s" % max_open)
+        self.max_open = max_open
+        self.hits = 0
+        self.misses = 0
+        self._fids = OrderedDict()
+
+    def get(self, filename):
+        """
+        Return an open low-level file id for *filename*, opening the file if
+        it is not already in the pool.
+        """
+        fid = self._fids.pop(filename, None)
+        if fid is None:
+            self.misses += 1
+            fid = h5py.h5f.open(b(filename), h5py.h5f.ACC_RDONLY)
+            while len(self._fids) >= self.max_open:
+                self._fids.popitem(last=False)
+        else:
+            self.hits += 1
+        self._fids[filename] = fid
+        return fid
+
+    def release(self, filename):
+        """
+        Drop *filename* from the pool, if it is there.
+        """
+        self._fids.pop(filename, None)
+
+    def clear(self):
+        """
+        Drop every file from the pool and reset the hit and miss counters.
+        """
+        self._fids.clear()
+        self.hits = self.misses = 0
+
+    def __contains__(self, filename):
+        return filename in self._fids
+
+    def __len__(self):
+        return len(self._fids)
+
+
 class FITSFileHandler(HDF5FileHandler):
     def __init__(self, filename):
         from yt.utilities.on_demand_imports import _astropy
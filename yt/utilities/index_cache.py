@@ -0,0 +1,98 @@
+"""
+Utilities for caching index structures on disk between sessions
+
+
+
+"""
+
+#-----------------------------------------------------------------------------
+# Copyright (c) 2019, yt Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+import os
+
+from yt.funcs import is_root
+from yt.utilities.logger import ytLogger as mylog
+
+
+def file_stats(filenames):
+    """
+    Return the sizes and modification times of *filenames*, as a dict of
+    arrays suitable for inclusion in a cache key.
+    """
+    stats = [os.stat(fn) for fn in filenames]
+    return dict(
+        file_sizes = np.array([st.st_size for st in stats], dtype="int64"),
+        file_mtimes = np.array([st.st_mtime for st in stats],
+                               dtype="float64"))
+
+
+def load_index_cache(fn, key):
+    """
+    Load the arrays stored in the index cache *fn*.
+
+    Every entry of *key* must match the value stored in the cache; if any
+    differ, or the cache does not exist or cannot be read, None is returned
+    and the caller should rebuild the index.
+
+    Parameters
+    ----------
+    fn : str
+        The name of the cache file.
+    key : dict
+        A mapping of names to arrays describing everything the cached
+        index depends on, for instance the sizes and modification times of
+        the files it was built from.
+
+    Returns
+    -------
+    A dict mapping the names of the cached arrays to the arrays, or None.
+    """
+    if fn is None or not os.path.isfile(fn):
+        return None
+    try:
+        with np.load(fn) as cache:
+            for k, v in key.items():
+                if k not in cache or not np.array_equal(cache[k], v):
+                    mylog.info("Index cache %s is stale, rebuilding.", fn)
+                    return None
+            data = dict((k, cache[k]) for k in cache.files if k not in key)
+    except (IOError, OSError, ValueError) as e:
+        mylog.warning("Could not read index cache %s: %s", fn, e)
+        return None
+    mylog.debug("Loaded index cache %s", fn)
+    return data
+
+
+def save_index_cache(fn, key, data):
+    """
+    Save the arrays in *data* to the index cache *fn*, along with the *key*
+    they are validated against when loaded by :func:`load_index_cache`.
+
+    Only the root processor writes the cache.  Failing to write the cache
+    (for instance because the dataset lives in a read-only directory) is
+    not an error.  Returns whether the cache was written.
+    """
+    if fn is None or not is_root():
+        return False
+    to_save = dict(data)
+    to_save.update(key)
+    # Write to a temporary file first so that concurrent readers never see a
+    # partially written cache.
+    tmp_fn = "%s.%s.tmp" % (fn, os.getpid())
+    try:
+        with open(tmp_fn, "wb") as f:
+            np.savez(f, **to_save)
+        os.rename(tmp_fn, fn)
+    except (IOError, OSError) as e:
+        mylog.info("Could not write index cache %s: %s", fn, e)
+        if os.path.exists(tmp_fn):
+            os.remove(tmp_fn)
+        return False
+    mylog.info("Saved index cache to %s", fn)
+    return True
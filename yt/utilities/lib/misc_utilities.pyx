@@ -15,6 +15,7 @@ Simple utilities that don't fit anywhere else
 
 from yt.funcs import get_pbar
 import numpy as np
+from multiprocessing import cpu_count
 from yt.units.yt_array import YTArray
 cimport numpy as np
 cimport cython
@@ -42,20 +43,22 @@ from cpython.exc cimport PyErr_CheckSignals
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def new_bin_profile1d(np.ndarray[np.intp_t, ndim=1] bins_x,
-                  np.ndarray[np.float64_t, ndim=1] wsource,
-                  np.ndarray[np.float64_t, ndim=2] bsource,
-                  np.ndarray[np.float64_t, ndim=1] wresult,
-                  np.ndarray[np.float64_t, ndim=2] bresult,
-                  np.ndarray[np.float64_t, ndim=2] mresult,
-                  np.ndarray[np.float64_t, ndim=2] qresult,
-                  np.ndarray[np.uint8_t, ndim=1, cast=True] used):
-    cdef int n, fi, bin
+cdef void _bin_profile_range(np.intp_t *bins,
+                             np.float64_t *wsource,
+                             np.float64_t *bsource,
+                             int nf, np.int64_t start, np.int64_t end,
+                             np.float64_t *wresult,
+                             np.float64_t *bresult,
+                             np.float64_t *mresult,
+                             np.float64_t *qresult,
+                             np.uint8_t *used) nogil:
+    # Bin samples start through end - 1 into flattened result arrays.  The
+    # bresult, mresult and qresult arrays have nf values per bin.
+    cdef np.int64_t n, bin, bi
+    cdef int fi
     cdef np.float64_t wval, bval, oldwr, bval_mresult
-    cdef int nb = bins_x.shape[0]
-    cdef int nf = bsource.shape[1]
-    for n in range(nb):
-        bin = bins_x[n]
+    for n in range(start, end):
+        bin = bins[n]
         wval = wsource[n]
         # Skip field value entries where the weight field is zero
         if wval == 0:
@@ -63,20 +66,139 @@ def new_bin_profile1d(np.ndarray[np.intp_t, ndim=1] bins_x,
         oldwr = wresult[bin]
         wresult[bin] += wval
         for fi in range(nf):
-            bval = bsource[n,fi]
-            bval_mresult = bval - mresult[bin,fi]
+            bi = bin * nf + fi
+            bval = bsource[n * nf + fi]
+            bval_mresult = bval - mresult[bi]
             # qresult has to have the previous wresult
-            qresult[bin,fi] += oldwr * wval * bval_mresult * bval_mresult / \
+            qresult[bi] += oldwr * wval * bval_mresult * bval_mresult / \
                 (oldwr + wval)
-            bresult[bin,fi] += wval*bval
+            bresult[bi] += wval*bval
             # mresult needs the new wresult
-            mresult[bin,fi] += wval * bval_mresult / wresult[bin]
+            mresult[bi] += wval * bval_mresult / wresult[bin]
         used[bin] = 1
-    return
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
+cdef void _merge_profile_bins(np.int64_t nbins, int nf, int nparts,
+                              np.float64_t *pw,
+                              np.float64_t *pb,
+                              np.float64_t *pm,
+                              np.float64_t *pq,
+                              np.int64_t start, np.int64_t end,
+                              np.float64_t *wresult,
+                              np.float64_t *bresult,
+                              np.float64_t *mresult,
+                              np.float64_t *qresult,
+                              np.uint8_t *used) nogil:
+    # Combine the partial accumulators of nparts blocks of samples into the
+    # results for bins start through end - 1, using the pairwise update of
+    # Chan et al. for the weighted mean and sum of squared deviations.
+    cdef np.int64_t bin, bi, pi
+    cdef int fi, p
+    cdef np.float64_t wa, wb, w, delta
+    for bin in range(start, end):
+        for p in range(nparts):
+            wb = pw[p * nbins + bin]
+            if wb == 0:
+                continue
+            wa = wresult[bin]
+            w = wa + wb
+            for fi in range(nf):
+                bi = bin * nf + fi
+                pi = (p * nbins + bin) * nf + fi
+                delta = pm[pi] - mresult[bi]
+                qresult[bi] += pq[pi] + wa * wb * delta * delta / w
+                mresult[bi] += wb * delta / w
+                bresult[bi] += pb[pi]
+            wresult[bin] = w
+            used[bin] = 1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef _bin_profile(np.ndarray[np.intp_t, ndim=1] bins,
+                  np.ndarray wsource, np.ndarray bsource,
+                  np.ndarray wresult, np.ndarray bresult,
+                  np.ndarray mresult, np.ndarray qresult,
+                  np.ndarray used, int num_threads):
+    # Bin samples into flattened copies of the result arrays, splitting them
+    # between num_threads threads that each fill their own partial
+    # accumulators, which are merged into the results at the end.
+    cdef np.int64_t nb = bins.shape[0]
+    cdef np.int64_t nbins = wresult.size
+    cdef int nf = bsource.shape[1]
+    cdef int nparts, p
+    cdef np.int64_t bstart, bend
+    if nb == 0 or nbins == 0:
+        return
+    if num_threads <= 0:
+        num_threads = cpu_count()
+    # Each block has to fill and merge a full set of bins, so only split the
+    # samples when there are many more of them than bins.
+    nparts = <int> min(num_threads, nb // nbins)
+    cdef np.ndarray[np.float64_t, ndim=1] ws = \
+        np.ascontiguousarray(wsource, dtype="float64")
+    cdef np.ndarray[np.float64_t, ndim=2] bs = \
+        np.ascontiguousarray(bsource, dtype="float64")
+    cdef np.ndarray[np.float64_t, ndim=1] wr = \
+        np.ascontiguousarray(wresult).reshape(-1)
+    cdef np.ndarray[np.float64_t, ndim=1] br = \
+        np.ascontiguousarray(bresult).reshape(-1)
+    cdef np.ndarray[np.float64_t, ndim=1] mr = \
+        np.ascontiguousarray(mresult).reshape(-1)
+    cdef np.ndarray[np.float64_t, ndim=1] qr = \
+        np.ascontiguousarray(qresult).reshape(-1)
+    cdef np.ndarray[np.uint8_t, ndim=1] ur = \
+        np.ascontiguousarray(used).view("uint8").reshape(-1)
+    cdef np.ndarray[np.float64_t, ndim=1] pw
+    cdef np.ndarray[np.float64_t, ndim=1] pb, pm, pq
+    cdef np.ndarray[np.uint8_t, ndim=1] pu
+    if nparts <= 1:
+        _bin_profile_range(&bins[0], &ws[0], &bs[0,0], nf, 0, nb,
+                           &wr[0], &br[0], &mr[0], &qr[0], &ur[0])
+    else:
+        pw = np.zeros(nparts * nbins, dtype="float64")
+        pb = np.zeros(nparts * nbins * nf, dtype="float64")
+        pm = np.zeros(nparts * nbins * nf, dtype="float64")
+        pq = np.zeros(nparts * nbins * nf, dtype="float64")
+        pu = np.zeros(nparts * nbins, dtype="uint8")
+        with nogil:
+            for p in prange(nparts, schedule='static',
+                            num_threads=nparts):
+                bstart = nb * p // nparts
+                bend = nb * (p + 1) // nparts
+                _bin_profile_range(&bins[0], &ws[0], &bs[0,0], nf,
+                                   bstart, bend,
+                                   &pw[p * nbins], &pb[p * nbins * nf],
+                                   &pm[p * nbins * nf], &pq[p * nbins * nf],
+                                   &pu[p * nbins])
+            for p in prange(nparts, schedule='static',
+                            num_threads=nparts):
+                bstart = nbins * p // nparts
+                bend = nbins * (p + 1) // nparts
+                _merge_profile_bins(nbins, nf, nparts,
+                                    &pw[0], &pb[0], &pm[0], &pq[0],
+                                    bstart, bend,
+                                    &wr[0], &br[0], &mr[0], &qr[0], &ur[0])
+    # Copy back into any result arrays that could not be binned in place.
+    for result, flat in ((wresult, wr), (bresult, br), (mresult, mr),
+                         (qresult, qr), (used, ur)):
+        if not np.may_share_memory(result, flat):
+            result[...] = flat.reshape(result.shape)
+
+def new_bin_profile1d(np.ndarray[np.intp_t, ndim=1] bins_x,
+                  np.ndarray[np.float64_t, ndim=1] wsource,
+                  np.ndarray[np.float64_t, ndim=2] bsource,
+                  np.ndarray[np.float64_t, ndim=1] wresult,
+                  np.ndarray[np.float64_t, ndim=2] bresult,
+                  np.ndarray[np.float64_t, ndim=2] mresult,
+                  np.ndarray[np.float64_t, ndim=2] qresult,
+                  np.ndarray[np.uint8_t, ndim=1, cast=True] used,
+                  int num_threads = 1):
+    _bin_profile(bins_x, wsource, bsource, wresult, bresult,
+                 mresult, qresult, used, num_threads)
+
 def new_bin_profile2d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.intp_t, ndim=1] bins_y,
                   np.ndarray[np.float64_t, ndim=1] wsource,
@@ -85,35 +207,13 @@ def new_bin_profile2d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.float64_t, ndim=3] bresult,
                   np.ndarray[np.float64_t, ndim=3] mresult,
                   np.ndarray[np.float64_t, ndim=3] qresult,
-                  np.ndarray[np.uint8_t, ndim=2, cast=True] used):
-    cdef int n, fi, bin_x, bin_y
-    cdef np.float64_t wval, bval, oldwr, bval_mresult
-    cdef int nb = bins_x.shape[0]
-    cdef int nf = bsource.shape[1]
-    for n in range(nb):
-        bin_x = bins_x[n]
-        bin_y = bins_y[n]
-        wval = wsource[n]
-        # Skip field value entries where the weight field is zero
-        if wval == 0:
-            continue
-        oldwr = wresult[bin_x, bin_y]
-        wresult[bin_x,bin_y] += wval
-        for fi in range(nf):
-            bval = bsource[n,fi]
-            bval_mresult = bval - mresult[bin_x,bin_y,fi]
-            # qresult has to have the previous wresult
-            qresult[bin_x,bin_y,fi] += oldwr * wval * bval_mresult * bval_mresult / \
-                (oldwr + wval)
-            bresult[bin_x,bin_y,fi] += wval*bval
-            # mresult needs the new wresult
-            mresult[bin_x,bin_y,fi] += wval * bval_mresult / wresult[bin_x,bin_y]
-        used[bin_x,bin_y] = 1
-    return
+                  np.ndarray[np.uint8_t, ndim=2, cast=True] used,
+                  int num_threads = 1):
+    cdef np.ndarray[np.intp_t, ndim=1] bins = \
+        bins_x * wresult.shape[1] + bins_y
+    _bin_profile(bins, wsource, bsource, wresult, bresult,
+                 mresult, qresult, used, num_threads)
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-@cython.cdivision(True)
 def new_bin_profile3d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.intp_t, ndim=1] bins_y,
                   np.ndarray[np.intp_t, ndim=1] bins_z,
@@ -123,34 +223,12 @@ def new_bin_profile3d(np.ndarray[np.intp_t, ndim=1] bins_x,
                   np.ndarray[np.float64_t, ndim=4] bresult,
                   np.ndarray[np.float64_t, ndim=4] mresult,
                   np.ndarray[np.float64_t, ndim=4] qresult,
-                  np.ndarray[np.uint8_t, ndim=3, cast=True] used):
-    cdef int n, fi, bin_x, bin_y, bin_z
-    cdef np.float64_t wval, bval, oldwr, bval_mresult
-    cdef int nb = bins_x.shape[0]
-    cdef int nf = bsource.shape[1]
-    for n in range(nb):
-        bin_x = bins_x[n]
-        bin_y = bins_y[n]
-        bin_z = bins_z[n]
-        wval = wsource[n]
-        # Skip field value entries where the weight field is zero
-        if wval == 0:
-            continue
-        oldwr = wresult[bin_x, bin_y, bin_z]
-        wresult[bin_x,bin_y,bin_z] += wval
-        for fi in range(nf):
-            bval = bsource[n,fi]
-            bval_mresult = bval - mresult[bin_x,bin_y,bin_z,fi]
-            # qresult has to have the previous wresult
-            qresult[bin_x,bin_y,bin_z,fi] += \
-                oldwr * wval * bval_mresult * bval_mresult / \
-                (oldwr + wval)
-            bresult[bin_x,bin_y,bin_z,fi] += wval*bval
-            # mresult needs the new wresult
-            mresult[bin_x,bin_y,bin_z,fi] += wval * bval_mresult / \
-                 wresult[bin_x,bin_y,bin_z]
-        used[bin_x,bin_y,bin_z] = 1
-    return
+                  np.ndarray[np.uint8_t, ndim=3, cast=True] used,
+                  int num_threads = 1):
+    cdef np.ndarray[np.intp_t, ndim=1] bins = \
+        (bins_x * wresult.shape[1] + bins_y) * wresult.shape[2] + bins_z
+    _bin_profile(bins, wsource, bsource, wresult, bresult,
+                 mresult, qresult, used, num_threads)
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -0,0 +1,72 @@
+"""
+Tests for the file handler utilities
+
+
+
+"""
+
+#-----------------------------------------------------------------------------
+# Copyright (c) 2019, yt Development Team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+#-----------------------------------------------------------------------------
+
+import numpy as np
+import os
+import shutil
+import tempfile
+
+from yt.extern.six import b
+from yt.testing import \
+    assert_equal, \
+    assert_raises, \
+    requires_module
+from yt.utilities.file_handler import \
+    HDF5FileHandlePool
+from yt.utilities.on_demand_imports import _h5py as h5py
+
+
+@requires_module("h5py")
+def test_hdf5_file_handle_pool():
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fns = []
+        for i in range(3):
+            fn = os.path.join(tmpdir, "file%s.h5" % i)
+            with h5py.File(fn, "w") as f:
+                f.create_dataset("data", data=np.arange(10.0) + i)
+            fns.append(fn)
+
+        assert_raises(ValueError, HDF5FileHandlePool, 0)
+        pool = HDF5FileHandlePool(2)
+        fid0 = pool.get(fns[0])
+        assert pool.get(fns[0]) is fid0
+        pool.get(fns[1])
+        assert_equal((pool.hits, pool.misses), (1, 2))
+        assert_equal(len(pool), 2)
+
+        # Opening a third file evicts the least recently used one, but a
+        # file id that is still referenced remains usable.
+        pool.get(fns[2])
+        assert fns[0] not in pool
+        assert fns[1] in pool and fns[2] in pool
+        data = np.empty(10, dtype="float64")
+        dg = h5py.h5d.open(fid0, b("data"))
+        dg.read(h5py.h5s.ALL, h5py.h5s.ALL, data)
+        assert_equal(data, np.arange(10.0))
+
+        # Getting a file refreshes its position in the pool.
+        pool.get(fns[1])
+        pool.get(fns[0])
+        assert fns[2] not in pool
+        assert_equal((pool.hits, pool.misses), (2, 4))
+
+        pool.release(fns[0])
+        assert_equal(len(pool), 1)
+        pool.clear()
+        assert_equal(len(pool), 0)
+        assert_equal((pool.hits, pool.misses), (0, 0))
+    finally:
+        shutil.rmtree(tmpdir)